@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 性能基准测试
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import contextlib
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.pagination import (estimate_text_height, is_paragraph_boundary, greedy_page_breaks,
+                             optimal_page_breaks, total_badness)
+from core.article_parser import Article
+from core.clock import MonotonicClock, VirtualClock
+from core.reading_controller import ENGINE_MODES, MAX_READING_SPEED, READING_MODES, TIMED_MODES, ReadingController
+from core.fade_model import SMOOTH_FADE_LEVELS
+from core.segmenter import GRANULARITIES
+
+
+def generate_lines(line_count: int, seed: int = 2025) -> list:
+    """生成模拟文章行：缩进段落、续行、短句和空行混合"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(line_count):
+        kind = rng.random()
+        if kind < 0.05:
+            lines.append("")
+        elif kind < 0.65:
+            lines.append("    " + "字" * rng.randint(8, 160))
+        else:
+            lines.append("字" * rng.randint(4, 60))
+    return lines
+
+
+def bench_pagination(args):
+    """分页基准：比较贪心分页与最优分页的耗时、页数和总劣度"""
+    lines = generate_lines(args.lines)
+    line_height = args.font_size * args.line_spacing
+    usable_height = args.height - 120
+
+    start = time.perf_counter()
+    heights = [estimate_text_height(line, line_height, args.max_line_length,
+                                    args.font_size, args.line_spacing) for line in lines]
+    boundaries = [is_paragraph_boundary(lines, i) for i in range(len(lines))]
+    measure_time = time.perf_counter() - start
+    print(f"文档: {len(lines)} 行, 可用高度 {usable_height}px, 行高 {line_height:.1f}px")
+    print(f"高度估算: {measure_time * 1000:.1f} ms")
+
+    greedy_pages = None
+    for name, page_breaks in (('greedy', greedy_page_breaks), ('optimal', optimal_page_breaks)):
+        start = time.perf_counter()
+        page_sizes = page_breaks(heights, boundaries, usable_height)
+        elapsed = time.perf_counter() - start
+        badness = total_badness(page_sizes, heights, boundaries, usable_height)
+        if greedy_pages is None:
+            greedy_pages = len(page_sizes)
+        change = (len(page_sizes) - greedy_pages) / greedy_pages * 100 if greedy_pages else 0.0
+        print(f"{name:>8}: {elapsed * 1000:8.1f} ms, {len(page_sizes)} 页 (相对贪心 {change:+.1f}%), 总劣度 {badness:.0f}")
+
+
+def generate_article(char_count: int, seed: int = 2025) -> Article:
+    """生成约含指定字符数的模拟文章"""
+    lines = []
+    total = 0
+    for line in generate_lines(char_count, seed):
+        if total >= char_count:
+            break
+        lines.append(line)
+        total += len(line)
+    content = '\n'.join(lines)
+    return Article(title="基准文章", author="", date="", type="", content=content,
+                   original_content=content, filepath="")
+
+
+def bench_engine(args):
+    """阅读引擎基准：用虚拟时钟无界面跑完整个会话，统计真实耗时和帧数"""
+    article = generate_article(args.chars)
+    print(f"文章: {len(article.original_content)} 字符, 速度 {args.speed} 字/分钟, 渐隐单位 {args.granularity}")
+
+    for mode in args.modes:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):  # 屏蔽调试输出
+            controller = ReadingController()
+            controller.set_mode(mode)
+            controller.set_article(article)
+            controller.set_high_speed_mode(args.speed > MAX_READING_SPEED)
+            controller.set_reading_speed(args.speed)
+            controller.set_granularity(args.granularity)
+            controller.set_display_suspended(args.hidden)
+            state_changes = [0, None, 0]  # 渐隐色带和导读光标（需要重绘正文）变化的次数、上一次的色带、移动的标签数
+
+            def on_update(controller=controller, state_changes=state_changes):
+                snapshot = controller.snapshot
+                bands = snapshot.fade_bands + ((*snapshot.pacer_band, 'pacer'),) if snapshot.pacer_band else snapshot.fade_bands
+                if bands != state_changes[1]:
+                    previous = {state: (start, end) for start, end, state in state_changes[1] or ()}
+                    current = {state: (start, end) for start, end, state in bands}
+                    state_changes[0] += 1
+                    state_changes[2] += sum(previous.get(state) != current.get(state)
+                                            for state in previous.keys() | current.keys())
+                    state_changes[1] = bands
+            controller.set_update_callback(on_update)
+
+            start = time.perf_counter()
+            stats = controller.run_headless(MonotonicClock() if args.realtime else VirtualClock())
+            elapsed = time.perf_counter() - start
+        # 逐行模式的计划时长即时间轴总长，实际时长与之相等说明平均速度没有损失
+        planned = controller.timeline.total_time if mode in TIMED_MODES else controller.timeline.page_time_prefix[-1]
+        print(f"{mode:>5}: 真实 {elapsed * 1000:8.1f} ms, 会话 {stats.elapsed:7.1f} 秒 (计划 {planned:7.1f} 秒), "
+              f"帧 {stats.frames}, 丢帧 {stats.dropped_frames}, 隐藏 {stats.hidden_frames}, "
+              f"快照 {stats.snapshots}, 回调 {stats.callbacks}, "
+              f"正文色带变化 {state_changes[0]} (移动标签 {state_changes[2]}, 渐隐级别 {controller.fading_levels}), "
+              f"完成 {controller.reading_finished}")
+
+    if args.concurrent_settings:
+        for mode in args.modes:
+            check_concurrent_settings(article, mode, args.concurrent_settings, args.speed)
+
+
+def check_concurrent_settings(article: Article, mode: str, rounds: int, speed: int):
+    """并发设置检查：阅读线程运行时从另一个线程反复修改设置，所有设置都应经命令队列由阅读线程执行
+
+    阅读线程暂停时每条命令都会唤醒它执行，恢复后用虚拟时钟跑完会话；
+    停止后控制器状态应与最后一次请求的设置一致，跨越计时/按页的模式切换在停止时生效。
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):  # 屏蔽调试输出
+        controller = ReadingController()
+        controller.clock = VirtualClock()
+        controller.set_mode(mode)
+        controller.set_article(article)
+        controller.set_reading_speed(speed)
+        controller.start_reading()
+        controller.pause_reading()
+
+        start = time.perf_counter()
+        expected = {}
+        for i in range(rounds):
+            expected = {
+                'reading_speed': 200 + (i % 5) * 50,
+                'granularity': GRANULARITIES[i % len(GRANULARITIES)],
+                'line_turn_pause': 0.1 * (i % 4),
+                'page_turn_pause': 0.1 * (i % 3),
+                'mode': READING_MODES[i % len(READING_MODES)],
+                'engine_mode': ENGINE_MODES[i % len(ENGINE_MODES)],
+            }
+            controller.set_reading_speed(expected['reading_speed'])
+            controller.set_granularity(expected['granularity'])
+            controller.set_turn_pauses(expected['line_turn_pause'], expected['page_turn_pause'])
+            controller.set_mode(expected['mode'])
+            controller.set_engine_mode(expected['engine_mode'])
+        controller.pause_reading()
+        if controller.reading_thread:
+            controller.reading_thread.join(timeout=10.0)
+        controller.stop_reading()
+        elapsed = time.perf_counter() - start
+    mismatched = [name for name, value in expected.items() if getattr(controller, name) != value]
+    print(f"{mode:>5}: 并发设置 {rounds} 轮, 真实 {elapsed * 1000:8.1f} ms, "
+          f"完成 {controller.reading_finished}, 不一致 {mismatched or '无'}")
+
+
+def collect_frames(args) -> list:
+    """用虚拟时钟无界面跑一次会话，收集前若干帧需要渲染的页面内容"""
+    article = generate_article(args.chars)
+    frames = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):  # 屏蔽调试输出
+        controller = ReadingController()
+        controller.set_mode(args.mode)
+        controller.set_article(article)
+        controller.set_reading_speed(args.speed)
+        controller.set_granularity(args.granularity)
+
+        def on_update(controller=controller):
+            snapshot = controller.snapshot
+            if len(frames) < args.frames:
+                frames.append((snapshot.text, snapshot.fade_bands, snapshot.pacer_band))
+            elif controller.is_reading:
+                controller.stop_reading()
+        controller.set_update_callback(on_update)
+        controller.run_headless(VirtualClock())
+    return frames
+
+
+def bench_render(args):
+    """正文渲染基准：同一组帧分别用各渲染器渲染，比较主线程每帧耗时（需要图形界面）"""
+    import tkinter as tk
+    from gui.canvas_renderer import CanvasTextRenderer
+    from gui.image_renderer import ImagePageRenderer
+    from gui.fade_renderer import GradientTextRenderer
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"无法创建窗口（需要图形界面）: {e}")
+        return
+    root.geometry(f"{args.width}x{args.height}")
+    frames = collect_frames(args)
+    print(f"帧: {len(frames)}, 模式 {args.mode}, 字号 {args.font_size}, 窗口 {args.width}x{args.height}")
+    next_texts = [None] * len(frames)  # 每帧之后出现的下一页文本
+    upcoming = None
+    for k in range(len(frames) - 1, -1, -1):
+        next_texts[k] = upcoming if upcoming != frames[k][0] else next_texts[k + 1]
+        if k == 0 or frames[k - 1][0] != frames[k][0]:
+            upcoming = frames[k][0]
+
+    for name in args.renderers:
+        container = tk.Frame(root)
+        container.pack(fill='both', expand=True)
+        text_widget = tk.Text(container, wrap='word', font=('Microsoft YaHei', args.font_size),
+                              fg='black', bg='white', relief='flat', borderwidth=0)
+        text_widget.tag_configure('content', spacing1=10, spacing3=10, spacing2=int(args.line_spacing * 10))
+        text_widget.pack(fill='both', expand=True)
+        if name in ('canvas', 'image'):
+            renderer_class = CanvasTextRenderer if name == 'canvas' else ImagePageRenderer
+            renderer = renderer_class(tk.Canvas(container, highlightthickness=0), text_widget, SMOOTH_FADE_LEVELS)
+        else:
+            # text-unbatched 逐条调用Tcl命令，用于与合并为一段脚本的text对比
+            renderer = GradientTextRenderer(text_widget, SMOOTH_FADE_LEVELS, batched=(name == 'text'))
+        renderer.configure_font('Microsoft YaHei', args.font_size, args.line_spacing)
+        root.update()
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            renderer.configure_palette('black', 'white', SMOOTH_FADE_LEVELS)
+            renderer.configure_pacer('#FFE08A')
+            durations = []
+            turn_durations = []  # 翻页帧（页面文本变化）的耗时
+            shown_text = None
+            for k, (text, bands, pacer_band) in enumerate(frames):
+                start = time.perf_counter()
+                renderer.show(text, bands, pacer_band)
+                root.update_idletasks()  # 包含重新排版和重绘
+                duration = time.perf_counter() - start
+                if name == 'image' and renderer.wait_composed():
+                    # 后台合成的时间不计入；再次show把合成好的一帧写入PhotoImage，这部分在主线程执行
+                    start = time.perf_counter()
+                    renderer.show(text, bands, pacer_band)
+                    root.update_idletasks()
+                    duration += time.perf_counter() - start
+                durations.append(duration)
+                if text != shown_text:
+                    if shown_text is not None:
+                        turn_durations.append(duration)
+                    shown_text = text
+                    if not args.no_prefetch and next_texts[k]:
+                        renderer.prefetch(next_texts[k])  # 与阅读窗口一样，显示新页后预备下一页
+                        root.update_idletasks()
+        renderer.close()
+        container.destroy()
+
+        if not durations:
+            continue
+        durations.sort()
+        mean = sum(durations) / len(durations)
+        p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+        turn = f", 翻页最慢 {max(turn_durations) * 1000:6.2f} ms" if turn_durations else ""
+        print(f"{name:>14}: 平均 {mean * 1000:6.2f} ms/帧, P95 {p95 * 1000:6.2f} ms, "
+              f"最慢 {durations[-1] * 1000:6.2f} ms{turn}")
+    root.destroy()
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="锐读性能基准测试")
+    subparsers = parser.add_subparsers(dest='command')
+
+    pagination_parser = subparsers.add_parser('pagination', help="分页算法基准")
+    pagination_parser.add_argument('--lines', type=int, default=100000, help="文档行数")
+    pagination_parser.add_argument('--height', type=int, default=800, help="可用显示高度（像素）")
+    pagination_parser.add_argument('--font-size', type=int, default=45, help="字体大小")
+    pagination_parser.add_argument('--line-spacing', type=float, default=1.5, help="行间距")
+    pagination_parser.add_argument('--max-line-length', type=int, default=40, help="每行最大字符数")
+    pagination_parser.set_defaults(func=bench_pagination)
+
+    engine_parser = subparsers.add_parser('engine', help="无界面阅读引擎基准（虚拟时钟）")
+    engine_parser.add_argument('--chars', type=int, default=5000, help="文章字符数")
+    engine_parser.add_argument('--speed', type=int, default=300, help="阅读速度（字符/分钟）")
+    engine_parser.add_argument('--granularity', default='char', choices=GRANULARITIES, help="逐行模式的渐隐单位")
+    engine_parser.add_argument('--realtime', action='store_true', help="按真实时间运行（用于测量丢帧）")
+    engine_parser.add_argument('--hidden', action='store_true', help="模拟窗口不可见：只推进时间模型，不生成快照")
+    engine_parser.add_argument('--modes', nargs='+', default=['line', 'page'], choices=READING_MODES,
+                               help="阅读模式")
+    engine_parser.add_argument('--concurrent-settings', type=int, default=0, metavar='ROUNDS',
+                               help="另起检查：阅读线程运行时从基准线程修改速度、渐隐单位、停顿、模式和驱动方式的轮数")
+    engine_parser.set_defaults(func=bench_engine)
+
+    render_parser = subparsers.add_parser('render', help="正文渲染器基准：Text控件、画布与图像对比（需要图形界面）")
+    render_parser.add_argument('--chars', type=int, default=5000, help="文章字符数")
+    render_parser.add_argument('--frames', type=int, default=600, help="渲染的帧数")
+    render_parser.add_argument('--speed', type=int, default=300, help="阅读速度（字符/分钟）")
+    render_parser.add_argument('--mode', default='line', choices=READING_MODES, help="阅读模式")
+    render_parser.add_argument('--granularity', default='char', choices=GRANULARITIES, help="逐行模式的渐隐单位")
+    render_parser.add_argument('--font-size', type=int, default=60, help="字体大小")
+    render_parser.add_argument('--line-spacing', type=float, default=1.5, help="行间距")
+    render_parser.add_argument('--width', type=int, default=1200, help="窗口宽度")
+    render_parser.add_argument('--height', type=int, default=800, help="窗口高度")
+    render_parser.add_argument('--no-prefetch', action='store_true', help="不预备下一页（对比翻页耗时）")
+    render_parser.add_argument('--renderers', nargs='+', default=['text-unbatched', 'text', 'canvas', 'image'],
+                               choices=['text-unbatched', 'text', 'canvas', 'image'],
+                               help="参与对比的渲染器（image只计主线程耗时，含把合成结果写入PhotoImage）")
+    render_parser.set_defaults(func=bench_render)
+
+    args = parser.parse_args()
+    if not hasattr(args, 'func'):
+        parser.print_help()
+        return
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,10 @@ Reading Training - Apache License 2.0
 """
 import os
 import re
-from typing import List, Dict, Optional
+import unicodedata
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -31,6 +34,139 @@ class Article:
     filepath: str
     questions: Optional[List[Question]] = None  # 添加问题列表
 
+# 断行机会分类（参考UAX #14，针对中英文混排做了简化）
+STRONG_BREAK_MARKS = '。！？；'  # 强断点：句末标点之后
+WEAK_BREAK_MARKS = '，、：'  # 弱断点：逗号等标点之后
+LATIN_STRONG_MARKS = '.!?;'  # 英文句末标点，后跟空白时才是断点
+LATIN_WEAK_MARKS = ',:'  # 英文逗号等，后跟空白时才是断点
+# 不能出现在行首的字符（UAX #14 的 CL/CP/QU/NS/EX/IS 类中常见的中文标点）
+NO_LINE_START = '。，、；：！？）》〉」』】〕”’…—·%,.!?;:)]}'
+# 不能出现在行尾的字符（UAX #14 的 OP 类）
+NO_LINE_END = '（《〈「『【〔“‘([{'
+
+
+def is_ideographic(char: str) -> bool:
+    """是否为可在任意两字之间断行的中日韩字符（UAX #14 的 ID 类）"""
+    code = ord(char)
+    return (0x2E80 <= code <= 0x9FFF or 0xAC00 <= code <= 0xD7AF or
+            0xF900 <= code <= 0xFAFF or 0xFF00 <= code <= 0xFFEF or
+            0x20000 <= code <= 0x2FFFF) and unicodedata.category(char).startswith('L')
+
+
+@dataclass(frozen=True)
+class BreakIndex:
+    """段落的断行机会索引，各列表为升序的断点位置（断点之前的字符数）"""
+    length: int
+    strong: Tuple[int, ...]
+    weak: Tuple[int, ...]
+    space: Tuple[int, ...]
+    ideographic: Tuple[int, ...]
+
+    def find_break(self, start: int, max_length: int) -> int:
+        """二分查找从start开始、不超过max_length个字符的最佳断点，找不到返回-1"""
+        limit = start + max_length
+        # 与原逐字回扫保持一致：优先级断点只在后半行内查找
+        lower = start + max_length // 2 + 2
+        for positions in (self.strong, self.weak, self.space):
+            k = bisect_right(positions, limit) - 1
+            if k >= 0 and positions[k] >= lower:
+                return positions[k]
+        # 最后退到中日韩字符之间的断点，避免拆开英文单词或把标点挤到行首
+        k = bisect_right(self.ideographic, limit) - 1
+        if k >= 0 and self.ideographic[k] > start:
+            return self.ideographic[k]
+        return -1
+
+
+@lru_cache(maxsize=4096)
+def build_break_index(text: str) -> BreakIndex:
+    """扫描一次段落，建立强/弱/空格/表意字符四类断行机会索引"""
+    strong = []
+    weak = []
+    space = []
+    ideographic = []
+    length = len(text)
+
+    def after_closing(position: int) -> int:
+        # 断点后移越过紧随的右引号、右括号等，避免它们出现在下一行行首
+        while position < length and text[position] in NO_LINE_START:
+            position += 1
+        return position
+
+    for i, char in enumerate(text):
+        next_char = text[i + 1] if i + 1 < length else ''
+        if char in STRONG_BREAK_MARKS:
+            strong.append(after_closing(i + 1))
+        elif char in WEAK_BREAK_MARKS:
+            weak.append(after_closing(i + 1))
+        elif char in LATIN_STRONG_MARKS and next_char.isspace():
+            strong.append(i + 1)
+        elif char in LATIN_WEAK_MARKS and next_char.isspace():
+            weak.append(i + 1)
+        elif char == ' ':
+            space.append(i + 1)
+
+        # 两个字符之间至少一个是中日韩字符，且不违反行首/行尾禁则时可以断行
+        if (next_char and (is_ideographic(char) or is_ideographic(next_char)) and
+                not next_char.isspace() and not char.isspace() and
+                next_char not in NO_LINE_START and char not in NO_LINE_END):
+            ideographic.append(i + 1)
+
+    # 越过右标点后的断点可能重复，去重并保持升序
+    return BreakIndex(
+        length=length,
+        strong=tuple(sorted(set(strong))),
+        weak=tuple(sorted(set(weak))),
+        space=tuple(space),
+        ideographic=tuple(ideographic),
+    )
+
+
+@lru_cache(maxsize=8192)
+def reflow_paragraph(paragraph: str, max_length: int, original_indent: str = "") -> Tuple[str, ...]:
+    """按行宽把段落切成多行，断点通过段落的断行机会索引二分查找，结果按宽度缓存"""
+    if len(original_indent + paragraph) <= max_length:
+        return (original_indent + paragraph,)
+
+    index = build_break_index(paragraph)
+    result = []
+
+    # 计算后续行的缩进（通常比首行缩进少一些或相同）
+    continuation_indent = "    "  # 后续行使用4个空格缩进
+
+    # 可用长度：第一行扣除原始缩进，后续行扣除继续缩进
+    max_chars = max_length - len(original_indent)
+    line_indent = original_indent
+    start = 0
+    length = len(paragraph)
+
+    while start < length:
+        if length - start <= max_chars:
+            # 剩余文本可以放在一行内
+            result.append(line_indent + paragraph[start:])
+            break
+
+        # 寻找合适的断点，找不到时强制在最大长度处断开
+        break_point = index.find_break(start, max_chars)
+        if break_point == -1:
+            break_point = start + max_chars
+
+        # 添加当前行（避免空行）
+        line_text = paragraph[start:break_point].rstrip()
+        if line_text:
+            result.append(line_indent + line_text)
+
+        # 准备下一行：跳过断点处的空白
+        start = break_point
+        while start < length and paragraph[start].isspace():
+            start += 1
+
+        max_chars = max_length - len(continuation_indent)
+        line_indent = continuation_indent
+
+    return tuple(result)
+
+
 class ArticleParser:
     def __init__(self):
         self.articles: List[Article] = []
@@ -215,78 +351,15 @@ class ArticleParser:
 
     def _split_paragraph_into_lines(self, paragraph: str, max_length: int, original_indent: str = "") -> list:
         """将单个段落分割成多行，保持语义完整性和缩进"""
-        if len(original_indent + paragraph) <= max_length:
-            return [original_indent + paragraph]
-        
-        result = []
-        
-        # 计算后续行的缩进（通常比首行缩进少一些或相同）
-        continuation_indent = "    "  # 后续行使用4个空格缩进
-        
-        # 可用长度：第一行扣除原始缩进，后续行扣除继续缩进
-        first_line_max = max_length - len(original_indent)
-        continuation_max = max_length - len(continuation_indent)
-        
-        current_text = paragraph
-        is_first_line = True
-        
-        while current_text:
-            if is_first_line:
-                max_chars = first_line_max
-                line_indent = original_indent
-                is_first_line = False
-            else:
-                max_chars = continuation_max
-                line_indent = continuation_indent
-            
-            if len(current_text) <= max_chars:
-                # 剩余文本可以放在一行内
-                result.append(line_indent + current_text)
-                break
-            
-            # 寻找合适的断点
-            break_point = self._find_break_point(current_text, max_chars)
-            
-            if break_point == -1:
-                # 找不到合适断点，强制在最大长度处断开
-                break_point = max_chars
-            
-            # 添加当前行
-            line_text = current_text[:break_point].rstrip()
-            if line_text:  # 避免空行
-                result.append(line_indent + line_text)
-            
-            # 准备下一行的文本
-            current_text = current_text[break_point:].lstrip()
-        
-        return result
+        return list(reflow_paragraph(paragraph, max_length, original_indent))
     
     def _find_break_point(self, text: str, max_length: int) -> int:
         """在指定长度内找到最佳的断点位置"""
         if len(text) <= max_length:
             return len(text)
         
-        # 按优先级寻找断点：句号 > 逗号等标点 > 空格
-        punctuation_marks = ['。', '！', '？', '；']
-        comma_marks = ['，', '、', '：']
-        
-        # 首先在句号等强断点处查找
-        for i in range(max_length - 1, max_length // 2, -1):
-            if i < len(text) and text[i] in punctuation_marks:
-                return i + 1
-        
-        # 然后在逗号等弱断点处查找  
-        for i in range(max_length - 1, max_length // 2, -1):
-            if i < len(text) and text[i] in comma_marks:
-                return i + 1
-        
-        # 最后在空格处查找
-        for i in range(max_length - 1, max_length // 2, -1):
-            if i < len(text) and text[i] == ' ':
-                return i + 1
-        
-        # 找不到合适断点
-        return -1
+        # 按优先级寻找断点：句号 > 逗号等标点 > 空格 > 中日韩字符之间
+        return build_break_index(text).find_break(0, max_length)
 
     def _split_long_line(self, line: str, max_length: int = 40) -> list:
         """将长行分割成多行，保持语义完整性（保留兼容性）"""
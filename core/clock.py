@@ -0,0 +1,73 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 阅读时钟
+"""
+import queue
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+class MonotonicClock:
+    """真实时钟：读数来自单调时钟，等待命令时真正阻塞"""
+
+    def now(self) -> float:
+        """当前时钟读数（秒）"""
+        return time.monotonic()
+
+    def wait(self, commands: queue.SimpleQueue, timeout: Optional[float] = None):
+        """等待一条命令，超时返回None；timeout为None时一直阻塞"""
+        try:
+            return commands.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class VirtualClock:
+    """虚拟时钟：等待不消耗真实时间，超时等待直接把读数向前拨
+
+    用于无界面运行阅读引擎：整篇文章可以在几毫秒内"读"完，
+    回调、状态变化和计时统计与真实会话一致。
+    没有超时的等待（暂停）仍然阻塞，直到收到命令。
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.current_time = start
+
+    def now(self) -> float:
+        """当前时钟读数（秒）"""
+        return self.current_time
+
+    def advance(self, seconds: float):
+        """把时钟向前拨动指定秒数"""
+        self.current_time += max(0.0, seconds)
+
+    def wait(self, commands: queue.SimpleQueue, timeout: Optional[float] = None):
+        """有待处理命令时立即返回；否则超时等待只拨动时钟，不真正睡眠"""
+        try:
+            return commands.get_nowait()
+        except queue.Empty:
+            pass
+        if timeout is None:
+            return commands.get()
+        self.advance(timeout)
+        return None
+
+
+@dataclass
+class SessionStats:
+    """一次阅读会话的计时统计（时间均为会话时钟读数）"""
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    frames: int = 0  # 生成快照的次数
+    snapshots: int = 0  # 内容有变化、版本号递增的快照数
+    callbacks: int = 0  # 调用update_callback的次数
+    dropped_frames: int = 0  # 错过截止时间而跳过的帧数
+    hidden_frames: int = 0  # 窗口不可见、省略生成快照的帧数
+
+    @property
+    def elapsed(self) -> float:
+        """会话经过的时钟时间（秒）"""
+        return max(0.0, self.finished_at - self.started_at)
@@ -0,0 +1,312 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 渐隐时间模型
+"""
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+from core.article_parser import build_break_index
+from core.pagination import is_paragraph_boundary
+from core.segmenter import chunk_starts
+from core.timing import TimingTable, page_duration
+
+LINE_END_PAUSE = 0.2  # 行末停顿（秒）
+BLANK_LINE_PAUSE = 0.3  # 空行停顿（秒）
+PAGE_TURN_PAUSE = 0.5  # 逐行和导读光标模式换页后的停顿（秒），翻页只交换缓冲时可设为0
+PAGE_MODE_TURN_PAUSE = 0.3  # 按页模式的页间停顿（秒）
+SEEK_GRACE_CHARS = 2  # 向后跳转时，离单元开头不超过这么多字符就跳到上一个单元
+SMOOTH_FADE_LEVELS = 16  # 渐变色带的级别数：每级一个标签，重绘代价与级别数成正比
+PACER_WIDTH_CHARS = 4  # 逐字时导读光标覆盖的字符数（按单元渐隐时覆盖整个单元）
+
+
+def fade_state_names(fading_levels: int) -> List[str]:
+    """全部视觉状态，按从完全消失到正常的顺序排列（与阅读方向上的字符顺序一致）"""
+    if fading_levels <= 2:
+        return ['faded', 'fading_1', 'normal']
+    return ['faded'] + [f'fading_{level}' for level in range(fading_levels - 1, 0, -1)] + ['normal']
+
+
+def _fade_thresholds(fading_levels: int) -> List[float]:
+    """相邻两个状态之间的渐隐进度分界，与fade_state_names一一对应"""
+    if fading_levels <= 2:
+        return [1.0, 0.0]
+    return [1.0] + [level / fading_levels for level in range(fading_levels - 1, 0, -1)]
+
+
+def mix_color(start_rgb: Tuple[int, int, int], end_rgb: Tuple[int, int, int], ratio: float) -> str:
+    """两种颜色（0-255的RGB）按比例插值，返回 #rrggbb"""
+    r, g, b = (round(a + (b - a) * ratio) for a, b in zip(start_rgb, end_rgb))
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+def fade_palette(fading_levels: int, text_rgb: Tuple[int, int, int],
+                 background_rgb: Tuple[int, int, int]) -> Dict[str, str]:
+    """预先计算每个视觉状态的颜色：从文字颜色均匀过渡到背景颜色"""
+    names = fade_state_names(fading_levels)
+    steps = len(names) - 1
+    return {name: mix_color(background_rgb, text_rgb, i / steps) for i, name in enumerate(names)}
+
+
+class FadeTimeline:
+    """逐行模式的渐隐时间轴
+
+    每个字符的视觉状态只由会话的"虚拟阅读时间"和该字符的开始时间决定，
+    字符的开始时间由计时表的权重前缀和给出（句末标点后有停顿，空白不占时间），
+    因此暂停只需停止推进虚拟时间，定位只需修改虚拟时间，
+    重新分页只需按锚点换算虚拟时间，不再需要逐字符保存和恢复状态。
+    渐隐单位大于单字时，同一单元（词、短语或整行）的字符同时开始、同时完成渐隐。
+    时间轴同时给出按页模式各页的停留时间。构建后不再修改，可以在线程之间安全共享。
+    """
+
+    def __init__(self, pages: Sequence[Sequence[str]], char_duration: float, granularity: str = 'char',
+                 page_turn_pause: float = PAGE_TURN_PAUSE):
+        self.char_duration = char_duration
+        self.granularity = granularity
+        self.page_turn_pause = page_turn_pause
+        self.line_page: List[int] = []  # 全文行号 -> 页号
+        self.line_in_page: List[int] = []  # 全文行号 -> 页内行号
+        self.line_start: List[float] = []  # 行时间段的开始（含换页停顿）
+        self.text_start: List[float] = []  # 行首字符开始渐隐的时间
+        self.line_length: List[int] = []  # 参与渐隐的字符数（空行为0）
+        self.line_units: List[float] = []  # 行内字符的总时间权重（空行为0）
+        self.line_offset: List[int] = []  # 行首字符在全文中的绝对位置
+        self.line_chunks: List[Tuple[int, ...]] = []  # 各行渐隐单元的起始列（逐字时为空）
+        self.page_first_line: List[int] = []  # 页号 -> 首行的全文行号
+        self.page_durations: List[float] = []  # 按页模式各页的停留时间
+        self.paragraph_offsets: List[int] = []  # 各段落首字符的绝对位置（升序）
+        self.sentence_offsets: List[int] = []  # 各句首字符的绝对位置（升序）
+
+        all_lines = [line for page in pages for line in page]
+        self.timing = TimingTable('\n'.join(all_lines))
+        sentence_offsets = set()
+        current_time = 0.0
+        offset = 0
+        for page_idx, page in enumerate(pages):
+            self.page_first_line.append(len(self.line_start))
+            page_units = 0.0
+            for line_idx, line in enumerate(page):
+                self.line_page.append(page_idx)
+                self.line_in_page.append(line_idx)
+                self.line_start.append(current_time)
+                self.line_offset.append(offset)
+
+                # 段落和句子的起点：段首行，以及句末标点之后
+                global_line = len(self.line_offset) - 1
+                if line.strip() and (global_line == 0 or is_paragraph_boundary(all_lines, global_line - 1)):
+                    self.paragraph_offsets.append(offset)
+                    sentence_offsets.add(offset)
+                for position in build_break_index(line).strong:
+                    # 句末标点在行尾时，下一句从下一行开始
+                    sentence_offsets.add(offset + position if position < len(line) else offset + len(line) + 1)
+
+                # 换页后先停顿再开始渐隐
+                if page_idx > 0 and line_idx == 0:
+                    current_time += page_turn_pause
+                self.text_start.append(current_time)
+
+                if not line.strip():
+                    self.line_length.append(0)
+                    self.line_units.append(0.0)
+                    if granularity != 'char':
+                        self.line_chunks.append(())
+                    current_time += BLANK_LINE_PAUSE
+                else:
+                    units = self.timing.units(offset, offset + len(line))
+                    self.line_length.append(len(line))
+                    self.line_units.append(units)
+                    if granularity != 'char':
+                        self.line_chunks.append(chunk_starts(line, granularity))
+                    page_units += units
+                    current_time += units * char_duration + LINE_END_PAUSE
+                offset += len(line) + 1
+            self.page_durations.append(page_duration(page_units, char_duration))
+
+        self.page_count = len(pages)
+        self.total_time = current_time
+        self.text_length = offset  # 全文字符数（每行计入一个换行符）
+        self.sentence_offsets = sorted(o for o in sentence_offsets if o < offset)
+        self.page_time_prefix: List[float] = [0.0]  # 按页模式前 i 页的停留时间之和
+        self.page_time_prefix.extend(accumulate(self.page_durations))
+
+    def _chunk_bounds(self, line: int, col: int) -> Tuple[int, int]:
+        """第col个字符所在渐隐单元的 [起始列, 结束列)"""
+        if not self.line_chunks:
+            return col, col + 1
+        starts = self.line_chunks[line]
+        k = bisect_right(starts, col) - 1
+        return starts[k], starts[k + 1] if k + 1 < len(starts) else self.line_length[line]
+
+    def _char_start(self, line: int, col: int) -> float:
+        """行内第col个字符开始渐隐的时间（即所在单元开始渐隐的时间）"""
+        if self.line_chunks and col < self.line_length[line]:
+            col = self._chunk_bounds(line, col)[0]
+        offset = self.line_offset[line]
+        return self.text_start[line] + self.timing.units(offset, offset + col) * self.char_duration
+
+    def position_at(self, virtual_time: float) -> Tuple[int, int, int]:
+        """虚拟时间对应的阅读位置：(页, 页内行, 行内正在渐隐的字符列号)，读完后页号为总页数"""
+        if not self.line_start or virtual_time >= self.total_time:
+            return self.page_count, 0, 0
+
+        line = max(0, bisect_right(self.line_start, virtual_time) - 1)
+        offset = self.line_offset[line]
+        units = (virtual_time - self.text_start[line]) / self.char_duration + 1e-9  # 容忍浮点误差
+        if units < 0:
+            return self.line_page[line], self.line_in_page[line], 0
+        # 二分查找开始时间不晚于虚拟时间的最后一个字符
+        target = self.timing.prefix[offset] + units
+        chars_done = self.timing.index_at(target, offset, offset + self.line_length[line]) - offset
+        if self.line_chunks and chars_done < self.line_length[line]:
+            # 单元内的字符同时开始渐隐，光标落在当前单元的最后一个字符上
+            chars_done = self._chunk_bounds(line, chars_done)[1] - 1
+        return self.line_page[line], self.line_in_page[line], chars_done
+
+    def time_at(self, page_idx: int, line_in_page: int, chars_done: int) -> float:
+        """阅读位置对应的虚拟时间（该位置字符开始渐隐的时刻）"""
+        if page_idx >= self.page_count:
+            return self.total_time
+        line = self.page_first_line[page_idx] + line_in_page
+        if line >= len(self.line_start):
+            return self.total_time
+        if self.line_length[line] == 0 and line_in_page > 0:
+            return self.line_start[line]
+        return self._char_start(line, max(0, min(chars_done, self.line_length[line])))
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """绝对字符位置对应的（全文行号, 行内列号）"""
+        line = max(0, bisect_right(self.line_offset, offset) - 1)
+        return line, max(0, min(self.line_length[line], offset - self.line_offset[line]))
+
+    def offset_at(self, virtual_time: float) -> int:
+        """虚拟时间对应的绝对字符位置，读完后为全文字符数"""
+        page_idx, line_in_page, chars_done = self.position_at(virtual_time)
+        if page_idx >= self.page_count:
+            return self.text_length
+        return self.line_offset[self.page_first_line[page_idx] + line_in_page] + chars_done
+
+    def time_at_offset(self, offset: int) -> float:
+        """绝对字符位置对应的虚拟时间（该字符开始渐隐的时刻）"""
+        if not self.line_start or offset >= self.text_length:
+            return self.total_time
+        line, col = self.locate(offset)
+        return self.time_at(self.line_page[line], self.line_in_page[line], col)
+
+    def page_at_elapsed(self, elapsed: float) -> int:
+        """按页模式下累计停留时间对应的页号"""
+        page_idx = bisect_right(self.page_time_prefix, elapsed) - 1
+        return max(0, min(self.page_count - 1, page_idx))
+
+    def _fade_progress(self, offset: int, virtual_time: float) -> float:
+        """绝对位置上字符的渐隐进度；换行符取行尾时刻，使进度沿阅读方向单调不增"""
+        line = max(0, bisect_right(self.line_offset, offset) - 1)
+        col = offset - self.line_offset[line]
+        duration = self.char_duration
+        if col >= self.line_length[line]:
+            return (virtual_time - self._char_start(line, self.line_length[line])) / duration
+        if self.line_chunks:
+            start, end = self._chunk_bounds(line, col)
+            chunk_time = max(duration, self.timing.units(self.line_offset[line] + start,
+                                                          self.line_offset[line] + end) * duration)
+            return (virtual_time - self._char_start(line, start)) / chunk_time
+        return (virtual_time - self._char_start(line, col)) / duration
+
+    def fade_bands(self, page_idx: int, virtual_time: float, fading_levels: int) -> Tuple[Tuple[int, int, str], ...]:
+        """一页的渐隐色带：(页内起始位置, 页内结束位置, 状态)，按阅读顺序排列、互不重叠
+
+        渐隐进度沿阅读方向单调不增，每个状态恰好占一段连续区间，
+        区间边界用二分查找确定，代价只与渐隐级别数有关，与字符数无关。
+        """
+        if page_idx >= self.page_count:
+            return ()
+        first_line = self.page_first_line[page_idx]
+        last_line = (self.page_first_line[page_idx + 1] if page_idx + 1 < self.page_count
+                     else len(self.line_offset)) - 1
+        page_start = self.line_offset[first_line]
+        page_end = (self.line_offset[last_line + 1] if last_line + 1 < len(self.line_offset)
+                    else self.text_length) - 1  # 页末行不含换行符
+
+        bands = []
+        band_start = page_start
+        names = fade_state_names(fading_levels)
+        for name, threshold in zip(names, _fade_thresholds(fading_levels)):
+            # 第一个进度低于分界的位置
+            lo, hi = band_start, page_end
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._fade_progress(mid, virtual_time) >= threshold:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo > band_start:
+                bands.append((band_start - page_start, lo - page_start, name))
+            band_start = lo
+        if band_start < page_end:
+            bands.append((band_start - page_start, page_end - page_start, names[-1]))
+        return tuple(bands)
+
+    def pacer_band(self, page_idx: int, virtual_time: float, width: int) -> Tuple[int, ...]:
+        """导读光标在页内覆盖的区间 (起始位置, 结束位置)：从正在阅读的字符开始，不跨行
+
+        按单元渐隐时覆盖当前单元；行末停顿和空行期间不显示，返回空元组。
+        """
+        page, line_in_page, col = self.position_at(virtual_time)
+        if page != page_idx or page >= self.page_count:
+            return ()
+        first_line = self.page_first_line[page]
+        line = first_line + line_in_page
+        length = self.line_length[line]
+        if col >= length:
+            return ()
+        start, end = self._chunk_bounds(line, col) if self.line_chunks else (col, min(length, col + width))
+        base = self.line_offset[line] - self.line_offset[first_line]
+        return base + start, base + end
+
+    def anchor(self, virtual_time: float) -> Tuple[int, float, float, float]:
+        """把虚拟时间转换为与分页和速度无关的锚点：(全文行号, 换页停顿已过时间, 已读权重, 行末停顿已过时间)"""
+        if not self.line_start:
+            return 0, 0.0, 0.0, 0.0
+        if virtual_time >= self.total_time:
+            return len(self.line_start), 0.0, 0.0, 0.0
+
+        line = max(0, bisect_right(self.line_start, virtual_time) - 1)
+        lead = self.text_start[line] - self.line_start[line]
+        elapsed = virtual_time - self.line_start[line]
+        if elapsed < lead:
+            return line, elapsed, 0.0, 0.0
+
+        text_time = self.line_units[line] * self.char_duration
+        text_elapsed = elapsed - lead
+        if text_elapsed < text_time:
+            return line, lead, text_elapsed / self.char_duration, 0.0
+        return line, lead, self.line_units[line], text_elapsed - text_time
+
+    def time_at_anchor(self, anchor: Tuple[int, float, float, float]) -> float:
+        """锚点在本时间轴上对应的虚拟时间"""
+        line, lead_elapsed, units_read, pause_elapsed = anchor
+        if line >= len(self.line_start):
+            return self.total_time
+
+        if units_read == 0 and pause_elapsed == 0:
+            lead = self.text_start[line] - self.line_start[line]
+            return self.line_start[line] + min(lead_elapsed, lead)
+
+        segment_end = self.line_start[line + 1] if line + 1 < len(self.line_start) else self.total_time
+        units_read = min(units_read, self.line_units[line])
+        virtual_time = self.text_start[line] + units_read * self.char_duration + pause_elapsed
+        return min(virtual_time, segment_end)
+
+
+def step_offset(starts: Sequence[int], offset: int, delta: int) -> int:
+    """在升序的单元起点（段落或句子）中从offset移动delta个单元，返回目标单元的起点
+
+    向后移动时若已读过当前单元开头几个字符，第一步先回到当前单元开头。
+    """
+    if not starts:
+        return 0
+    k = bisect_right(starts, offset) - 1
+    if delta < 0 and k >= 0 and offset - starts[k] > SEEK_GRACE_CHARS:
+        delta += 1
+    k = max(0, min(len(starts) - 1, k + delta))
+    return starts[k]
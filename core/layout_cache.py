@@ -0,0 +1,189 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 分页缓存与后台预分页
+"""
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List, Optional
+from core.article_parser import Article
+from core.pagination import LayoutProfile, paginate_lines
+
+
+def _content_key(content: str) -> str:
+    """文章内容的哈希，内容变化后缓存自动失效"""
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def _paginate_content(content: str, profile: LayoutProfile) -> List[int]:
+    """后台进程中执行的分页任务"""
+    return paginate_lines(content.split('\n'), profile)
+
+
+class LayoutCache:
+    """持久化的分页缓存：(文章内容, 布局配置) -> 每页行数，并记录最近使用的布局配置"""
+
+    def __init__(self, cache_file: str = "layout_cache.json", max_entries: int = 2000, max_profiles: int = 3):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.max_profiles = max_profiles
+        self._entries: Dict[str, List[int]] = {}
+        self._recent_profiles: List[LayoutProfile] = []
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """从文件加载缓存，文件不存在或损坏时使用空缓存"""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self._entries = data.get('entries', {})
+                self._recent_profiles = [LayoutProfile(**profile) for profile in data.get('recent_profiles', [])]
+            print(f"[DEBUG] 加载分页缓存: {len(self._entries)} 条, {len(self._recent_profiles)} 个布局配置")
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[DEBUG] 加载分页缓存失败: {e}，使用空缓存")
+
+    def save(self):
+        """把缓存写回文件（无变化时跳过）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'entries': dict(self._entries),
+                'recent_profiles': [asdict(profile) for profile in self._recent_profiles],
+            }
+            self._dirty = False
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except OSError as e:
+            print(f"[DEBUG] 保存分页缓存失败: {e}")
+
+    @staticmethod
+    def _key(content: str, profile: LayoutProfile) -> str:
+        return f"{_content_key(content)}|{profile.key()}"
+
+    def get(self, content: str, profile: LayoutProfile) -> Optional[List[int]]:
+        """获取缓存的每页行数，未命中返回None"""
+        with self._lock:
+            page_sizes = self._entries.get(self._key(content, profile))
+        # 防御：缓存内容与当前文章行数不一致时视为未命中
+        if page_sizes is not None and sum(page_sizes) != content.count('\n') + 1:
+            return None
+        return page_sizes
+
+    def put(self, content: str, profile: LayoutProfile, page_sizes: List[int]):
+        """写入分页结果，超过容量时丢弃最早的条目"""
+        with self._lock:
+            self._entries[self._key(content, profile)] = list(page_sizes)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._dirty = True
+
+    def contains(self, content: str, profile: LayoutProfile) -> bool:
+        """是否已缓存"""
+        with self._lock:
+            return self._key(content, profile) in self._entries
+
+    def remember_profile(self, profile: LayoutProfile):
+        """记录最近使用的布局配置，供下次预分页使用"""
+        with self._lock:
+            if self._recent_profiles and self._recent_profiles[0] == profile:
+                return
+            if profile in self._recent_profiles:
+                self._recent_profiles.remove(profile)
+            self._recent_profiles.insert(0, profile)
+            del self._recent_profiles[self.max_profiles:]
+            self._dirty = True
+
+    def recent_profiles(self) -> List[LayoutProfile]:
+        """最近使用的布局配置（最新的在前）"""
+        with self._lock:
+            return list(self._recent_profiles)
+
+
+class LibraryPrepaginator:
+    """后台预分页：用进程池按最近使用的布局配置对整个文章库分页，结果写入分页缓存"""
+
+    def __init__(self, cache: LayoutCache, max_workers: Optional[int] = None):
+        self.cache = cache
+        self.max_workers = max_workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._futures = []
+        self._generation = 0  # 每次重新预分页递增，丢弃过期任务的结果
+
+    def start(self, articles: List[Article]):
+        """为文章库提交预分页任务，已缓存的组合会被跳过"""
+        profiles = self.cache.recent_profiles()
+        if not profiles or not articles:
+            print(f"[DEBUG] 预分页跳过：没有最近使用的布局配置或文章")
+            return
+
+        jobs = [(article.original_content, profile)
+                for profile in profiles for article in articles
+                if not self.cache.contains(article.original_content, profile)]
+        if not jobs:
+            print(f"[DEBUG] 预分页跳过：{len(articles)} 篇文章均已缓存")
+            return
+
+        with self._lock:
+            # 取消上一轮尚未开始的任务
+            for future in self._futures:
+                future.cancel()
+            self._futures = []
+            self._generation += 1
+            generation = self._generation
+            self._pending = len(jobs)
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            executor = self._executor
+
+        print(f"[DEBUG] 开始后台预分页: {len(articles)} 篇文章 x {len(profiles)} 个布局配置, 共 {len(jobs)} 个任务")
+        for content, profile in jobs:
+            future = executor.submit(_paginate_content, content, profile)
+            with self._lock:
+                self._futures.append(future)
+            future.add_done_callback(
+                lambda f, c=content, p=profile: self._on_job_done(f, c, p, generation))
+
+    def _on_job_done(self, future, content: str, profile: LayoutProfile, generation: int):
+        """任务完成回调（在执行器的管理线程中调用）"""
+        if generation != self._generation or future.cancelled():
+            return
+        try:
+            self.cache.put(content, profile, future.result())
+        except Exception as e:
+            print(f"[DEBUG] 预分页任务失败: {e}")
+
+        with self._lock:
+            self._pending -= 1
+            finished = self._pending == 0
+            if finished:
+                self._futures = []
+        if finished:
+            self.cache.save()
+            print(f"[DEBUG] 后台预分页完成，缓存已保存")
+
+    def shutdown(self):
+        """停止后台进程池，未开始的任务直接取消"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._generation += 1
+            for future in self._futures:
+                future.cancel()
+            self._futures = []
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.cache.save()
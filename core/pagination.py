@@ -0,0 +1,242 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 分页算法
+"""
+from dataclasses import dataclass
+from typing import List, Sequence
+
+# 分页方式：'greedy' 逐行贪心填充，'optimal' 全文动态规划求最小总劣度
+PAGE_BREAK_MODES = ('greedy', 'optimal')
+
+# 最优分页的劣度参数
+UNDERFILL_WEIGHT = 100.0  # 页面留白劣度系数（按留白比例的平方计）
+PAGE_PENALTY = 30.0  # 每多一页的固定代价（每次翻页都有停顿），只用于比较总劣度；最优分页总是先保证页数最少
+MID_PARAGRAPH_PENALTY = 60.0  # 在段落内部断页的代价
+ORPHAN_PENALTY = 150.0  # 段落首行单独留在页尾的代价
+WIDOW_PENALTY = 150.0  # 段落末行单独落到下一页页首的代价
+OVERFULL_PENALTY = 10000.0  # 单行超过整页高度时只能独占一页的代价
+
+# 预留的安全边距，应对测量误差和tag样式的影响，确保最后一行有足够空间
+SAFETY_MARGIN = 120
+
+
+@dataclass(frozen=True)
+class LayoutProfile:
+    """一次分页所需的全部布局输入（窗口尺寸、字体和分页方式）"""
+    available_height: int
+    font_size: int
+    line_spacing: float
+    max_line_length: int
+    line_height: float
+    page_break_mode: str = 'greedy'
+
+    @property
+    def usable_height(self) -> float:
+        """扣除安全边距后的可用高度"""
+        return max(100, self.available_height - SAFETY_MARGIN)
+
+    def key(self) -> str:
+        """用于缓存的字符串键"""
+        return (f"{self.available_height}|{self.font_size}|{self.line_spacing:g}|"
+                f"{self.max_line_length}|{self.line_height:.2f}|{self.page_break_mode}")
+
+
+def estimate_text_height(text: str, base_line_height: float, max_line_length: int,
+                         font_size: int, line_spacing: float) -> float:
+    """估算一行文本的渲染高度（含自动换行与段落间距）"""
+    if not text.strip():
+        # 空行或仅包含空白字符的行，使用较小的高度
+        return base_line_height * 0.3
+
+    # 检查是否是段落开始（有缩进）
+    is_paragraph_start = text.startswith("    ") or text.startswith("\t")
+
+    estimated_height = base_line_height
+
+    # 如果文本很长，可能会自动换行，需要更多高度
+    if len(text) > max_line_length:
+        # 估算可能的换行行数，并为实际换行不完全按字符数切分添加10%的安全系数
+        estimated_lines = (len(text) + max_line_length - 1) // max_line_length
+        estimated_height = base_line_height * estimated_lines * 1.1
+
+    # 段落开始需要考虑额外的段落间距：spacing1=10, spacing3=10, spacing2基于行间距
+    if is_paragraph_start:
+        estimated_height += 20 + (line_spacing - 1.0) * font_size * 0.5
+
+    return estimated_height
+
+
+def is_paragraph_boundary(lines: Sequence[str], line_index: int) -> bool:
+    """判断第line_index行之后是否为段落边界（适合分页的位置）"""
+    if line_index >= len(lines) - 1:
+        return False
+
+    current_line = lines[line_index]
+    next_line = lines[line_index + 1]
+
+    # 如果当前行是空行，且下一行不是空行，优先在此处分页
+    if not current_line.strip() and next_line.strip():
+        return True
+
+    # 如果下一行是段落开始（有缩进），优先在此处分页
+    if next_line.startswith("    ") or next_line.startswith("\t"):
+        return True
+
+    return False
+
+
+def greedy_page_breaks(heights: Sequence[float], boundaries: Sequence[bool],
+                       usable_height: float) -> List[int]:
+    """贪心分页：逐行填充，段落边界处使用率超过75%即断页
+
+    Returns:
+        每页包含的行数列表
+    """
+    page_sizes = []
+    current_count = 0
+    current_height = 0.0
+
+    for i, line_height in enumerate(heights):
+        if current_height + line_height > usable_height and current_count:
+            # 超出高度且当前页不为空，创建新页面
+            page_sizes.append(current_count)
+            current_count = 1
+            current_height = line_height
+        else:
+            current_count += 1
+            current_height += line_height
+
+        # 在段落边界处，如果当前页已经使用了足够的高度，就结束当前页
+        if boundaries[i] and current_count and current_height / usable_height > 0.75:
+            page_sizes.append(current_count)
+            current_count = 0
+            current_height = 0.0
+
+    if current_count:
+        page_sizes.append(current_count)
+
+    return page_sizes
+
+
+def _break_penalty(boundaries: Sequence[bool], paragraph_starts: Sequence[bool], end: int) -> float:
+    """在第end行之前断页的代价（end为下一页首行的索引）"""
+    if boundaries[end - 1]:
+        return 0.0
+
+    penalty = MID_PARAGRAPH_PENALTY
+    # 孤行：上一页最后一行是段落首行
+    if paragraph_starts[end - 1]:
+        penalty += ORPHAN_PENALTY
+    # 寡行：下一页第一行是段落末行
+    if end < len(boundaries) and (boundaries[end] or end == len(boundaries) - 1):
+        penalty += WIDOW_PENALTY
+    return penalty
+
+
+def _page_cost(page_height: float, usable_height: float, is_last_page: bool) -> float:
+    """单页的劣度：固定翻页代价 + 留白代价（最后一页不计留白）"""
+    if page_height > usable_height:
+        return PAGE_PENALTY + OVERFULL_PENALTY
+    if is_last_page:
+        return PAGE_PENALTY
+    underfill = (usable_height - page_height) / usable_height
+    return PAGE_PENALTY + UNDERFILL_WEIGHT * underfill * underfill
+
+
+def _paragraph_starts(boundaries: Sequence[bool]) -> List[bool]:
+    """根据段落边界推出每行是否为段落首行"""
+    starts = [True] * len(boundaries)
+    for i in range(1, len(boundaries)):
+        starts[i] = boundaries[i - 1]
+    return starts
+
+
+def optimal_page_breaks(heights: Sequence[float], boundaries: Sequence[bool],
+                        usable_height: float) -> List[int]:
+    """最优分页：类似Knuth-Plass断行，在页数最少的断页方案中求总劣度最小的一个
+
+    best[j]表示前j行分页的 (最少页数, 该页数下的最小劣度)，按字典序比较，
+    因此页数不会多于贪心分页，留白、孤行寡行和段内断页的劣度只决定行如何在这些页之间分配。
+    由于每页高度受usable_height限制，每个断点只需回看一页以内的候选起点，复杂度为O(n·K)，K为每页最多行数。
+
+    Returns:
+        每页包含的行数列表
+    """
+    n = len(heights)
+    if n == 0:
+        return []
+
+    prefix = [0.0] * (n + 1)
+    for i, line_height in enumerate(heights):
+        prefix[i + 1] = prefix[i] + line_height
+
+    paragraph_starts = _paragraph_starts(boundaries)
+    infinity = (float('inf'), float('inf'))
+    best = [infinity] * (n + 1)
+    previous = [0] * (n + 1)
+    best[0] = (0, 0.0)
+
+    for end in range(1, n + 1):
+        is_last_page = end == n
+        penalty = 0.0 if is_last_page else _break_penalty(boundaries, paragraph_starts, end)
+        start = end - 1
+        while start >= 0:
+            page_height = prefix[end] - prefix[start]
+            # 超高的页面只允许单行独占
+            if page_height > usable_height and start < end - 1:
+                break
+            if best[start] < infinity:
+                pages, badness = best[start]
+                cost = (pages + 1, badness + _page_cost(page_height, usable_height, is_last_page) + penalty)
+                if cost < best[end]:
+                    best[end] = cost
+                    previous[end] = start
+            start -= 1
+
+    page_sizes = []
+    end = n
+    while end > 0:
+        start = previous[end]
+        page_sizes.append(end - start)
+        end = start
+    page_sizes.reverse()
+    return page_sizes
+
+
+def total_badness(page_sizes: Sequence[int], heights: Sequence[float],
+                  boundaries: Sequence[bool], usable_height: float) -> float:
+    """按最优分页的劣度模型计算任意分页方案的总劣度，便于比较"""
+    paragraph_starts = _paragraph_starts(boundaries)
+    badness = 0.0
+    start = 0
+    for page_index, size in enumerate(page_sizes):
+        end = start + size
+        is_last_page = page_index == len(page_sizes) - 1
+        badness += _page_cost(sum(heights[start:end]), usable_height, is_last_page)
+        if not is_last_page:
+            badness += _break_penalty(boundaries, paragraph_starts, end)
+        start = end
+    return badness
+
+
+def paginate_lines(lines: Sequence[str], profile: LayoutProfile) -> List[int]:
+    """按布局配置对文章行分页，返回每页行数（纯计算，可在后台进程中执行）"""
+    heights = [estimate_text_height(line, profile.line_height, profile.max_line_length,
+                                    profile.font_size, profile.line_spacing) for line in lines]
+    boundaries = [is_paragraph_boundary(lines, i) for i in range(len(lines))]
+
+    if profile.page_break_mode == 'optimal':
+        return optimal_page_breaks(heights, boundaries, profile.usable_height)
+    return greedy_page_breaks(heights, boundaries, profile.usable_height)
+
+
+def split_into_pages(lines: Sequence[str], page_sizes: Sequence[int]) -> List[List[str]]:
+    """按每页行数把行列表切分成页面"""
+    pages = []
+    start = 0
+    for size in page_sizes:
+        pages.append(list(lines[start:start + size]))
+        start += size
+    return pages
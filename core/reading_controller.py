@@ -4,10 +4,73 @@ Reading Training - Apache License 2.0
 
 锐读 - 速读训练程序 - 阅读控制器
 """
-import time
+import queue
 import threading
-from typing import Optional, Callable, List, Dict, Tuple
+from collections import deque
+from dataclasses import replace
+from typing import Optional, Callable, List, Tuple
 from core.article_parser import Article
+from core.clock import MonotonicClock, SessionStats, VirtualClock
+from core.fade_model import (PACER_WIDTH_CHARS, PAGE_MODE_TURN_PAUSE, PAGE_TURN_PAUSE, SMOOTH_FADE_LEVELS,
+                             FadeTimeline, step_offset)
+from core.segmenter import GRANULARITIES
+from core.reading_snapshot import ReadingSnapshot
+from core.pagination import (PAGE_BREAK_MODES, SAFETY_MARGIN, LayoutProfile, estimate_text_height,
+                             paginate_lines, split_into_pages)
+
+READING_MODES = ('line', 'pacer', 'page')  # 逐行渐隐、导读光标、按页
+TIMED_MODES = ('line', 'pacer')  # 由虚拟阅读时间驱动的模式，共用渐隐时间轴
+# 逐行模式的驱动方式：'thread' 后台阅读线程，'tick' 由界面主线程定时调用tick()
+ENGINE_MODES = ('thread', 'tick')
+SEEK_TARGETS = ('offset', 'page', 'paragraph', 'sentence', 'time', 'progress')
+MIN_READING_SPEED = 60  # 字符/分钟
+MAX_READING_SPEED = 1200  # 普通模式速度上限
+MAX_HIGH_SPEED = 5000  # 高速模式速度上限
+
+
+def measure_line_height(text_widget, font_size: int, line_spacing: float) -> float:
+    """在文本控件中实际测量单行文本的高度（必须在界面线程调用）"""
+    try:
+        # 临时插入测试文本来测量行高
+        text_widget.config(state='normal')
+        original_content = text_widget.get(1.0, 'end-1c')
+        
+        # 清空并插入测试文本，使用更多行来提高测量精度
+        # 重要：要应用'content' tag来获得正确的间距
+        test_lines = ["测试行一", "测试行二", "测试行三", "测试行四", "测试行五"]
+        test_text = '\n'.join(test_lines)
+        text_widget.delete(1.0, 'end')
+        text_widget.insert(1.0, test_text, 'content')  # 应用content tag
+        text_widget.update_idletasks()
+        
+        # 测量第一行和最后一行的位置差，计算平均行高
+        bbox_first = text_widget.bbox("1.0")
+        bbox_last = text_widget.bbox(f"{len(test_lines)}.0")
+        
+        line_height = font_size * line_spacing  # 默认值
+        
+        if bbox_first and bbox_last:
+            total_height = bbox_last[1] - bbox_first[1]
+            measured_height = total_height / (len(test_lines) - 1)  # 实际行间距离
+            if measured_height > 0:
+                line_height = measured_height
+                print(f"[DEBUG] 实际测量行高: {line_height:.1f}px (基于{len(test_lines)-1}行间距，包含tag样式)")
+            else:
+                print(f"[DEBUG] 测量结果无效，使用估算行高: {line_height}px")
+        else:
+            print(f"[DEBUG] 无法获取bbox，使用估算行高: {line_height}px")
+        
+        # 恢复原内容
+        text_widget.delete(1.0, 'end')
+        text_widget.insert(1.0, original_content)
+        text_widget.config(state='disabled')
+        
+        return line_height
+        
+    except Exception as e:
+        print(f"[DEBUG] 测量行高时出错: {e}，使用估算值")
+        return font_size * line_spacing
+
 
 class ReadingController:
     def __init__(self):
@@ -18,33 +81,45 @@ class ReadingController:
         self.chars_in_current_line = 0
         self.lines_per_page = 10
         self.reading_speed = 300  # 字符/分钟
-        self.mode = 'line'  # 'line' 或 'page'
+        self.high_speed_mode = False  # 高速模式：速度上限提高到MAX_HIGH_SPEED
+        self.mode = 'line'  # READING_MODES 之一
+        self._pending_mode: Optional[str] = None  # 阅读中推迟生效的模式切换
         self.is_reading = False
         self.is_paused = False
+        self.engine_mode = 'thread'  # 逐行模式驱动方式：'thread' 或 'tick'
         self.reading_thread: Optional[threading.Thread] = None
         self.update_callback: Optional[Callable] = None
         
-        # 新增：字符状态管理
-        self.char_states: Dict[Tuple[int, int, int], str] = {}  # (page, line, char) -> state
-        self.fading_levels = 2  # 优化：减少渐隐级别数从5降到2
+        # 渐隐模型：字符状态由虚拟阅读时间和时间轴推导，不再逐字符保存
+        self.timeline: Optional[FadeTimeline] = None  # 当前分页和速度下的渐隐时间轴
+        self.virtual_time = 0.0  # 虚拟阅读时间（秒），只在阅读且未暂停时推进
+        self._last_advance_time: Optional[float] = None  # 上次推进虚拟时间时的时钟读数
+        self._next_frame: Optional[float] = None  # 下一帧的截止时间（帧节拍调度）
+        self.fading_levels = SMOOTH_FADE_LEVELS  # 色带渲染的代价与字符数无关，不再需要减少级别
+        self.granularity = 'char'  # 渐隐单位：'char'、'word'、'phrase' 或 'line'
+        self.line_turn_pause = PAGE_TURN_PAUSE  # 逐行和导读光标模式换页后的停顿（秒）
+        self.page_turn_pause = PAGE_MODE_TURN_PAUSE  # 按页模式的页间停顿（秒）
         
         # 新增：批量更新相关
-        self.batch_update_interval = 0.05  # 批量更新间隔（秒）
-        self.pending_updates = False  # 是否有待处理的更新
-        self.batch_timer = None  # 批量更新定时器
+        self.batch_update_interval = 0.05  # 界面刷新间隔（秒）
         
         # 新增：动态布局相关
         self.max_line_length = 40  # 每行最大字符数
-        self.pause_resume_char_states = {}  # 暂停时保存的字符状态
         
         # 新增：问题模式相关
         self.is_question_mode = False  # 是否处于问题模式
         self.reading_finished = False  # 阅读是否完成
         
-        # 新增：线程安全和状态保护
-        self._state_lock = threading.Lock()  # 状态访问锁
-        self._absolute_char_states: Dict[int, str] = {}  # 基于绝对字符位置的状态
-        self._absolute_position = 0  # 当前阅读的绝对字符位置
+        # 线程模型：阅读线程运行时独占全部状态，界面只发送命令、读取快照，热循环不加锁
+        self.snapshot = ReadingSnapshot()  # 最新发布的不可变快照，界面无锁读取
+        self._commands = queue.SimpleQueue()  # 界面发送给阅读线程的命令（命令名, 参数）
+        self._inbox = deque()  # 阅读线程等待时已取出、尚未执行的命令
+        self.pause_requested = False  # 界面最近一次请求的暂停状态（只由调用方线程写入）
+        self.display_suspended = False  # 窗口不可见：只推进时间模型，不生成快照、不通知界面
+        
+        # 时钟：所有计时和等待都经过它，无界面运行时换成VirtualClock
+        self.clock = MonotonicClock()
+        self.stats = SessionStats()  # 最近一次会话的计时统计
         
         # 新增：page模式页面内进度追踪
         self.page_reading_start_time = 0.0  # 当前页面开始阅读的时间
@@ -55,40 +130,25 @@ class ReadingController:
         self.available_height = 800  # 可用显示高度（像素）
         self.font_size = 14  # 字体大小
         self.line_spacing = 1.5  # 行间距
+        self.page_break_mode = 'greedy'  # 分页方式：'greedy' 或 'optimal'
+        self.measured_line_height: Optional[float] = None  # 由窗口测量好的行高，避免重复测量
+        self.pagination_count = 0  # 分页次数统计
+        self.layout_cache = None  # 可选的持久化分页缓存（LayoutCache）
     
-    def set_article(self, article: Article):
-        """设置要阅读的文章"""
+    def set_article(self, article: Article, paginate: bool = True):
+        """设置要阅读的文章
+
+        Args:
+            paginate: 为False时只重置位置不分页，由随后的configure_layout统一分页一次
+        """
         print(f"[DEBUG] 设置文章: {article.title}")
         self.current_article = article
-        self.reset_position()
-        self._create_pages()
+        self.timeline = None  # 旧文章的时间轴不再适用
+        self.pages = []  # 复用控制器时丢弃旧文章的分页，随后的configure_layout不会误判为无需分页
+        self.reset_position(paginate=paginate)
         lines = article.original_content.split('\n')
         print(f"[DEBUG] 文章总行数: {len(lines)}")
         
-    def set_lines_per_page(self, lines_per_page: int):
-        """设置每页行数"""
-        self.lines_per_page = lines_per_page
-        print(f"[DEBUG] 设置每页行数: {lines_per_page}")
-        if self.current_article:
-            # 保存当前进度
-            current_progress = self.get_progress()
-            print(f"[DEBUG] 保存当前进度: {current_progress:.1%}")
-            
-            self._create_pages()
-            
-            # 恢复到相应的进度位置
-            if current_progress > 0:
-                self._restore_reading_position_by_progress(current_progress)
-                print(f"[DEBUG] 恢复到进度: {current_progress:.1%}")
-    
-    def set_max_line_length(self, max_length: int):
-        """设置每行最大字符数并重新分页"""
-        if self.max_line_length != max_length:
-            self.max_line_length = max_length
-            print(f"[DEBUG] 设置最大行长度: {max_length}")
-            if self.current_article:
-                self._reformat_and_repaginate()
-    
     def _reformat_and_repaginate(self):
         """重新格式化并分页（保持当前阅读进度）"""
         if not self.current_article:
@@ -100,86 +160,47 @@ class ReadingController:
         current_progress = self.get_progress()
         print(f"[DEBUG] 当前进度: {current_progress:.1%}")
         
-        # 保存绝对位置状态（这些在重新分页后仍然有效）
-        with self._state_lock:
-            preserved_absolute_states = self._absolute_char_states.copy()
-            preserved_relative_states = self.char_states.copy()
-            current_absolute_pos = self._absolute_position
-            print(f"[DEBUG] 保存了 {len(preserved_absolute_states)} 个绝对位置状态")
-            print(f"[DEBUG] 保存了 {len(preserved_relative_states)} 个相对位置状态")
-            print(f"[DEBUG] 当前绝对位置: {current_absolute_pos}")
-        
         # 记录重分页前的页面结构
         old_pages_info = [(i, len(page)) for i, page in enumerate(self.pages)]
         print(f"[DEBUG] 重分页前页面结构: {old_pages_info}")
         
-        # 重新创建页面
+        # 重新创建页面；逐行模式下时间轴按锚点换算虚拟时间，位置和渐隐状态精确保持
         self._create_pages()
         
         # 记录重分页后的页面结构
         new_pages_info = [(i, len(page)) for i, page in enumerate(self.pages)]
         print(f"[DEBUG] 重分页后页面结构: {new_pages_info}")
         
-        # 恢复阅读位置
-        self._restore_reading_position(current_progress)
-        
-        # 恢复绝对位置状态（关键：这确保了渐隐状态在布局变化后保持）
-        with self._state_lock:
-            # 清除旧状态
-            self.char_states.clear()
-            self._absolute_char_states.clear()
-            
-            # 恢复绝对位置状态
-            self._absolute_char_states = preserved_absolute_states
-            
-            # 验证状态一致性：检查一些关键的绝对位置是否仍然有效
-            valid_states = 0
-            invalid_states = 0
-            for abs_pos, state in preserved_absolute_states.items():
-                # 简单验证：绝对位置应该在合理范围内
-                total_chars = sum(len(line) for page in self.pages for line in page)
-                if 0 <= abs_pos < total_chars:
-                    valid_states += 1
-                else:
-                    invalid_states += 1
-                    # 删除无效的绝对位置状态
-                    if abs_pos in self._absolute_char_states:
-                        del self._absolute_char_states[abs_pos]
-            
-            print(f"[DEBUG] 状态验证: {valid_states} 个有效, {invalid_states} 个无效已清除")
-            print(f"[DEBUG] 最终恢复了 {len(self._absolute_char_states)} 个绝对位置状态")
-        
-        # 额外的状态清理和验证
-        self._validate_and_cleanup_states()
+        # 按页模式根据进度恢复到相应页面
+        if self.mode == 'page':
+            self._restore_reading_position_by_progress(current_progress)
         
         print(f"[DEBUG] 重新分页完成: {len(self.pages)} 页")
     
-    def _restore_reading_position(self, target_progress: float):
-        """根据进度恢复阅读位置"""
-        if target_progress <= 0 or not self.pages:
+    def _rebuild_timeline(self):
+        """按当前分页和速度重建渐隐时间轴，并通过锚点换算虚拟时间以保持阅读位置"""
+        anchor = self.timeline.anchor(self.virtual_time) if self.timeline else None
+        self.timeline = FadeTimeline(self.pages, 60.0 / self.reading_speed, self.granularity, self.line_turn_pause)
+        self.virtual_time = self.timeline.time_at_anchor(anchor) if anchor else 0.0
+        if self.mode in TIMED_MODES:
+            self._sync_cursor_from_time()
+        print(f"[DEBUG] 渐隐时间轴: 总时长{self.timeline.total_time:.1f}秒, 虚拟时间{self.virtual_time:.1f}秒")
+    
+    def _sync_cursor_from_time(self):
+        """由虚拟时间推导当前页、行和行内字符位置"""
+        if not self.timeline:
             return
-        
-        # 计算总字符数
-        total_chars = sum(len(line) for page in self.pages for line in page)
-        target_chars = int(total_chars * target_progress)
-        
-        # 重新定位到相应位置
-        current_chars = 0
-        for page_idx, page in enumerate(self.pages):
-            for line_idx, line in enumerate(page):
-                if current_chars + len(line) >= target_chars:
-                    self.current_page = page_idx
-                    self.current_line_in_page = line_idx
-                    self.chars_in_current_line = max(0, target_chars - current_chars)
-                    print(f"[DEBUG] 恢复位置: 页{page_idx}, 行{line_idx}, 字符{self.chars_in_current_line}")
-                    return
-                current_chars += len(line)
-        
-        # 如果没找到合适位置，设置到最后
-        if self.pages:
-            self.current_page = len(self.pages) - 1
-            self.current_line_in_page = len(self.pages[-1]) - 1
-            self.chars_in_current_line = len(self.pages[-1][-1]) if self.pages[-1] else 0
+        page_idx, line_idx, chars = self.timeline.position_at(self.virtual_time)
+        self.current_page = page_idx
+        self.current_line_in_page = line_idx
+        self.chars_in_current_line = chars
+    
+    def _sync_time_from_cursor(self):
+        """由当前页、行和行内字符位置换算虚拟时间"""
+        if not self.timeline:
+            return
+        self.virtual_time = self.timeline.time_at(
+            self.current_page, self.current_line_in_page, self.chars_in_current_line)
     
     def _create_pages(self):
         """创建分页 - 使用智能分页算法"""
@@ -187,6 +208,7 @@ class ReadingController:
             return
         
         print(f"[DEBUG] 开始智能分页")
+        self.pagination_count += 1
         
         # 如果有文本控件引用，使用智能分页
         if self.text_widget and hasattr(self, 'available_height'):
@@ -194,6 +216,8 @@ class ReadingController:
         else:
             # 否则使用传统的固定行数分页
             self._create_pages_traditional()
+        
+        self._rebuild_timeline()
 
     def _create_pages_traditional(self):
         """传统的固定行数分页方法"""
@@ -237,49 +261,35 @@ class ReadingController:
             print(f"[DEBUG] 没有内容行，创建空页面")
             return
         
-        current_page = []
-        current_height = 0
-        
         # 测量单行高度（包括行间距）
         line_height = self._measure_line_height()
         print(f"[DEBUG] 测量到的行高: {line_height}px")
         
-        # 使用传入的可用高度，但要更保守一些
-        # 预留更多空间来应对测量误差和tag样式的影响
-        safety_margin = 120  # 增加更多安全边距，确保最后一行有足够空间
-        usable_height = max(100, self.available_height - safety_margin)
-        print(f"[DEBUG] 实际可用高度: {usable_height}px (预留{safety_margin}px安全边距)")
-        
-        for i, line in enumerate(lines):
-            # 测量这一行的实际高度
-            line_render_height = self._measure_text_height(line, line_height)
-            
-            # 检查添加这一行是否会超出可用高度
-            if current_height + line_render_height > usable_height and current_page:
-                # 超出高度且当前页不为空，创建新页面
-                self.pages.append(current_page)
-                print(f"[DEBUG] 创建第{len(self.pages)}页，包含{len(current_page)}行，高度约{current_height:.1f}px")
-                current_page = [line]
-                current_height = line_render_height
-            else:
-                # 可以添加到当前页
-                current_page.append(line)
-                current_height += line_render_height
-            
-            # 检查段落边界优化
-            if self._should_prefer_page_break_here(lines, i):
-                # 在段落边界处，如果当前页已经使用了足够的高度，就结束当前页
-                height_usage_ratio = current_height / usable_height
-                if height_usage_ratio > 0.75 and current_page:  # 使用75%的阈值，更保守
-                    self.pages.append(current_page)
-                    print(f"[DEBUG] 在段落边界创建第{len(self.pages)}页（优化），包含{len(current_page)}行，使用率{height_usage_ratio:.1%}")
-                    current_page = []
-                    current_height = 0
-        
-        # 添加最后一页
-        if current_page:
-            self.pages.append(current_page)
-            print(f"[DEBUG] 创建最后第{len(self.pages)}页，包含{len(current_page)}行，高度约{current_height:.1f}px")
+        # 使用传入的可用高度，但要更保守一些，预留安全边距应对测量误差
+        profile = LayoutProfile(
+            available_height=int(self.available_height),
+            font_size=self.font_size,
+            line_spacing=self.line_spacing,
+            max_line_length=self.max_line_length,
+            line_height=line_height,
+            page_break_mode=self.page_break_mode,
+        )
+        usable_height = profile.usable_height
+        print(f"[DEBUG] 实际可用高度: {usable_height}px (预留{SAFETY_MARGIN}px安全边距)")
+        
+        # 优先使用后台预分页的结果
+        content = self.current_article.original_content
+        page_sizes = self.layout_cache.get(content, profile) if self.layout_cache is not None else None
+        if page_sizes is not None:
+            print(f"[DEBUG] 命中分页缓存: {len(page_sizes)} 页")
+        else:
+            # 贪心分页逐行填充；最优分页全文求总劣度最小的断页方案
+            page_sizes = paginate_lines(lines, profile)
+            if self.layout_cache is not None:
+                self.layout_cache.put(content, profile, page_sizes)
+        if self.layout_cache is not None:
+            self.layout_cache.remember_profile(profile)
+        self.pages = split_into_pages(lines, page_sizes)
         
         print(f"[DEBUG] 智能分页完成: {len(self.pages)} 页")
         
@@ -302,165 +312,288 @@ class ReadingController:
 
     def _measure_line_height(self) -> float:
         """测量单行文本的高度"""
-        if not self.text_widget:
-            return self.font_size * self.line_spacing
+        if self.measured_line_height:
+            return self.measured_line_height
         
-        try:
-            # 临时插入测试文本来测量行高
-            self.text_widget.config(state='normal')
-            original_content = self.text_widget.get(1.0, 'end-1c')
-            
-            # 清空并插入测试文本，使用更多行来提高测量精度
-            # 重要：要应用'content' tag来获得正确的间距
-            test_lines = ["测试行一", "测试行二", "测试行三", "测试行四", "测试行五"]
-            test_text = '\n'.join(test_lines)
-            self.text_widget.delete(1.0, 'end')
-            self.text_widget.insert(1.0, test_text, 'content')  # 应用content tag
-            self.text_widget.update_idletasks()
-            
-            # 测量第一行和最后一行的位置差，计算平均行高
-            bbox_first = self.text_widget.bbox("1.0")
-            bbox_last = self.text_widget.bbox(f"{len(test_lines)}.0")
-            
-            line_height = self.font_size * self.line_spacing  # 默认值
-            
-            if bbox_first and bbox_last:
-                total_height = bbox_last[1] - bbox_first[1]
-                measured_height = total_height / (len(test_lines) - 1)  # 实际行间距离
-                if measured_height > 0:
-                    line_height = measured_height
-                    print(f"[DEBUG] 实际测量行高: {line_height:.1f}px (基于{len(test_lines)-1}行间距，包含tag样式)")
-                else:
-                    print(f"[DEBUG] 测量结果无效，使用估算行高: {line_height}px")
-            else:
-                print(f"[DEBUG] 无法获取bbox，使用估算行高: {line_height}px")
-            
-            # 恢复原内容
-            self.text_widget.delete(1.0, 'end')
-            self.text_widget.insert(1.0, original_content)
-            self.text_widget.config(state='disabled')
-            
-            return line_height
-            
-        except Exception as e:
-            print(f"[DEBUG] 测量行高时出错: {e}，使用估算值")
+        if not self.text_widget:
             return self.font_size * self.line_spacing
+        return measure_line_height(self.text_widget, self.font_size, self.line_spacing)
 
     def _measure_text_height(self, text: str, base_line_height: float) -> float:
         """测量特定文本的渲染高度"""
-        if not text.strip():
-            # 空行或仅包含空白字符的行，使用较小的高度
-            return base_line_height * 0.3  # 进一步减少空行高度
-        
-        # 检查是否是段落开始（有缩进）
-        is_paragraph_start = text.startswith("    ") or text.startswith("\t")
-        
-        # 对于非空行，考虑文本换行的可能性
-        estimated_height = base_line_height
-        
-        # 如果文本很长，可能会自动换行，需要更多高度
-        if len(text) > self.max_line_length:
-            # 估算可能的换行行数，并添加额外的安全系数
-            estimated_lines = (len(text) + self.max_line_length - 1) // self.max_line_length
-            # 为自动换行添加10%的安全系数，因为实际换行可能不完全按字符数切分
-            estimated_height = base_line_height * estimated_lines * 1.1
-        
-        # 如果是段落开始，需要考虑额外的段落间距
-        # 基于GUI中的tag配置：spacing1=10, spacing3=10, spacing2基于行间距
-        if is_paragraph_start:
-            # 段落前后各10px + 行间距的额外空间
-            extra_spacing = 20 + (self.line_spacing - 1.0) * self.font_size * 0.5
-            estimated_height += extra_spacing
-            
-        return estimated_height
-
-    def _should_prefer_page_break_here(self, lines: list, line_index: int) -> bool:
-        """判断是否应该在此处优先分页"""
-        if line_index >= len(lines) - 1:
-            return False
-        
-        current_line = lines[line_index]
-        next_line = lines[line_index + 1] if line_index + 1 < len(lines) else ""
-        
-        # 如果当前行是空行，且下一行不是空行，优先在此处分页
-        if not current_line.strip() and next_line.strip():
-            return True
-        
-        # 如果下一行是段落开始（有缩进），优先在此处分页
-        if next_line.startswith("    ") or next_line.startswith("\t"):
-            return True
-        
-        return False
+        return estimate_text_height(text, base_line_height, self.max_line_length,
+                                    self.font_size, self.line_spacing)
 
     def set_reading_speed(self, speed: int):
         """设置阅读速度（字符/分钟）"""
-        self.reading_speed = max(60, min(1200, speed))  # 限制在合理范围内
+        self._post('speed', speed)
+    
+    def _cmd_speed(self, speed: int):
+        """命令：设置阅读速度并按锚点重建时间轴"""
+        max_speed = MAX_HIGH_SPEED if self.high_speed_mode else MAX_READING_SPEED
+        self.reading_speed = max(MIN_READING_SPEED, min(max_speed, speed))  # 限制在合理范围内
         print(f"[DEBUG] 设置阅读速度为: {self.reading_speed} 字符/分钟")
+        if self.pages:
+            self._rebuild_timeline()
+
+    def set_high_speed_mode(self, enabled: bool):
+        """设置高速模式（速度上限提高到5000字符/分钟）；应在设置阅读速度之前调用"""
+        self._post('high_speed', enabled)
+    
+    def _cmd_high_speed(self, enabled: bool):
+        """命令：切换高速模式，关闭时把超出普通上限的速度降回上限"""
+        self.high_speed_mode = enabled
+        print(f"[DEBUG] {'启用' if enabled else '禁用'}高速模式")
+        if not enabled and self.reading_speed > MAX_READING_SPEED:
+            self._cmd_speed(MAX_READING_SPEED)
+
+    def set_granularity(self, granularity: str):
+        """设置逐行模式的渐隐单位：逐字、逐词、短语或整行"""
+        self._post('granularity', granularity)
+    
+    def _cmd_granularity(self, granularity: str):
+        """命令：切换渐隐单位并按锚点重建时间轴，阅读位置不变"""
+        if granularity in GRANULARITIES and granularity != self.granularity:
+            self.granularity = granularity
+            print(f"[DEBUG] 设置渐隐单位为: {granularity}")
+            if self.pages:
+                self._rebuild_timeline()
+
+    def set_turn_pauses(self, line_pause: float, page_pause: float):
+        """设置换页停顿（秒）：逐行和导读光标模式换页后的停顿，以及按页模式的页间停顿"""
+        self._post('turn_pauses', line_pause, page_pause)
+    
+    def _cmd_turn_pauses(self, line_pause: float, page_pause: float):
+        """命令：设置换页停顿，逐行停顿变化时按锚点重建时间轴"""
+        line_pause, page_pause = max(0.0, line_pause), max(0.0, page_pause)
+        self.page_turn_pause = page_pause
+        if line_pause != self.line_turn_pause:
+            self.line_turn_pause = line_pause
+            if self.pages:
+                self._rebuild_timeline()
+        print(f"[DEBUG] 设置换页停顿: 逐行{self.line_turn_pause}秒, 按页{self.page_turn_pause}秒")
 
     def set_mode(self, mode: str):
         """设置阅读模式"""
-        if mode in ['line', 'page']:
-            self.mode = mode
-            print(f"[DEBUG] 设置阅读模式为: {mode}")
+        self._post('mode', mode)
+    
+    def _cmd_mode(self, mode: str):
+        """命令：设置阅读模式；逐行和导读光标共用时间轴可以立即切换，
+        阅读中切换到或离开按页模式时阅读循环不同，推迟到停止或下次开始阅读时生效"""
+        if mode not in READING_MODES:
+            return
+        if self.is_reading and (mode in TIMED_MODES) != (self.mode in TIMED_MODES):
+            self._pending_mode = mode
+            print(f"[DEBUG] 阅读模式 {mode} 将在停止或下次开始阅读时生效")
+            return
+        self._pending_mode = None
+        self.mode = mode
+        print(f"[DEBUG] 设置阅读模式为: {mode}")
+    
+    def _apply_pending_mode(self):
+        """应用阅读中推迟的模式切换"""
+        if self._pending_mode is not None:
+            self.mode, self._pending_mode = self._pending_mode, None
+            print(f"[DEBUG] 设置阅读模式为: {self.mode}")
+    
+    def set_engine_mode(self, mode: str):
+        """设置逐行模式的驱动方式（下次开始阅读时生效）"""
+        self._post('engine_mode', mode)
+    
+    def _cmd_engine_mode(self, mode: str):
+        """命令：设置驱动方式"""
+        if mode in ENGINE_MODES:
+            self.engine_mode = mode
+            print(f"[DEBUG] 设置驱动方式为: {mode}")
+    
+    def uses_tick_engine(self) -> bool:
+        """当前阅读是否由界面主线程的tick驱动（没有阅读线程）"""
+        return self.engine_mode == 'tick' and self.mode in TIMED_MODES
+    
+    def set_page_break_mode(self, mode: str):
+        """设置分页方式并重新分页"""
+        self._post('page_break_mode', mode)
+    
+    def _cmd_page_break_mode(self, mode: str):
+        """命令：设置分页方式"""
+        if mode in PAGE_BREAK_MODES and mode != self.page_break_mode:
+            self.page_break_mode = mode
+            print(f"[DEBUG] 设置分页方式为: {mode}")
+            if self.current_article:
+                self._reformat_and_repaginate()
     
     def set_high_performance_mode(self, enabled: bool):
         """设置高性能模式"""
+        self._post('high_performance', enabled)
+    
+    def _cmd_high_performance(self, enabled: bool):
+        """命令：切换高性能模式"""
+        # 渐隐级别保持不变：色带渲染每帧只移动每个级别的一个标签
         if enabled:
-            self.fading_levels = 2  # 高效模式：减少渐隐级别
             self.batch_update_interval = 0.08  # 稍微增加批量更新间隔
             print(f"[DEBUG] 启用高性能模式：渐隐级别={self.fading_levels}, 批量更新间隔={self.batch_update_interval}s")
         else:
-            self.fading_levels = 4  # 传统模式：更多渐隐级别
             self.batch_update_interval = 0.03  # 更频繁的更新
             print(f"[DEBUG] 禁用高性能模式：渐隐级别={self.fading_levels}, 批量更新间隔={self.batch_update_interval}s")
 
+    def set_display_suspended(self, suspended: bool):
+        """窗口最小化或被完全遮住时暂停生成快照和通知界面，时间模型照常推进"""
+        self._post('display_suspended', suspended)
+    
+    def _cmd_display_suspended(self, suspended: bool):
+        """命令：切换是否向界面发布快照；阅读线程执行命令后的通知即为恢复时的补偿帧"""
+        self.display_suspended = suspended
+        print(f"[DEBUG] {'暂停' if suspended else '恢复'}向界面发布快照")
+
     def set_update_callback(self, callback: Callable):
         """设置更新显示的回调函数"""
         self.update_callback = callback
         print(f"[DEBUG] 设置更新回调函数")
 
-    def reset_position(self):
+    def reset_position(self, paginate: bool = True):
         """重置阅读位置"""
         print(f"[DEBUG] 重置阅读位置")
-        with self._state_lock:
-            self.current_page = 0
-            self.current_line_in_page = 0
-            self.chars_in_current_line = 0
-            self.char_states.clear()  # 清除所有字符状态
-            self.pause_resume_char_states.clear()  # 清除暂停状态
-            self._absolute_char_states.clear()  # 清除绝对位置状态
-            self._absolute_position = 0  # 重置绝对位置
+        self.current_page = 0
+        self.current_line_in_page = 0
+        self.chars_in_current_line = 0
+        self.virtual_time = 0.0  # 所有字符恢复为未读状态
         self.is_question_mode = False  # 重置问题模式
         self.reading_finished = False  # 重置阅读完成状态
         # 重置page模式页面内进度追踪
         self.page_reading_start_time = 0.0
         self.page_reading_duration = 0.0
-        if self.current_article:
+        if self.current_article and paginate:
             self._create_pages()
-        print(f"[DEBUG] 分页完成: {len(self.pages)} 页")
+            print(f"[DEBUG] 分页完成: {len(self.pages)} 页")
     
     def _restore_reading_position_by_progress(self, target_progress: float):
         """根据进度百分比恢复阅读位置，特别适用于page模式"""
         if target_progress <= 0 or not self.pages:
             return
         
+        if not self.timeline:
+            return
+        
         if self.mode == 'page':
-            # Page模式：根据进度恢复到相应的页面
-            target_page = int(target_progress * len(self.pages))
-            target_page = min(target_page, len(self.pages) - 1)  # 确保不超出范围
+            # Page模式：在各页停留时间的前缀和上二分查找目标页
+            target_page = self.timeline.page_at_elapsed(target_progress * self.timeline.page_time_prefix[-1])
             self.current_page = target_page
             self.current_line_in_page = 0
             self.chars_in_current_line = 0
             print(f"[DEBUG] Page模式恢复到第{target_page}页")
         else:
-            # Line模式：使用原有的字符级精确恢复
-            self._restore_reading_position(target_progress)
+            # Line模式：进度即虚拟时间占总时长的比例
+            self.virtual_time = target_progress * self.timeline.total_time
+            self._sync_cursor_from_time()
+
+    def seek(self, target: str, value):
+        """定位阅读位置，由阅读线程在两帧之间执行
+        
+        Args:
+            target: 'offset'（绝对字符位置）、'page'（页号）、'time'（虚拟时间秒数）、
+                    'progress'（0-1的比例），或 'paragraph'/'sentence'（相对当前位置移动的段落数/句数）
+        """
+        if target not in SEEK_TARGETS:
+            print(f"[DEBUG] 无效的定位目标: {target}")
+            return
+        self._post('seek', target, value)
+    
+    def _cmd_seek(self, target: str, value):
+        """命令：在时间轴的预计算索引上二分查找目标位置"""
+        timeline = self.timeline
+        if not timeline or not self.pages:
+            return
+        
+        # 当前绝对位置：逐行模式取光标，按页模式取当前页首字符
+        if self.mode in TIMED_MODES:
+            current = timeline.offset_at(self.virtual_time)
+        else:
+            page = min(self.current_page, timeline.page_count - 1)
+            current = timeline.line_offset[timeline.page_first_line[page]]
+        
+        if target == 'page':
+            page = max(0, min(timeline.page_count - 1, int(value)))
+            target_time = timeline.time_at(page, 0, 0)
+        elif target == 'time':
+            target_time = float(value)
+        elif target == 'progress':
+            target_time = max(0.0, min(1.0, value)) * timeline.total_time
+        elif target == 'paragraph':
+            target_time = timeline.time_at_offset(step_offset(timeline.paragraph_offsets, current, int(value)))
+        elif target == 'sentence':
+            target_time = timeline.time_at_offset(step_offset(timeline.sentence_offsets, current, int(value)))
+        else:
+            target_time = timeline.time_at_offset(int(value))
+        target_time = max(0.0, min(timeline.total_time, target_time))
+        
+        if self.mode in TIMED_MODES:
+            self.virtual_time = target_time
+            self._sync_cursor_from_time()
+        else:
+            # 按页模式跳到目标位置所在页，并从头计算该页的停留时间；时间和进度按各页停留时间换算
+            if target == 'progress':
+                self.current_page = timeline.page_at_elapsed(max(0.0, min(1.0, value)) * timeline.page_time_prefix[-1])
+            elif target == 'time':
+                self.current_page = timeline.page_at_elapsed(float(value))
+            else:
+                self.current_page = min(timeline.page_count - 1, timeline.position_at(target_time)[0])
+            self.current_line_in_page = 0
+            self.chars_in_current_line = 0
+            self.page_reading_start_time = 0.0
+            self.page_reading_duration = 0.0
+        self.reading_finished = False
+        print(f"[DEBUG] 定位({target}={value}): 页{self.current_page}, 虚拟时间{self.virtual_time:.2f}秒")
 
     def start_reading(self):
         """开始阅读"""
-        if self.is_reading:
+        if not self._begin_session():
             return
         
+        # tick引擎：不启动线程，由界面主线程定时调用tick()
+        if self.uses_tick_engine():
+            self.reading_thread = None
+            print(f"[DEBUG] 使用主线程tick驱动，不启动阅读线程")
+            return
+        
+        # 启动阅读线程
+        if self.mode in TIMED_MODES:
+            self.reading_thread = threading.Thread(target=self._line_reading_loop_with_fade)
+        else:
+            self.reading_thread = threading.Thread(target=self._page_reading_loop)
+        
+        self.reading_thread.daemon = True
+        self.reading_thread.start()
+        print(f"[DEBUG] 阅读线程已启动")
+    
+    def run_headless(self, clock=None) -> SessionStats:
+        """在调用方线程用虚拟时钟跑完整个会话（不启动线程、不需要界面），返回计时统计
+        
+        回调、状态变化和统计与真实会话相同，只是等待不消耗真实时间；
+        传入MonotonicClock则按真实时间运行，可用来测量丢帧。
+        """
+        previous_clock = self.clock
+        self.clock = clock or VirtualClock()
+        try:
+            if self._begin_session():
+                self.reading_thread = None
+                if self.mode in TIMED_MODES:
+                    self._line_reading_loop_with_fade()
+                else:
+                    self._page_reading_loop()
+        finally:
+            # 之后的真实会话（包括之后的start_reading）仍按原来的时钟计时
+            self.clock = previous_clock
+        return self.stats
+    
+    def _begin_session(self) -> bool:
+        """开始会话前的检查和状态重置，返回是否可以开始"""
+        if self.is_reading:
+            return False
+        
+        # 上一次阅读线程退出前未来得及执行的命令，由调用方线程补执行
+        self._drain_commands()
+        self._apply_pending_mode()
+        
         print(f"[DEBUG] 开始阅读，模式: {self.mode}")
         
         # 重置阅读完成和问题模式标志
@@ -472,7 +605,7 @@ class ReadingController:
         if self.mode == 'page':
             if not self.pages:
                 print(f"[DEBUG] Page模式：没有页面数据，无法开始阅读")
-                return
+                return False
             
             # 确保当前页位置有效
             if self.current_page >= len(self.pages):
@@ -483,210 +616,219 @@ class ReadingController:
         
         self.is_reading = True
         self.is_paused = False
-        
-        # 启动阅读线程
-        if self.mode == 'line':
-            self.reading_thread = threading.Thread(target=self._line_reading_loop_with_fade)
-        else:
-            self.reading_thread = threading.Thread(target=self._page_reading_loop)
-        
-        self.reading_thread.daemon = True
-        self.reading_thread.start()
-        print(f"[DEBUG] 阅读线程已启动")
+        self.pause_requested = False
+        self._last_advance_time = None
+        self._next_frame = None
+        self.stats = SessionStats(started_at=self.clock.now())
+        return True
 
-    def pause_reading(self):
-        """暂停/继续阅读"""
-        with self._state_lock:
-            if self.is_paused:
-                # 恢复阅读
-                self.is_paused = False
-                print(f"[DEBUG] 恢复阅读")
-                
-                # 如果有保存的暂停状态，恢复它们
-                if self.pause_resume_char_states:
-                    self.char_states.update(self.pause_resume_char_states)
-                    self.pause_resume_char_states.clear()
-                    print(f"[DEBUG] 恢复了 {len(self.char_states)} 个相对位置字符状态")
-            else:
-                # 暂停阅读
-                self.is_paused = True
-                print(f"[DEBUG] 暂停阅读")
-                
-                # 保存当前渐隐状态，用于恢复时继续处理
-                self.pause_resume_char_states = self.char_states.copy()
-                print(f"[DEBUG] 保存了 {len(self.pause_resume_char_states)} 个相对位置字符状态")
-                print(f"[DEBUG] 当前有 {len(self._absolute_char_states)} 个绝对位置字符状态")
+    def pause_reading(self) -> bool:
+        """暂停/继续阅读，返回请求后的暂停状态（阅读线程会在下一帧之前执行该命令）"""
+        self.pause_requested = not self.pause_requested
+        self._post('pause', self.pause_requested)
+        return self.pause_requested
+    
+    def _cmd_pause(self, paused: bool):
+        """命令：设置暂停状态"""
+        # 暂停只是停止推进虚拟时间，渐隐状态无需保存和恢复
+        if self.mode in TIMED_MODES and self.is_reading:
+            # 在切换瞬间结算时钟：暂停前的时间计入，暂停期间的时间不计入
+            self._advance_clock(self.clock.now())
+        self.is_paused = paused
+        self._next_frame = None  # 暂停的时长不算丢帧，继续后重新对齐帧节拍
+        print(f"[DEBUG] {'暂停阅读' if self.is_paused else '恢复阅读'} (虚拟时间{self.virtual_time:.1f}秒)")
 
     def stop_reading(self):
         """停止阅读"""
         print(f"[DEBUG] 停止阅读")
-        self.is_reading = False
-        self.is_paused = False
-        
-        # 清理批量更新定时器
-        if self.batch_timer:
-            self.batch_timer.cancel()
-            self.batch_timer = None
-        self.pending_updates = False
+        self.pause_requested = False
+        self._post('stop')
         
         if self.reading_thread and self.reading_thread.is_alive():
             self.reading_thread.join(timeout=1.0)
             print(f"[DEBUG] 阅读线程已停止")
+    
+    def _cmd_stop(self):
+        """命令：停止阅读，阅读循环随即退出"""
+        self.is_reading = False
+        self.is_paused = False
+        self.stats.finished_at = self.clock.now()
+        self._apply_pending_mode()
+    
+    def _has_reader_thread(self) -> bool:
+        """是否有（除当前线程外的）阅读线程在运行并独占状态"""
+        thread = self.reading_thread
+        return thread is not None and thread.is_alive() and thread is not threading.current_thread()
+    
+    def _post(self, command: str, *args):
+        """发送命令：阅读线程运行时排队，由它在两帧之间执行；否则在调用方线程直接执行"""
+        if self._has_reader_thread():
+            self._commands.put((command, args))
+        else:
+            getattr(self, f'_cmd_{command}')(*args)
+    
+    def _drain_commands(self) -> List[str]:
+        """在阅读线程的两帧之间执行所有待处理命令，返回已执行的命令名"""
+        while True:
+            try:
+                self._inbox.append(self._commands.get_nowait())
+            except queue.Empty:
+                break
+        if not self._inbox:
+            return []
+        
+        # 布局命令只执行最新的一条
+        commands = list(self._inbox)
+        self._inbox.clear()
+        last_layout = max((i for i, (name, _) in enumerate(commands) if name == 'layout'), default=-1)
+        executed = []
+        for i, (name, args) in enumerate(commands):
+            if name == 'layout' and i != last_layout:
+                continue
+            getattr(self, f'_cmd_{name}')(*args)
+            executed.append(name)
+        print(f"[DEBUG] 阅读线程执行命令: {executed}")
+        self._notify()
+        return executed
+    
+    def _wait_for_command(self, timeout: Optional[float] = None):
+        """阻塞直到收到命令或超时（暂停时不设超时，不轮询）；命令留到下一次_drain_commands执行"""
+        command = self.clock.wait(self._commands, timeout)
+        if command is not None:
+            self._inbox.append(command)
 
     def _line_reading_loop_with_fade(self):
-        """逐行阅读循环 - 带渐隐效果"""
-        loop_count = 0
+        """逐行阅读循环 - 推进虚拟阅读时间，字符渐隐状态由时间轴推导"""
+        frame_count = 0
         
         while self.is_reading:
-            loop_count += 1
-            print(f"[DEBUG] 循环#{loop_count}: 页{self.current_page}, 行{self.current_line_in_page}, 字符{self.chars_in_current_line}")
-            
-            # 暂停检查
-            if self.is_paused:
-                time.sleep(0.1)
-                continue
-            
-            # 检查是否已完成所有页面
-            if self.current_page >= len(self.pages):
-                print(f"[DEBUG] 阅读完成，退出循环")
+            # 在两帧之间执行界面发来的命令
+            self._drain_commands()
+            if not self.is_reading:
                 break
             
-            # 检查是否需要移到下一页
-            if self.current_line_in_page >= len(self.pages[self.current_page]):
-                print(f"[DEBUG] 当前页完成，移到下一页")
-                # 清除当前页的字符状态
-                self._clear_current_page_states()
-                
-                self.current_page += 1
-                self.current_line_in_page = 0
-                self.chars_in_current_line = 0
-                
-                if self.update_callback:
-                    print(f"[DEBUG] 调用更新回调 (换页)")
-                    self.update_callback()
-                time.sleep(0.5)  # 换页暂停
-                continue
-            
-            # 获取当前行文本
-            current_line_text = self.pages[self.current_page][self.current_line_in_page]
-            print(f"[DEBUG] 当前行文本: {repr(current_line_text[:30])}... (长度:{len(current_line_text)})")
-            
-            # 如果是空行，直接跳到下一行
-            if not current_line_text.strip():
-                print(f"[DEBUG] 空行，跳到下一行")
-                self.current_line_in_page += 1
-                self.chars_in_current_line = 0
-                if self.update_callback:
-                    print(f"[DEBUG] 调用更新回调 (空行)")
-                    self.update_callback()
-                time.sleep(0.3)
-                continue
-            
-            # 如果当前行已经全部处理完成，移到下一行
-            if self.chars_in_current_line >= len(current_line_text):
-                print(f"[DEBUG] 当前行完成，移到下一行")
-                self.current_line_in_page += 1
-                self.chars_in_current_line = 0
-                if self.update_callback:
-                    print(f"[DEBUG] 调用更新回调 (行完成)")
-                    self.update_callback()
-                time.sleep(0.2)
+            # 暂停检查：暂停期间阻塞等待命令，虚拟时间不推进
+            if self.is_paused:
+                self._wait_for_command()
+                self._next_frame = None  # 暂停的时长不算丢帧
                 continue
             
-            # 计算当前字符的绝对位置
-            with self._state_lock:
-                absolute_pos = self._calculate_absolute_position(
-                    self.current_page, self.current_line_in_page, self.chars_in_current_line
-                )
-                self._absolute_position = absolute_pos
-            
-            # 处理当前字符的渐隐效果
-            char_key = (self.current_page, self.current_line_in_page, self.chars_in_current_line)
-            current_char = current_line_text[self.chars_in_current_line]
-            
-            # 使用绝对位置检查字符状态，线程安全
-            with self._state_lock:
-                current_state = self._absolute_char_states.get(absolute_pos, 'normal')
+            finished = self._advance_clock(self.clock.now())
             
-            start_fade_level = 0
+            frame_count += 1
+            if frame_count % 100 == 0:
+                print(f"[DEBUG] 帧#{frame_count}: 虚拟时间{self.virtual_time:.1f}秒, "
+                      f"页{self.current_page}, 行{self.current_line_in_page}, 字符{self.chars_in_current_line}")
             
-            # 如果字符已经有状态，从对应级别开始
-            if current_state != 'normal':
-                if current_state == 'faded':
-                    # 已经完全消失，跳到下一个字符
-                    self.chars_in_current_line += 1
-                    continue
-                elif current_state.startswith('fading_'):
-                    try:
-                        start_fade_level = int(current_state.split('_')[1]) + 1
-                        print(f"[DEBUG] 从渐隐级别 {start_fade_level} 继续字符 '{current_char}' (绝对位置{absolute_pos})")
-                    except:
-                        start_fade_level = 0
-            
-            # 优化：计算渐隐时间，考虑减少的级别数
-            # 总时间保持不变，但分配给更少的级别
-            total_fade_time = 60.0 / self.reading_speed
-            char_delay = total_fade_time / max(1, self.fading_levels)
-            
-            # 执行完整的渐隐过程，确保不被中断
-            success = self._fade_character_complete(absolute_pos, char_key, current_char, start_fade_level, char_delay)
-            
-            if success:
-                # 移到下一个字符
-                self.chars_in_current_line += 1
-            else:
-                # 如果渐隐被中断（比如停止阅读），退出循环
-                print(f"[DEBUG] 字符渐隐被中断，退出循环")
+            # 检查是否已完成所有页面
+            if finished:
+                print(f"[DEBUG] 阅读完成，退出循环")
                 break
             
-            # 每100次循环检查一次，避免无限循环
-            if loop_count % 100 == 0:
-                print(f"[DEBUG] 已执行{loop_count}次循环，当前状态检查...")
-                if loop_count > 10000:  # 防止真的无限循环
-                    print(f"[DEBUG] 循环次数过多，强制退出")
-                    break
+            self._notify()
+            # 按帧节拍等到下一帧的截止时间（不因本帧的处理耗时而漂移），收到命令时提前醒来
+            self._wait_for_command(self._frame_wait(self.clock.now()))
         
         # 阅读结束
-        print(f"[DEBUG] 阅读循环结束，总循环次数: {loop_count}")
+        print(f"[DEBUG] 阅读循环结束，总帧数: {frame_count}")
         self.is_reading = False
         self.reading_finished = True
+        self.stats.finished_at = self.clock.now()
         
         # 不要在这里立即进入问题模式，让GUI控制何时进入
         # 阅读完成后应该先显示完成信息，然后再考虑是否进入答题
         
-        if self.update_callback:
-            print(f"[DEBUG] 调用最终更新回调")
+        print(f"[DEBUG] 调用最终更新回调")
+        self._notify()
+
+    def _frame_wait(self, now: float) -> float:
+        """帧节拍：返回距下一帧截止时间的秒数，整帧错过的截止时间计为丢帧"""
+        interval = self.batch_update_interval
+        if self._next_frame is None:
+            self._next_frame = now + interval
+        elif now >= self._next_frame - 1e-6:  # 容忍时钟读数的浮点误差
+            missed = int((now - self._next_frame) / interval)
+            self.stats.dropped_frames += missed
+            self._next_frame += (missed + 1) * interval
+        return max(0.0, self._next_frame - now)
+    
+    def next_frame_delay(self) -> float:
+        """tick引擎距下一帧截止时间的秒数，供界面安排下一次tick"""
+        if self._next_frame is None:
+            return self.batch_update_interval
+        return max(0.0, self._next_frame - self.clock.now())
+    
+    def _advance_clock(self, now: float) -> bool:
+        """按会话时钟推进虚拟时间（暂停时只记录时钟读数）并同步光标，返回是否已读完"""
+        if self._last_advance_time is not None and not self.is_paused:
+            self.virtual_time += max(0.0, now - self._last_advance_time)
+        self._last_advance_time = now
+        self._sync_cursor_from_time()
+        return self.current_page >= len(self.pages)
+    
+    def tick(self, now: Optional[float] = None) -> bool:
+        """tick引擎的一帧：在界面主线程推进虚拟时间并发布快照，返回快照版本是否变化
+        
+        与阅读线程不同，这里不调用update_callback，调用方在同一帧内直接渲染。
+        """
+        if not self.is_reading:
+            return False
+        if now is None:
+            now = self.clock.now()
+        
+        # 界面的after调度没有按时执行的帧计为丢帧（暂停期间不统计）
+        if self.is_paused:
+            self._next_frame = None
+        else:
+            self._frame_wait(now)
+        
+        if self._advance_clock(now):
+            print(f"[DEBUG] tick引擎：阅读完成")
+            self.is_reading = False
+            self.reading_finished = True
+            self.stats.finished_at = now
+        if self.display_suspended:
+            self.stats.hidden_frames += 1
+            return False
+        return self.publish_snapshot()
+    
+    def publish_snapshot(self) -> bool:
+        """生成当前状态的不可变快照并原子替换，返回可见内容是否变化（版本号是否递增）"""
+        snapshot = ReadingSnapshot(
+            mode=self.mode,
+            page_index=self.current_page,
+            page_count=len(self.pages),
+            text=self.get_current_display_text(),
+            fade_bands=self.get_fade_bands(),
+            pacer_band=self.get_pacer_band(),
+            progress=round(self.get_progress(), 3),  # 按0.1%量化，进度的微小变化不单独触发重绘
+            remaining_seconds=self.get_remaining_time(),
+            is_reading=self.is_reading,
+            is_paused=self.is_paused,
+            reading_finished=self.reading_finished,
+        )
+        self.stats.frames += 1
+        if snapshot == self.snapshot:
+            return False
+        self.snapshot = replace(snapshot, version=self.snapshot.version + 1)
+        self.stats.snapshots += 1
+        return True
+    
+    def latest_snapshot(self) -> ReadingSnapshot:
+        """界面读取最新快照：没有阅读线程独占状态时由调用方线程直接发布一份"""
+        if not self._has_reader_thread():
+            self.publish_snapshot()
+        return self.snapshot
+    
+    def _notify(self):
+        """阅读线程一帧结束：发布快照，内容有变化时才通知界面；窗口不可见时跳过"""
+        if self.display_suspended:
+            self.stats.hidden_frames += 1
+            return
+        if self.publish_snapshot() and self.update_callback:
+            self.stats.callbacks += 1
             self.update_callback()
     
-    def _clear_current_page_states(self):
-        """清除当前页的所有字符状态"""
-        with self._state_lock:
-            # 清除相对位置状态
-            keys_to_remove = [key for key in self.char_states.keys() if key[0] == self.current_page]
-            for key in keys_to_remove:
-                del self.char_states[key]
-            print(f"[DEBUG] 清除了当前页 {len(keys_to_remove)} 个相对位置字符状态")
-            
-            # 清除对应的绝对位置状态（为了内存管理）
-            if self.current_page < len(self.pages):
-                page_lines = self.pages[self.current_page]
-                
-                # 计算当前页第一个字符的绝对位置
-                page_start_abs = self._calculate_absolute_position(self.current_page, 0, 0)
-                
-                # 计算当前页最后一个字符的绝对位置
-                last_line_idx = len(page_lines) - 1
-                last_char_idx = len(page_lines[last_line_idx]) - 1 if page_lines[last_line_idx] else 0
-                page_end_abs = self._calculate_absolute_position(self.current_page, last_line_idx, last_char_idx) + 1
-                
-                abs_keys_to_remove = [
-                    abs_pos for abs_pos in self._absolute_char_states.keys() 
-                    if page_start_abs <= abs_pos < page_end_abs
-                ]
-                for abs_key in abs_keys_to_remove:
-                    del self._absolute_char_states[abs_key]
-                print(f"[DEBUG] 清除了当前页 {len(abs_keys_to_remove)} 个绝对位置字符状态 (范围: {page_start_abs}-{page_end_abs})")
-
     def _page_reading_loop(self):
         """按页阅读循环 - 整页消失模式，支持实时进度更新"""
         print(f"[DEBUG] Page模式阅读循环开始: 当前页{self.current_page}, 总页数{len(self.pages)}")
@@ -702,9 +844,14 @@ class ReadingController:
             if loop_count % 50 == 0:  # 每50次循环记录一次状态
                 print(f"[DEBUG] Page模式循环#{loop_count}: 页{self.current_page}/{len(self.pages)}")
             
+            # 执行界面发来的命令
+            self._drain_commands()
+            if not self.is_reading:
+                break
+            
             # 暂停检查
             if self.is_paused:
-                time.sleep(0.1)
+                self._wait_for_command()
                 continue
                 
             # 再次检查页面是否有效（防止运行时页面数量变化）
@@ -712,42 +859,59 @@ class ReadingController:
                 print(f"[DEBUG] Page模式：运行时检测到页面超出范围{self.current_page}>={len(self.pages)}，退出")
                 break
             
-            # 计算当前页的文本长度
-            current_page_lines = self.pages[self.current_page]
-            page_text = '\n'.join(current_page_lines)
-            char_count = len([c for c in page_text if c.strip()])  # 只计算非空白字符
-            
-            # 计算页面停留时间（最少2秒，最多20秒）
-            page_duration = max(2.0, min(20.0, (char_count * 60.0) / self.reading_speed))
+            # 页面停留时间由计时表预先算好（空白不计时，句末标点带停顿，最少2秒，最多20秒）
+            page_duration = self.timeline.page_durations[self.current_page]
             
             # 设置页面阅读进度追踪
-            self.page_reading_start_time = time.time()
+            self.page_reading_start_time = self.clock.now()
             self.page_reading_duration = page_duration
             
             if loop_count <= 3 or loop_count % 20 == 0:  # 只在开始和偶尔记录详细信息
-                print(f"[DEBUG] 页面 {self.current_page + 1}/{len(self.pages)} 停留时间: {page_duration:.1f}秒, 字符数: {char_count}")
+                print(f"[DEBUG] 页面 {self.current_page + 1}/{len(self.pages)} 停留时间: {page_duration:.1f}秒")
             
             # 显示当前页
-            if self.update_callback:
-                self.update_callback()
+            self._notify()
             
             # 等待页面时间，期间定期更新进度
-            start_time = time.time()
+            start_time = self.clock.now()
             update_interval = 0.2  # 每0.2秒更新一次进度
             last_update_time = start_time
             
-            while (time.time() - start_time < page_duration and 
-                   self.is_reading and not self.is_paused):
+            seeked = False
+            while self.clock.now() - start_time < page_duration and self.is_reading:
                 
-                current_time = time.time()
+                current_time = self.clock.now()
+                
+                # 页面停留期间执行命令；定位后从目标页重新开始计时，布局变化时保持页面内已读比例不变
+                executed = self._drain_commands()
+                if 'seek' in executed:
+                    seeked = True
+                    break
+                if 'layout' in executed:
+                    if self.current_page >= len(self.pages):
+                        break
+                    elapsed_ratio = (current_time - start_time) / page_duration
+                    page_duration = self.timeline.page_durations[self.current_page]
+                    start_time = current_time - elapsed_ratio * page_duration
+                    self.page_reading_start_time = start_time
+                    self.page_reading_duration = page_duration
+                if not self.is_reading:
+                    break
+                
+                # 暂停期间阻塞等待命令，暂停时长不计入页面停留时间
+                if self.is_paused:
+                    paused_at = self.clock.now()
+                    self._wait_for_command()
+                    start_time += self.clock.now() - paused_at
+                    self.page_reading_start_time = start_time
+                    continue
                 
                 # 定期更新进度条和剩余时间
                 if current_time - last_update_time >= update_interval:
-                    if self.update_callback:
-                        self.update_callback()
+                    self._notify()
                     last_update_time = current_time
                 
-                time.sleep(0.1)  # 减少sleep时间以提高更新频率
+                self._wait_for_command(0.1)  # 收到命令时立即醒来
                 
                 # 额外的安全检查：在等待期间如果页面数量发生变化，立即退出
                 if self.current_page >= len(self.pages):
@@ -757,19 +921,22 @@ class ReadingController:
             # 页面阅读完成，清除进度追踪
             self.page_reading_start_time = 0.0
             self.page_reading_duration = 0.0
+            if seeked:
+                continue
             
             # 移到下一页
             if self.is_reading and self.current_page < len(self.pages):
                 self.current_page += 1
                 # 立即更新显示以显示下一页或空白页
-                if self.update_callback:
-                    self.update_callback()
-                time.sleep(0.3)  # 页间暂停
+                self._notify()
+                if self.page_turn_pause > 0:
+                    self._wait_for_command(self.page_turn_pause)  # 页间暂停
         
         # 阅读结束
         print(f"[DEBUG] Page模式阅读循环结束: 总循环{loop_count}次，最终页{self.current_page}")
         self.is_reading = False
         self.reading_finished = True
+        self.stats.finished_at = self.clock.now()
         
         # 清除进度追踪
         self.page_reading_start_time = 0.0
@@ -778,223 +945,86 @@ class ReadingController:
         # 不要在这里立即进入问题模式，让GUI控制何时进入
         # 阅读完成后应该先显示完成信息，然后再考虑是否进入答题
         
-        if self.update_callback:
-            self.update_callback()
+        self._notify()
     
-    def get_current_display_text_with_states(self) -> Tuple[str, Dict[int, str]]:
-        """获取当前应该显示的文本和字符状态信息
-        
-        Returns:
-            tuple: (显示文本, {字符位置: 状态})
-        """
-        print(f"[DEBUG] get_current_display_text_with_states 被调用")
-        
-        if not self.current_article or not self.pages:
-            print(f"[DEBUG] 没有文章或页面数据，返回空字符串")
-            return "", {}
-        
-        # 如果已读完所有页面，返回空白
-        if self.current_page >= len(self.pages):
-            print(f"[DEBUG] 已读完所有页面 (当前页{self.current_page} >= 总页数{len(self.pages)})，返回空字符串")
-            return "", {}
-        
-        current_page_lines = self.pages[self.current_page]
-        print(f"[DEBUG] 当前页{self.current_page}有{len(current_page_lines)}行")
-        
-        if self.mode == 'line':
-            # 逐行模式：显示当前页的所有文本，但根据状态着色
-            display_lines = []
-            char_states_by_pos = {}
-            text_pos = 0
-            
-            # 线程安全地获取绝对位置状态
-            with self._state_lock:
-                absolute_states = self._absolute_char_states.copy()
-            
-            for line_idx in range(len(current_page_lines)):
-                line_text = current_page_lines[line_idx]
-                display_lines.append(line_text)
-                
-                # 为每个字符设置状态
-                for char_idx in range(len(line_text)):
-                    # 计算字符的绝对位置
-                    absolute_pos = self._calculate_absolute_position(
-                        self.current_page, line_idx, char_idx
-                    )
-                    
-                    # 从绝对位置状态或相对位置状态获取状态
-                    char_key = (self.current_page, line_idx, char_idx)
-                    state = absolute_states.get(absolute_pos, 'normal')
-                    if state == 'normal':
-                        # 如果绝对位置没有状态，尝试相对位置
-                        with self._state_lock:
-                            state = self.char_states.get(char_key, 'normal')
-                    
-                    char_states_by_pos[text_pos] = state
-                    text_pos += 1
-                
-                # 换行符
-                if line_idx < len(current_page_lines) - 1:
-                    text_pos += 1  # 为换行符留位置
-                
-                print(f"[DEBUG]   行{line_idx}: {repr(line_text[:20])}...")
-            
-            # 直接返回当前页内容，不再强制补齐到固定行数
-            result = '\n'.join(display_lines)
-            print(f"[DEBUG] 逐行模式返回文本，长度: {len(result)}, 状态数: {len(char_states_by_pos)}")
-            print(f"[DEBUG] 绝对位置状态数: {len(absolute_states)}, 相对位置状态数: {len(self.char_states)}")
-            return result, char_states_by_pos
-        
-        else:
-            # 按页模式：显示完整的当前页
-            display_lines = current_page_lines[:]
-            
-            # 直接返回当前页内容，不再强制补齐到固定行数
-            result = '\n'.join(display_lines)
-            print(f"[DEBUG] 按页模式返回文本，长度: {len(result)}")
-            return result, {}  # 按页模式不需要字符状态
+    def get_fade_bands(self) -> Tuple[Tuple[int, int, str], ...]:
+        """当前页的渐隐色带：((页内起始位置, 页内结束位置, 状态), ...)，只有逐行模式有色带"""
+        if self.mode != 'line' or self.timeline is None or not self.pages:
+            return ()
+        return self.timeline.fade_bands(self.current_page, self.virtual_time, self.fading_levels)
+    
+    def get_pacer_band(self) -> Tuple[int, ...]:
+        """导读光标模式下当前页高亮的区间 (页内起始位置, 页内结束位置)，不显示时为空元组"""
+        if self.mode != 'pacer' or self.timeline is None or not self.pages:
+            return ()
+        return self.timeline.pacer_band(self.current_page, self.virtual_time, PACER_WIDTH_CHARS)
+    
+    def get_page_text(self, page_idx: int) -> str:
+        """指定页的显示文本，页号无效时为空"""
+        pages = self.pages  # 重新分页时整体替换，先取引用
+        if 0 <= page_idx < len(pages):
+            return '\n'.join(pages[page_idx])
+        return ""
     
     def get_current_display_text(self) -> str:
-        """兼容性方法：获取当前应该显示的文本"""
-        text, _ = self.get_current_display_text_with_states()
-        return text
+        """获取当前应该显示的文本（当前页内容，读完后为空）"""
+        if not self.current_article or self.current_page >= len(self.pages):
+            return ""
+        return '\n'.join(self.pages[self.current_page])
 
     def get_progress(self) -> float:
-        """获取阅读进度（0-1）"""
+        """获取阅读进度（0-1），按计时表换算为已用时间占总时长的比例"""
         if not self.current_article or not self.pages:
             print(f"[DEBUG] get_progress: 没有文章数据，返回0.0")
             return 0.0
         
-        if len(self.pages) == 0:
-            print(f"[DEBUG] get_progress: 没有页面，返回1.0")
-            return 1.0
+        if not self.timeline:
+            return 0.0
         
-        if self.mode == 'line':
-            # 逐行模式：基于字符级别的进度
-            total_chars = sum(len(line) for page in self.pages for line in page)
-            if total_chars == 0:
-                print(f"[DEBUG] get_progress: 总字符数为0，返回1.0")
+        if self.mode in TIMED_MODES:
+            # 逐行模式：虚拟时间占时间轴总时长的比例
+            if self.timeline.total_time <= 0:
                 return 1.0
-            
-            # 计算已完成的字符数
-            completed_chars = 0
-            
-            # 已完成的页面
-            for page_idx in range(self.current_page):
-                page_chars = sum(len(line) for line in self.pages[page_idx])
-                completed_chars += page_chars
-                print(f"[DEBUG] get_progress: 页{page_idx}已完成，{page_chars}字符")
-            
-            # 当前页面已完成的行
-            if self.current_page < len(self.pages):
-                current_page = self.pages[self.current_page]
-                for line_idx in range(self.current_line_in_page):
-                    if line_idx < len(current_page):
-                        line_chars = len(current_page[line_idx])
-                        completed_chars += line_chars
-                        print(f"[DEBUG] get_progress: 当前页行{line_idx}已完成，{line_chars}字符")
-                
-                # 当前行已处理的字符
-                completed_chars += self.chars_in_current_line
-                print(f"[DEBUG] get_progress: 当前行已处理{self.chars_in_current_line}字符")
-            
-            progress = min(1.0, completed_chars / total_chars)
-            print(f"[DEBUG] get_progress: 逐行模式，{completed_chars}/{total_chars}字符，进度{progress:.1%}")
+            progress = min(1.0, self.virtual_time / self.timeline.total_time)
+            print(f"[DEBUG] get_progress: 逐行模式，{self.virtual_time:.1f}/{self.timeline.total_time:.1f}秒，进度{progress:.1%}")
             return progress
         
         else:
-            # 按页模式：基于页面的进度，考虑页面内进度
-            base_progress = self.current_page / len(self.pages)
-            
-            # 如果正在阅读当前页且有进度追踪信息，计算页面内进度
-            page_internal_progress = 0.0
-            if (self.is_reading and self.page_reading_start_time > 0 and 
-                self.page_reading_duration > 0 and self.current_page < len(self.pages)):
-                
-                elapsed_time = time.time() - self.page_reading_start_time
-                page_progress = min(1.0, elapsed_time / self.page_reading_duration)
-                # 页面内进度贡献到总进度
-                page_internal_progress = page_progress / len(self.pages)
-                
-                print(f"[DEBUG] get_progress: 页面内进度 {page_progress:.1%}, 贡献 {page_internal_progress:.1%}")
-            
-            total_progress = min(1.0, base_progress + page_internal_progress)
-            print(f"[DEBUG] get_progress: 按页模式，基础{self.current_page}/{len(self.pages)}页={base_progress:.1%}, "
-                  f"页面内+{page_internal_progress:.1%}, 总进度{total_progress:.1%}")
-            return total_progress
+            # 按页模式：已读完页面的停留时间之和加上当前页已停留时间
+            page_time_prefix = self.timeline.page_time_prefix
+            if self.current_page >= len(self.pages) or page_time_prefix[-1] <= 0:
+                return 1.0
+            elapsed = page_time_prefix[self.current_page]
+            if self.is_reading and self.page_reading_duration > 0:
+                elapsed += min(self.page_reading_duration, self.clock.now() - self.page_reading_start_time)
+            progress = min(1.0, elapsed / page_time_prefix[-1])
+            print(f"[DEBUG] get_progress: 按页模式，页{self.current_page}/{len(self.pages)}，进度{progress:.1%}")
+            return progress
     
     def get_remaining_time(self) -> int:
         """获取剩余阅读时间（秒）"""
-        if not self.current_article or not self.pages or not self.is_reading:
+        if not self.current_article or not self.pages or not self.is_reading or not self.timeline:
             return 0
         
-        if self.mode == 'line':
-            # 逐行模式：基于剩余字符数计算时间
-            total_chars = sum(len(line) for page in self.pages for line in page)
-            completed_chars = 0
-            
-            # 已完成的页面
-            for page_idx in range(self.current_page):
-                page_chars = sum(len(line) for line in self.pages[page_idx])
-                completed_chars += page_chars
-            
-            # 当前页面已完成的行
-            if self.current_page < len(self.pages):
-                current_page = self.pages[self.current_page]
-                for line_idx in range(self.current_line_in_page):
-                    if line_idx < len(current_page):
-                        line_chars = len(current_page[line_idx])
-                        completed_chars += line_chars
-                
-                # 当前行已处理的字符
-                completed_chars += self.chars_in_current_line
-            
-            remaining_chars = max(0, total_chars - completed_chars)
-            
-            # 考虑渐隐时间，每个字符需要渐隐几个级别
-            chars_per_minute = self.reading_speed
-            remaining_minutes = remaining_chars / chars_per_minute
-            remaining_seconds = int(remaining_minutes * 60)
-            
-            print(f"[DEBUG] 剩余时间: {remaining_chars}字符, {remaining_seconds}秒")
+        if self.mode in TIMED_MODES:
+            # 逐行模式：时间轴总时长减去虚拟时间（含行末、空行和换页停顿）
+            remaining_seconds = int(max(0.0, self.timeline.total_time - self.virtual_time))
+            print(f"[DEBUG] 剩余时间: {remaining_seconds}秒")
             return remaining_seconds
         
         else:
-            # 按页模式：基于剩余页面数计算时间，考虑当前页面内剩余时间
-            remaining_full_pages = max(0, len(self.pages) - self.current_page - 1)
-            
-            # 估算每页的平均字符数和阅读时间
-            avg_chars_per_page = sum(len(line) for page in self.pages for line in page) / len(self.pages) if self.pages else 0
-            chars_per_minute = self.reading_speed
-            minutes_per_page = avg_chars_per_page / chars_per_minute
-            
-            # 后续完整页面的时间
-            full_pages_seconds = int(remaining_full_pages * minutes_per_page * 60)
-            
-            # 当前页面的剩余时间
-            current_page_remaining_seconds = 0
-            if (self.current_page < len(self.pages) and self.is_reading and 
-                self.page_reading_start_time > 0 and self.page_reading_duration > 0):
-                
-                elapsed_time = time.time() - self.page_reading_start_time
-                current_page_remaining_seconds = max(0, int(self.page_reading_duration - elapsed_time))
-                
-                print(f"[DEBUG] 当前页剩余时间: {current_page_remaining_seconds}秒 "
-                      f"(已过{elapsed_time:.1f}秒/总{self.page_reading_duration:.1f}秒)")
-            elif self.current_page < len(self.pages):
-                # 如果当前页还没开始阅读，计算当前页的完整时间
-                current_page_lines = self.pages[self.current_page]
-                page_text = '\n'.join(current_page_lines)
-                char_count = len([c for c in page_text if c.strip()])
-                current_page_duration = max(2.0, min(20.0, (char_count * 60.0) / self.reading_speed))
-                current_page_remaining_seconds = int(current_page_duration)
-                
-                print(f"[DEBUG] 当前页未开始，计算完整时间: {current_page_remaining_seconds}秒")
-            
-            total_remaining_seconds = full_pages_seconds + current_page_remaining_seconds
-            
-            print(f"[DEBUG] 剩余时间: 当前页{current_page_remaining_seconds}秒 + {remaining_full_pages}完整页{full_pages_seconds}秒 = {total_remaining_seconds}秒")
-            return total_remaining_seconds
+            # 按页模式：后续各页停留时间之和（前缀和相减）加上当前页剩余时间
+            if self.current_page >= len(self.pages):
+                return 0
+            page_time_prefix = self.timeline.page_time_prefix
+            later_pages_seconds = page_time_prefix[-1] - page_time_prefix[self.current_page + 1]
+            if self.page_reading_duration > 0:
+                current_page_seconds = max(0.0, self.page_reading_duration - (self.clock.now() - self.page_reading_start_time))
+            else:
+                current_page_seconds = self.timeline.page_durations[self.current_page]
+            remaining_seconds = int(later_pages_seconds + current_page_seconds)
+            print(f"[DEBUG] 剩余时间: 当前页{current_page_seconds:.1f}秒 + 后续页{later_pages_seconds:.1f}秒 = {remaining_seconds}秒")
+            return remaining_seconds
     
     def has_questions(self) -> bool:
         """检查当前文章是否有问题"""
@@ -1012,213 +1042,64 @@ class ReadingController:
         """检查是否处于问题模式"""
         return self.is_question_mode
     
+    def enter_question_mode(self):
+        """进入问题模式（阅读完成后由界面调用）"""
+        self.is_question_mode = True
+        print(f"[DEBUG] 进入问题模式")
+
     def exit_question_mode(self):
         """退出问题模式"""
         self.is_question_mode = False
         print(f"[DEBUG] 退出问题模式") 
 
-    def _calculate_absolute_position(self, page_idx: int, line_idx: int, char_idx: int) -> int:
-        """计算字符的绝对位置，基于原始文档的连续性"""
-        absolute_pos = 0
-        
-        # 计算总的行索引（在整个文档中）
-        total_line_idx = 0
-        for p in range(page_idx):
-            if p < len(self.pages):
-                total_line_idx += len(self.pages[p])
-        total_line_idx += line_idx
-        
-        # 计算到目标行之前的所有字符数
-        current_line_count = 0
-        for p in range(len(self.pages)):
-            page_lines = self.pages[p]
-            for l, line in enumerate(page_lines):
-                if current_line_count >= total_line_idx:
-                    break
-                    
-                absolute_pos += len(line)
-                # 除了整个文档的最后一行，每行后都有换行符
-                if not (p == len(self.pages) - 1 and l == len(page_lines) - 1):
-                    absolute_pos += 1  # +1 for newline
-                    
-                current_line_count += 1
-            
-            if current_line_count >= total_line_idx:
-                break
-        
-        # 加上当前行的字符偏移
-        absolute_pos += char_idx
-        
-        return absolute_pos
-    
-    def _fade_character_complete(self, absolute_pos: int, char_key: tuple, current_char: str, start_fade_level: int, char_delay: float) -> bool:
-        """优化版：高效地渐隐一个字符，减少中间状态和UI更新次数"""
-        page_idx, line_idx, char_idx = char_key
-        
-        # 检查是否应该停止
-        if not self.is_reading:
-            with self._state_lock:
-                self._absolute_char_states[absolute_pos] = 'faded'
-                self.char_states[char_key] = 'faded'
-            self._schedule_batch_update()  # 批量更新而非立即更新
-            return False
-        
-        # 优化：根据渐隐级别数决定处理策略
-        if self.fading_levels <= 2:
-            # 简化模式：只有正常 -> 渐隐中 -> 消失，减少中间状态
-            return self._fade_character_simplified(absolute_pos, char_key, current_char, char_delay)
-        else:
-            # 传统模式：保持原有的多级渐隐（已优化）
-            return self._fade_character_traditional(absolute_pos, char_key, current_char, start_fade_level, char_delay)
-    
-    def _fade_character_simplified(self, absolute_pos: int, char_key: tuple, current_char: str, char_delay: float) -> bool:
-        """简化版渐隐：只有三个状态 - normal -> fading_1 -> faded"""
-        page_idx, line_idx, char_idx = char_key
-        
-        # 计算每个状态的持续时间
-        state_duration = char_delay
-        
-        # 状态1: 正常 -> 渐隐中
-        with self._state_lock:
-            self._absolute_char_states[absolute_pos] = 'fading_1'
-            self.char_states[char_key] = 'fading_1'
-        
-        # 安排批量更新而非立即更新
-        self._schedule_batch_update()
-        
-        # 等待一半时间
-        if not self._interruptible_sleep(state_duration):
-            return False
-        
-        # 状态2: 渐隐中 -> 完全消失
-        with self._state_lock:
-            self._absolute_char_states[absolute_pos] = 'faded'
-            self.char_states[char_key] = 'faded'
-        
-        # 最终状态更新
-        self._schedule_batch_update()
-        
-        return True
-    
-    def _fade_character_traditional(self, absolute_pos: int, char_key: tuple, current_char: str, start_fade_level: int, char_delay: float) -> bool:
-        """传统版渐隐：支持多级渐隐，但优化了更新频率"""
-        page_idx, line_idx, char_idx = char_key
-        
-        for fade_level in range(start_fade_level, self.fading_levels + 1):
-            if not self.is_reading:
-                with self._state_lock:
-                    self._absolute_char_states[absolute_pos] = 'faded'
-                    self.char_states[char_key] = 'faded'
-                self._schedule_batch_update()
-                return False
-            
-            # 设置渐隐状态
-            if fade_level == 0:
-                state = 'normal'
-            elif fade_level < self.fading_levels:
-                state = f'fading_{fade_level}'
-            else:
-                state = 'faded'
-            
-            # 线程安全地更新状态
-            with self._state_lock:
-                self._absolute_char_states[absolute_pos] = state
-                self.char_states[char_key] = state
-            
-            # 批量更新UI，避免每次状态变化都更新
-            self._schedule_batch_update()
-            
-            # 等待渐隐时间（最后一级不等待）
-            if fade_level < self.fading_levels:
-                if not self._interruptible_sleep(char_delay):
-                    return False
-        
-        return True
-    
-    def _interruptible_sleep(self, duration: float) -> bool:
-        """可中断的睡眠，优化了响应性"""
-        # 减少分段数，从20降到5，提高效率
-        sleep_segments = 5
-        segment_time = duration / sleep_segments
-        
-        for _ in range(sleep_segments):
-            if not self.is_reading:
-                return False
-            
-            # 处理暂停（优化：减少暂停检查频率）
-            if self.is_paused:
-                while self.is_paused and self.is_reading:
-                    time.sleep(0.1)
-                if not self.is_reading:
-                    return False
-            
-            time.sleep(segment_time)
-        
-        return True 
-
-    def _validate_and_cleanup_states(self):
-        """验证并清理字符状态，确保状态一致性"""
-        if not self.pages:
+    def configure_layout(self, text_widget, available_height: int, font_size: int, line_spacing: float,
+                         max_line_length: int, lines_per_page: int, line_height: Optional[float] = None):
+        """一次性设置所有布局参数并只分页一次（保持当前阅读进度）"""
+        layout = (text_widget, available_height, font_size, line_spacing,
+                  max_line_length, lines_per_page, line_height)
+        current_layout = (self.text_widget, self.available_height, self.font_size, self.line_spacing,
+                          self.max_line_length, self.lines_per_page, self.measured_line_height)
+        if layout == current_layout and self.pages:
+            print(f"[DEBUG] 布局参数未变化，跳过重新分页")
             return
-            
-        with self._state_lock:
-            # 计算文档总字符数
-            total_chars = 0
-            for page in self.pages:
-                for line in page:
-                    total_chars += len(line)
-            
-            # 清理无效的绝对位置状态
-            invalid_absolute_keys = [
-                pos for pos in self._absolute_char_states.keys() 
-                if pos < 0 or pos >= total_chars
-            ]
-            
-            for key in invalid_absolute_keys:
-                del self._absolute_char_states[key]
-            
-            # 清理无效的相对位置状态
-            invalid_relative_keys = [
-                key for key in self.char_states.keys()
-                if (key[0] >= len(self.pages) or 
-                    key[1] >= len(self.pages[key[0]]) if key[0] < len(self.pages) else True or
-                    key[2] >= len(self.pages[key[0]][key[1]]) if key[0] < len(self.pages) and key[1] < len(self.pages[key[0]]) else True)
-            ]
-            
-            for key in invalid_relative_keys:
-                del self.char_states[key]
-            
-            if invalid_absolute_keys or invalid_relative_keys:
-                print(f"[DEBUG] 状态清理: 删除了 {len(invalid_absolute_keys)} 个无效绝对位置状态, {len(invalid_relative_keys)} 个无效相对位置状态")
-                print(f"[DEBUG] 当前状态: {len(self._absolute_char_states)} 个绝对位置状态, {len(self.char_states)} 个相对位置状态")
-
-    def _schedule_batch_update(self):
-        """安排批量更新，避免过于频繁的UI更新"""
-        if self.pending_updates:
-            return  # 已经有待处理的更新
-        
-        self.pending_updates = True
-        # 延迟少量时间后执行批量更新
-        if self.update_callback:
-            # 使用threading.Timer而不是window.after，因为这里是在后台线程中
-            if self.batch_timer:
-                self.batch_timer.cancel()
-            
-            self.batch_timer = threading.Timer(self.batch_update_interval, self._execute_batch_update)
-            self.batch_timer.start()
-    
-    def _execute_batch_update(self):
-        """执行批量更新"""
-        self.pending_updates = False
-        self.batch_timer = None
         
-        if self.update_callback:
-            self.update_callback() 
-
-    def set_text_widget_reference(self, text_widget, available_height: int, font_size: int, line_spacing: float = 1.5):
-        """设置文本控件引用和显示参数，用于智能分页"""
         self.text_widget = text_widget
         self.available_height = available_height
         self.font_size = font_size
         self.line_spacing = line_spacing
-        print(f"[DEBUG] 设置智能分页参数: 高度{available_height}px, 字体{font_size}pt, 行距{line_spacing}") 
\ No newline at end of file
+        self.max_line_length = max_line_length
+        self.lines_per_page = lines_per_page
+        self.measured_line_height = line_height
+        print(f"[DEBUG] 设置布局参数: 高度{available_height}px, 字体{font_size}pt, 行距{line_spacing}, "
+              f"每行{max_line_length}字符, 每页{lines_per_page}行")
+        
+        if not self.current_article:
+            return
+        if self.pages and self.get_progress() > 0:
+            self._reformat_and_repaginate()
+        else:
+            self._create_pages()
+    
+    def request_layout(self, text_widget, available_height: int, font_size: int, line_spacing: float,
+                       max_line_length: int, lines_per_page: int, line_height: Optional[float] = None):
+        """提交布局变化命令：阅读线程运行时在字符之间原子地应用，否则立即应用"""
+        if line_height is None and text_widget is not None:
+            # 在调用方（GUI）线程测量行高，阅读线程不能访问Tk控件；测量不写入控制器状态
+            line_height = measure_line_height(text_widget, font_size, line_spacing)
+        
+        layout = {
+            'text_widget': text_widget,
+            'available_height': available_height,
+            'font_size': font_size,
+            'line_spacing': line_spacing,
+            'max_line_length': max_line_length,
+            'lines_per_page': lines_per_page,
+            'line_height': line_height,
+        }
+        self._post('layout', layout)
+    
+    def _cmd_layout(self, layout: dict):
+        """命令：应用布局参数（只分页一次）"""
+        self.configure_layout(**layout)
+        print(f"[DEBUG] 已应用布局命令: {len(self.pages)} 页")
+    
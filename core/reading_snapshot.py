@@ -0,0 +1,29 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 阅读状态快照
+"""
+from dataclasses import dataclass, field
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ReadingSnapshot:
+    """阅读状态的不可变快照
+
+    控制器在每帧结束时整体替换快照，界面线程无需加锁即可读取；
+    只有可见内容变化时版本号才会递增，界面据此跳过没有变化的帧。
+    """
+    version: int = field(default=0, compare=False)  # 版本号不参与内容比较
+    mode: str = 'line'
+    page_index: int = 0
+    page_count: int = 0
+    text: str = ''  # 当前页显示文本
+    fade_bands: Tuple[Tuple[int, int, str], ...] = ()  # 渐隐色带：(页内起始位置, 页内结束位置, 状态)
+    pacer_band: Tuple[int, ...] = ()  # 导读光标：(页内起始位置, 页内结束位置)，不显示时为空
+    progress: float = 0.0
+    remaining_seconds: int = 0
+    is_reading: bool = False
+    is_paused: bool = False
+    reading_finished: bool = False
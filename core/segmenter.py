@@ -0,0 +1,139 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 意群切分
+"""
+import os
+from functools import lru_cache
+from typing import List, Tuple
+from core.article_parser import (STRONG_BREAK_MARKS, WEAK_BREAK_MARKS, LATIN_STRONG_MARKS, LATIN_WEAK_MARKS,
+                                 NO_LINE_END, is_ideographic)
+
+GRANULARITIES = ('char', 'word', 'phrase', 'line')  # 逐字、逐词、短语、整行
+PHRASE_MAX_CHARS = 8  # 短语最多包含的非空白字符数（遇到标点提前断开）
+DICTIONARY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cjk_words.txt')
+PHRASE_END_MARKS = STRONG_BREAK_MARKS + WEAK_BREAK_MARKS + LATIN_STRONG_MARKS + LATIN_WEAK_MARKS
+
+
+class WordTrie:
+    """词典前缀树，用于正向最大匹配"""
+
+    def __init__(self):
+        self.root: dict = {}
+        self.max_length = 1
+
+    def add(self, word: str):
+        """加入一个词"""
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True  # 空字符串键标记词尾
+        self.max_length = max(self.max_length, len(word))
+
+    def longest_match(self, text: str, start: int) -> int:
+        """从start开始能匹配到的最长词的长度，没有匹配返回0"""
+        node = self.root
+        longest = 0
+        end = min(len(text), start + self.max_length)
+        for i in range(start, end):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if '' in node:
+                longest = i - start + 1
+        return longest
+
+
+@lru_cache(maxsize=1)
+def load_dictionary() -> WordTrie:
+    """首次逐词切分时才读取内置词典并建立前缀树"""
+    trie = WordTrie()
+    try:
+        with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                word = line.strip()
+                if word and not word.startswith('#'):
+                    trie.add(word)
+        print(f"[DEBUG] 分词词典已加载: 最长词{trie.max_length}字")
+    except OSError as e:
+        print(f"[DEBUG] 加载分词词典失败: {e}，汉字将两两成词")
+    return trie
+
+
+def _word_starts(text: str) -> List[int]:
+    """正向最大匹配切词，返回各词的起始列；空白和左括号并入下一个词，其余标点并入上一个词"""
+    trie = load_dictionary()
+    starts = []
+    pending = None  # 等待并入下一个词的空白或左括号的起点
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char.isspace() or char in NO_LINE_END:
+            if pending is None:
+                pending = i
+            i += 1
+            continue
+        if not char.isalnum() and starts and pending is None:
+            i += 1  # 标点跟随前一个词
+            continue
+
+        starts.append(i if pending is None else pending)
+        pending = None
+        if is_ideographic(char):
+            matched = trie.longest_match(text, i)
+            if not matched:
+                # 词典未收录：与下一个同样未收录的汉字组成两字词，接近汉语词的平均长度
+                matched = 1
+                if (i + 1 < length and is_ideographic(text[i + 1]) and
+                        trie.longest_match(text, i + 1) < 2):
+                    matched = 2
+            i += matched
+        elif char.isalnum():
+            # 英文单词和数字按连续字母数字切分
+            i += 1
+            while i < length and text[i].isalnum() and not is_ideographic(text[i]):
+                i += 1
+        else:
+            i += 1
+
+    if pending is not None and not starts:
+        starts.append(pending)
+    return starts
+
+
+def _phrase_starts(text: str) -> List[int]:
+    """把相邻的词合并成短语：遇到标点或超过PHRASE_MAX_CHARS个字符时断开"""
+    words = _word_starts(text)
+    starts = []
+    phrase_chars = 0
+    for k, start in enumerate(words):
+        end = words[k + 1] if k + 1 < len(words) else len(text)
+        word = text[start:end]
+        word_chars = len(word.strip())
+        if not starts or phrase_chars + word_chars > PHRASE_MAX_CHARS:
+            starts.append(start)
+            phrase_chars = 0
+        phrase_chars += word_chars
+        if word.rstrip() and word.rstrip()[-1] in PHRASE_END_MARKS:
+            phrase_chars = PHRASE_MAX_CHARS + 1  # 标点之后开始新短语
+    return starts
+
+
+@lru_cache(maxsize=8192)
+def chunk_starts(text: str, granularity: str) -> Tuple[int, ...]:
+    """按渐隐单位切分一行，返回各单元的起始列（升序，首个为0）；逐字时每个字符一个单元"""
+    if not text:
+        return ()
+    if granularity == 'line':
+        return (0,)
+    if granularity == 'word':
+        starts = _word_starts(text)
+    elif granularity == 'phrase':
+        starts = _phrase_starts(text)
+    else:
+        return tuple(range(len(text)))
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    return tuple(starts)
@@ -17,14 +17,23 @@ class Settings:
                 'font_size': '60',
                 'line_spacing': '1.5',
                 'reading_speed': '300',  # 字符每分钟
+                'high_speed_mode': 'False',  # 高速模式：速度上限从1200提高到5000
                 'background_color': 'white',
                 'text_color': 'black',
-                'mode': 'line',  # 'line' or 'page'
+                'mode': 'line',  # 'line', 'pacer' or 'page'
+                'pacer_color': '#FFE08A',  # 导读光标的高亮颜色
+                'page_break_mode': 'greedy',  # 'greedy' or 'optimal'
+                'engine_mode': 'thread',  # 'thread' 后台阅读线程 or 'tick' 主线程定时驱动
+                'renderer': 'text',  # 正文渲染方式：'text' Text控件标签, 'canvas' 画布文本项, 'image' Pillow整页图像
+                'granularity': 'char',  # 渐隐单位：'char' 逐字, 'word' 逐词, 'phrase' 短语, 'line' 整行
+                'line_turn_pause': '0.5',  # 逐行和导读光标模式换页后的停顿（秒）
+                'page_turn_pause': '0.3',  # 按页模式的页间停顿（秒）
             },
             'app': {
                 'last_folder': '',
                 'window_width': '1200',
                 'window_height': '800',
+                'prepaginate_library': 'False',  # 加载文章库后在后台预分页
             }
         }
         self.load_settings()
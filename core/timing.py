@@ -0,0 +1,53 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 字符计时表
+"""
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List
+
+SENTENCE_END_MARKS = '。！？!?'  # 句末标点：读到这里多停顿一会儿
+SENTENCE_END_WEIGHT = 3.0  # 句末标点的时间权重（普通字符为1）
+PAGE_MIN_DURATION = 2.0  # 按页模式每页最少停留时间（秒）
+PAGE_MAX_DURATION = 20.0  # 按页模式每页最多停留时间（秒）
+
+
+def char_weight(char: str) -> float:
+    """单个字符的时间权重：空白不占时间，句末标点带停顿，其余为1"""
+    if char.isspace():
+        return 0.0
+    if char in SENTENCE_END_MARKS:
+        return SENTENCE_END_WEIGHT
+    return 1.0
+
+
+def page_duration(units: float, char_duration: float) -> float:
+    """按页模式一页的停留时间（秒）"""
+    return max(PAGE_MIN_DURATION, min(PAGE_MAX_DURATION, units * char_duration))
+
+
+class TimingTable:
+    """全文逐字符时间权重的前缀和
+
+    prefix[i] 为前 i 个字符的权重之和（单位：普通字符的阅读时长），
+    任意区间的阅读量为两次查表相减，由阅读量反查位置为一次二分查找。
+    """
+
+    def __init__(self, text: str):
+        self.prefix: List[float] = [0.0]
+        self.prefix.extend(accumulate(char_weight(char) for char in text))
+
+    @property
+    def total(self) -> float:
+        """全文总权重"""
+        return self.prefix[-1]
+
+    def units(self, start: int, end: int) -> float:
+        """区间 [start, end) 的总权重"""
+        return self.prefix[end] - self.prefix[start]
+
+    def index_at(self, units: float, lo: int, hi: int) -> int:
+        """在 [lo, hi] 内查找前缀权重不超过units的最后一个位置"""
+        return max(lo, bisect_right(self.prefix, units, lo, hi + 1) - 1)
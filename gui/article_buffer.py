@@ -0,0 +1,55 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 共享全文缓冲
+"""
+import tkinter as tk
+from typing import Optional
+from core.article_parser import Article
+
+
+class TextPeer(tk.Text):
+    """Tk文本对等控件（text peer）：与源控件共享同一份文本、标签和标记，只有显示和排版是自己的
+
+    Text.peer_create只创建Tk控件而不返回Python对象，这里按普通控件注册路径后由源控件创建对等控件。
+    """
+
+    def __init__(self, master: tk.Misc, source: tk.Text, cnf: Optional[dict] = None, **kw):
+        cnf = dict(cnf or {})
+        self.widgetName = 'text'
+        tk.BaseWidget._setup(self, master, cnf)
+        source.peer_create(self._w, cnf, **kw)
+
+
+class ArticleBuffer:
+    """一篇文章全文的共享文本缓冲
+
+    全文只插入一次，保存在从不显示的源控件中；阅读窗口的全文视图和通览窗口都是它的对等控件，
+    打开时不再复制和插入全文。对等控件之间共享标签定义，content标签的间距在这里统一设置。
+    """
+
+    def __init__(self, master: tk.Misc):
+        self.source = tk.Text(master, wrap='word', state='disabled')  # 只保存内容，不布局显示
+        self.article: Optional[Article] = None
+
+    def load(self, article: Article):
+        """载入文章全文；同一篇文章不重复插入"""
+        if article is self.article:
+            return
+        self.source.config(state='normal')
+        self.source.delete(1.0, tk.END)
+        # 使用原始内容，保持自然段落结构
+        self.source.insert(1.0, article.original_content, 'content')
+        self.source.config(state='disabled')
+        self.article = article
+        print(f"[GUI-DEBUG] 全文缓冲已载入《{article.title}》，长度: {len(article.original_content)}")
+
+    def configure_spacing(self, line_spacing: float):
+        """设置content标签的段落和行间距（所有对等控件同时生效）"""
+        self.source.tag_configure('content', spacing1=10, spacing3=10, spacing2=int(line_spacing * 10))
+
+    def create_peer(self, master: tk.Misc, **options) -> TextPeer:
+        """创建显示全文的只读对等控件"""
+        return TextPeer(master, self.source, wrap='word', relief='flat', borderwidth=0,
+                        state='disabled', cursor='arrow', **options)
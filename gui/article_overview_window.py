@@ -9,12 +9,14 @@ from tkinter import ttk
 from typing import Optional
 from core.article_parser import Article
 from core.settings import Settings
+from gui.article_buffer import ArticleBuffer
 
 class ArticleOverviewWindow:
-    def __init__(self, parent, article: Article, settings: Settings):
+    def __init__(self, parent, article: Article, settings: Settings, article_buffer: Optional[ArticleBuffer] = None):
         self.parent = parent
         self.article = article
         self.settings = settings
+        self.article_buffer = article_buffer  # 阅读窗口的共享全文缓冲；没有时自建一个
         self.window: Optional[tk.Toplevel] = None
         
         self.create_window()
@@ -82,25 +84,19 @@ class ArticleOverviewWindow:
         text_frame = ttk.Frame(main_frame)
         text_frame.pack(fill='both', expand=True)
         
-        # 文本显示区域
-        self.text_display = tk.Text(
+        # 文本显示区域：共享全文缓冲的对等控件，不再复制全文
+        if self.article_buffer is None:
+            self.article_buffer = ArticleBuffer(self.window)
+        self.text_display = self.article_buffer.create_peer(
             text_frame,
-            wrap='word',
             font=('Microsoft YaHei', self.settings.get_int('reading', 'font_size', 20)),
             bg=self.settings.get('reading', 'background_color', 'white'),
-            fg=self.settings.get('reading', 'text_color', 'black'),
-            relief='flat',
-            borderwidth=0,
-            state='disabled',
-            cursor='arrow'
+            fg=self.settings.get('reading', 'text_color', 'black')
         )
         
-        # 设置行间距
+        # 设置行间距（标签定义由所有对等控件共享）
         line_spacing = self.settings.get_float('reading', 'line_spacing', 1.5)
-        self.text_display.tag_configure('content', 
-                                       spacing1=10, 
-                                       spacing3=10, 
-                                       spacing2=int(line_spacing * 10))
+        self.article_buffer.configure_spacing(line_spacing)
         
         # 滚动条
         scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=self.text_display.yview)
@@ -123,12 +119,8 @@ class ArticleOverviewWindow:
         self.window.protocol("WM_DELETE_WINDOW", self.close_window)
     
     def load_article_content(self):
-        """加载文章内容"""
-        self.text_display.config(state='normal')
-        self.text_display.delete(1.0, tk.END)
-        # 使用原始内容，保持自然段落结构
-        self.text_display.insert(1.0, self.article.original_content, 'content')
-        self.text_display.config(state='disabled')
+        """加载文章内容（共享缓冲中已是这篇文章时无需插入）"""
+        self.article_buffer.load(self.article)
         
         # 滚动到顶部
         self.text_display.see(1.0)
@@ -0,0 +1,260 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 画布正文渲染
+"""
+import tkinter as tk
+import tkinter.font as tkfont
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
+from core.article_parser import build_break_index
+from core.fade_model import fade_palette
+
+LINE_PADDING = 10  # 段前段后间距（像素），与Text控件content标签的spacing1/spacing3一致
+PACER_TAG = 'pacer'  # 导读光标矩形的画布标签
+
+
+def layout_page(text: str, width: int, char_width: Callable[[str], int], linespace: int,
+                line_spacing: float) -> List[Tuple[int, int, int]]:
+    """按宽度排版一页文本，返回每个页内位置（含换行符）的 (x, y, 宽度)
+
+    折行位置取文章分行所用的断行机会（BreakIndex），不拆开英文单词，也不把标点挤到行首；
+    显示行内没有断行机会时才在字符处折断，与Text控件的wrap='word'一致。
+    段前段后间距和折行间距与Text控件content标签的spacing1/spacing3/spacing2一致。
+    """
+    wrap_spacing = int(line_spacing * 10)
+    boxes = []
+    y = 0
+    for line in text.split('\n'):
+        y += LINE_PADDING
+        index = build_break_index(line)
+        breaks = set(index.strong + index.weak + index.space + index.ideographic)
+        line_start = len(boxes)
+        row_start = 0  # 当前显示行第一个字符在本行中的位置
+        last_break = -1  # 当前显示行内最近的断行机会
+        x = 0
+        for i, char in enumerate(line):
+            if i > row_start and i in breaks:
+                last_break = i
+            w = char_width(char)
+            # 行尾空白与Text控件一样悬挂在行末，不引起折行
+            while x > 0 and x + w > width and not char.isspace():
+                # 把最近断行机会之后的字符移到下一显示行
+                row_start = last_break if last_break > row_start else i
+                last_break = -1
+                x = 0
+                y += linespace + wrap_spacing
+                for k in range(line_start + row_start, line_start + i):
+                    moved = boxes[k][2]
+                    boxes[k] = (x, y, moved)
+                    x += moved
+            boxes.append((x, y, w))
+            x += w
+        boxes.append((x, y, 0))  # 换行符
+        y += linespace + LINE_PADDING
+    return boxes
+
+
+def row_spans(boxes: List[Tuple[int, int, int]], start: int, end: int) -> List[List[int]]:
+    """把页内区间 [start, end) 按显示行拆成 [x0, y, x1] 段"""
+    spans = []
+    for x, y, width in boxes[start:min(end, len(boxes))]:
+        if spans and spans[-1][1] == y:
+            spans[-1][2] = x + width
+        else:
+            spans.append([x, y, x + width])
+    return spans
+
+
+class CanvasPage:
+    """双缓冲中的一块画布及其上一页的排版和绘制状态"""
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self.layout_key: Optional[Tuple[str, int]] = None  # 当前排版对应的 (页面文本, 画布宽度)
+        self.items: List[Optional[int]] = []  # 页内位置 -> 文本项（换行符为None）
+        self.boxes: List[Tuple[int, int, int]] = []  # 页内位置 -> (x, y, 宽度)
+        self.fills: List[str] = []  # 页内位置 -> 当前颜色
+        self.ranges: Dict[str, Tuple[int, int]] = {}  # {状态: 当前覆盖的 [起始位置, 结束位置)}
+        self.pacer_band: Tuple[int, ...] = ()
+        self.pacer_items: List[int] = []  # 导读光标矩形（每个显示行一个，复用）
+
+    def clear(self):
+        """删除全部画布项和排版"""
+        self.canvas.delete('all')
+        self.layout_key = None
+        self.items = []
+        self.boxes = []
+        self.fills = []
+        self.ranges = {}
+        self.pacer_band = ()
+        self.pacer_items = []
+
+
+class CanvasTextRenderer:
+    """把页面文本一次性排版到Canvas上，每个字符一个文本项
+
+    页面文本和画布宽度不变时不再重新排版；渐隐只对状态变化的字符调用
+    itemconfigure(fill=...)，导读光标是文字下方的矩形，每帧只移动坐标。
+    两块画布双缓冲：阅读当前页时在被遮住的后台画布上排好下一页，翻页只交换层级。
+    与Text控件渲染器接口相同，可以互相替换。
+    """
+
+    def __init__(self, canvas: tk.Canvas, cover: tk.Widget, fading_levels: int):
+        self.cover = cover  # 画布显示时覆盖的控件（阅读窗口中的Text控件）
+        self.fading_levels = fading_levels
+        self.palette: Dict[str, str] = {}  # {状态: 颜色}
+        self.text_color = 'black'
+        self.pacer_color: Optional[str] = None
+        self.font = tkfont.Font(family='Microsoft YaHei', size=12)
+        self.line_spacing = 1.5
+        self._char_widths: Dict[str, int] = {}  # 字符宽度缓存（随字体失效）
+        back_canvas = tk.Canvas(canvas.master, highlightthickness=0, borderwidth=0, cursor=canvas.cget('cursor'))
+        self._front = CanvasPage(canvas)
+        self._back = CanvasPage(back_canvas)
+        self._shown = False  # 画布是否已覆盖在主文本框上
+
+    @property
+    def pages(self) -> Tuple[CanvasPage, CanvasPage]:
+        """前台和后台两块画布"""
+        return self._front, self._back
+
+    def configure_font(self, family: str, size: int, line_spacing: float):
+        """设置字体和行间距，下一帧重新排版"""
+        self.font = tkfont.Font(family=family, size=size)
+        self.line_spacing = line_spacing
+        self._char_widths = {}
+        for page in self.pages:
+            page.clear()
+
+    def configure_palette(self, text_color: str, background_color: str, fading_levels: Optional[int] = None):
+        """按文字颜色和背景颜色重新计算调色板"""
+        if fading_levels is not None:
+            self.fading_levels = fading_levels
+        self.palette = fade_palette(self.fading_levels, self._rgb(text_color), self._rgb(background_color))
+        self.text_color = text_color
+        for page in self.pages:
+            page.canvas.configure(bg=background_color)
+            page.clear()
+
+    def _rgb(self, color: str) -> Tuple[int, int, int]:
+        """颜色名转换为0-255的RGB"""
+        return tuple(channel >> 8 for channel in self.cover.winfo_rgb(color))
+
+    def configure_pacer(self, color: str):
+        """设置导读光标的高亮颜色"""
+        self.pacer_color = color
+        for page in self.pages:
+            for item in page.pacer_items:
+                page.canvas.itemconfigure(item, fill=color)
+
+    def prefetch(self, text: str):
+        """在被遮住的后台画布上排好下一页，翻页时直接交换"""
+        width = max(1, self.cover.winfo_width())
+        if text and (text, width) not in (self._front.layout_key, self._back.layout_key):
+            self._layout(self._back, text, width)
+
+    def invalidate(self):
+        """隐藏画布，露出下面的主文本框；排版保留，再次显示时不必重新排版"""
+        for page in self.pages:
+            page.canvas.place_forget()
+        self._shown = False
+
+    def close(self):
+        """窗口销毁时调用；画布随窗口销毁，没有需要停止的后台任务"""
+
+    def _stack(self):
+        """前台画布覆盖主文本框，后台画布藏在前台画布之下"""
+        front, back = self._front.canvas, self._back.canvas
+        for canvas in (back, front):
+            canvas.place(in_=self.cover, x=0, y=0, relwidth=1, relheight=1)
+        tk.Misc.lift(front, self.cover)  # Canvas.lift是图形项的层级操作，这里要调整的是控件层级
+        tk.Misc.lower(back, front)
+
+    def _char_width(self, char: str) -> int:
+        """单个字符的像素宽度"""
+        width = self._char_widths.get(char)
+        if width is None:
+            width = self._char_widths[char] = self.font.measure(char)
+        return width
+
+    def _layout(self, page: CanvasPage, text: str, width: int):
+        """按画布宽度折行排版，为每个字符创建文本项"""
+        page.clear()
+        canvas = page.canvas
+        color = self.palette.get('normal', self.text_color)
+        page.boxes = layout_page(text, width, self._char_width, self.font.metrics('linespace'), self.line_spacing)
+        page.items = [canvas.create_text(x, y, text=char, anchor='nw', font=self.font, fill=color)
+                      if not char.isspace() else None
+                      for char, (x, y, _) in zip(text + '\n', page.boxes)]
+        page.fills = [color] * len(page.items)
+        page.ranges = {'normal': (0, len(page.items))}
+        page.layout_key = (text, width)
+        print(f"[GUI-DEBUG] 画布排版: {len(text)} 个字符, 宽度 {width}px")
+
+    def _recolor(self, page: CanvasPage, positions, bands: Tuple[Tuple[int, int, str], ...]) -> int:
+        """把指定位置的字符改为新色带中的颜色，返回实际修改的文本项数"""
+        starts = [start for start, _, _ in bands]
+        changed = 0
+        for pos in positions:
+            if pos >= len(page.items) or page.items[pos] is None:
+                continue
+            k = bisect_right(starts, pos) - 1
+            state = bands[k][2] if k >= 0 and pos < bands[k][1] else 'normal'
+            color = self.palette.get(state, self.text_color)
+            if color != page.fills[pos]:
+                page.canvas.itemconfigure(page.items[pos], fill=color)
+                page.fills[pos] = color
+                changed += 1
+        return changed
+
+    def _move_pacer(self, page: CanvasPage, pacer_band: Tuple[int, ...]):
+        """按显示行把导读光标区间拆成矩形，复用已有矩形"""
+        canvas = page.canvas
+        rects = row_spans(page.boxes, *pacer_band) if pacer_band else []
+        linespace = self.font.metrics('linespace')
+        while len(page.pacer_items) < len(rects):
+            item = canvas.create_rectangle(0, 0, 0, 0, width=0, fill=self.pacer_color or '', tags=PACER_TAG)
+            canvas.tag_lower(item)
+            page.pacer_items.append(item)
+        for k, item in enumerate(page.pacer_items):
+            if k < len(rects):
+                x0, y, x1 = rects[k]
+                canvas.coords(item, x0, y, x1, y + linespace)
+                canvas.itemconfigure(item, state='normal')
+            else:
+                canvas.itemconfigure(item, state='hidden')
+        page.pacer_band = pacer_band
+
+    def show(self, text: str, bands: Tuple[Tuple[int, int, str], ...], pacer_band: Tuple[int, ...] = ()) -> int:
+        """显示页面文本并应用色带和导读光标，返回本帧修改的画布项数"""
+        width = max(1, self.cover.winfo_width())
+        key = (text, width)
+        if key != self._front.layout_key and key == self._back.layout_key:
+            # 翻页：后台画布已经排好下一页，交换前后台即可
+            self._front, self._back = self._back, self._front
+            tk.Misc.lift(self._front.canvas, self._back.canvas)
+            print(f"[GUI-DEBUG] 翻页：交换前后台画布")
+        if not self._shown:
+            self._stack()
+            self._shown = True
+        page = self._front
+        if key != page.layout_key:
+            self._layout(page, text, width)
+
+        ranges = {state: (start, end) for start, end, state in bands}
+        positions = set()
+        for state in ranges.keys() | page.ranges.keys():
+            old_range = page.ranges.get(state, (0, 0))
+            new_range = ranges.get(state, (0, 0))
+            if old_range != new_range:
+                # 只有新旧区间的对称差中的字符改变了状态
+                positions.update(set(range(*old_range)) ^ set(range(*new_range)))
+        changed = self._recolor(page, sorted(positions), bands) if positions else 0
+        page.ranges = ranges
+
+        if self.pacer_color and pacer_band != page.pacer_band:
+            self._move_pacer(page, pacer_band)
+            changed += 1
+        return changed
@@ -0,0 +1,192 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 渐变色带渲染
+"""
+import tkinter as tk
+from typing import Dict, List, Optional, Tuple
+from core.fade_model import fade_palette
+
+PACER_TAG = 'pacer'  # 导读光标的标签名
+FRAME_PROC = '::ruidu_apply_fade_frame'  # 一帧修改在Tcl一侧的执行过程
+# 参数：w 控件路径；text 空列表或只含新页面文本的列表；ranges 扁平的 {标签 起点 终点 ...}，起点等于终点表示只移除
+# 标签操作不受控件disabled状态限制，只有替换文本时临时切换为可编辑
+FRAME_PROC_BODY = """
+    if {[llength $text]} {
+        set state [$w cget -state]
+        $w configure -state normal
+        $w delete 1.0 end
+        $w insert 1.0 [lindex $text 0] content
+        $w configure -state $state
+    }
+    foreach {tag start end} $ranges {
+        $w tag remove $tag 1.0 end
+        if {$end > $start} {
+            $w tag add $tag "1.0 + $start chars" "1.0 + $end chars"
+        }
+    }
+"""
+
+
+class PageBuffer:
+    """双缓冲中的一块：显示页面的控件，以及控件中当前的页面文本和各标签区间"""
+
+    def __init__(self, widget: tk.Widget):
+        self.widget = widget
+        self.text: Optional[str] = None  # 控件中的页面文本，None表示内容未知
+        self.ranges: Dict[str, Tuple[int, int]] = {}  # {标签: 当前覆盖的 [起始位置, 结束位置)}
+
+
+class GradientTextRenderer:
+    """把渐隐色带渲染到Text控件上
+
+    每个渐隐级别对应一个预先配置好颜色的标签，每个标签只覆盖一段连续区间；
+    每帧只移动区间发生变化的标签，重绘代价与渐隐级别数成正比，与字符数无关。
+    导读光标模式只有一个高亮标签，每帧至多移动一次。页面文本没有变化时不重新插入。
+    一帧内对控件的全部修改作为参数交给预先定义的Tcl过程，只调用一次tk.call；
+    参数以Tcl列表传递，无需转义，过程体只编译一次。batched为False时逐条调用控件方法（用于对比）。
+
+    页面显示在覆盖于主文本框之上的两个Text控件中（双缓冲）：阅读当前页时，
+    下一页预先插入被遮住的后台控件并完成排版，翻页只需交换两个控件的层级。
+    """
+
+    def __init__(self, text_widget: tk.Text, fading_levels: int, batched: bool = True):
+        self.cover = text_widget  # 页面控件显示时覆盖的主文本框，字体和间距与之一致
+        self.fading_levels = fading_levels
+        self.batched = batched
+        if batched:
+            text_widget.tk.call('proc', FRAME_PROC, 'w text ranges', FRAME_PROC_BODY)  # 重复定义无副作用
+        self.palette: Dict[str, str] = {}  # {状态: 颜色}
+        self.pacer_configured = False
+        self._front = PageBuffer(self._create_page_widget())
+        self._back = PageBuffer(self._create_page_widget())
+        self._shown = False  # 页面控件是否已覆盖在主文本框上
+
+    def _create_page_widget(self) -> tk.Text:
+        """创建与主文本框外观一致、只用于显示页面的Text控件"""
+        cover = self.cover
+        widget = tk.Text(cover.master, wrap=cover.cget('wrap'), font=cover.cget('font'),
+                         bg=cover.cget('bg'), fg=cover.cget('fg'), relief='flat', borderwidth=0,
+                         highlightthickness=0, state='disabled', cursor='arrow', takefocus=0)
+        widget.tag_configure('content', **{option: cover.tag_cget('content', option)
+                                           for option in ('spacing1', 'spacing2', 'spacing3')})
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            widget.bind(sequence, lambda e: "break")  # 阅读时不允许滚动
+        return widget
+
+    @property
+    def buffers(self) -> Tuple[PageBuffer, PageBuffer]:
+        """前台和后台两块缓冲"""
+        return self._front, self._back
+
+    @staticmethod
+    def _rgb(widget: tk.Misc, color: str) -> Tuple[int, int, int]:
+        """颜色名转换为0-255的RGB"""
+        return tuple(channel >> 8 for channel in widget.winfo_rgb(color))
+
+    def configure_font(self, family: str, size: int, line_spacing: float):
+        """设置字体和行间距（与主文本框content标签的间距一致）"""
+        for buffer in self.buffers:
+            buffer.widget.configure(font=(family, size))
+            buffer.widget.tag_configure('content', spacing1=10, spacing3=10, spacing2=int(line_spacing * 10))
+
+    def configure_palette(self, text_color: str, background_color: str, fading_levels: Optional[int] = None):
+        """按文字颜色和背景颜色重新计算调色板并配置标签"""
+        if fading_levels is not None and fading_levels != self.fading_levels:
+            for buffer in self.buffers:
+                for name in self.palette:
+                    buffer.widget.tag_delete(name)
+            self.fading_levels = fading_levels
+            self.invalidate()
+        self.palette = fade_palette(self.fading_levels, self._rgb(self.cover, text_color),
+                                    self._rgb(self.cover, background_color))
+        for buffer in self.buffers:
+            buffer.widget.configure(bg=background_color, fg=text_color)
+            for name, color in self.palette.items():
+                buffer.widget.tag_configure(name, foreground=color)
+        print(f"[GUI-DEBUG] 渐变调色板: {len(self.palette)} 种颜色, {text_color} -> {background_color}")
+
+    def configure_pacer(self, color: str):
+        """设置导读光标的高亮背景色"""
+        for buffer in self.buffers:
+            buffer.widget.tag_configure(PACER_TAG, background=color)
+            buffer.widget.tag_raise(PACER_TAG)
+        self.pacer_configured = True
+
+    def prefetch(self, text: str):
+        """把下一页插入后台控件，在被遮住的情况下完成排版，翻页时直接交换"""
+        if text and text != self._front.text and text != self._back.text:
+            self._render(self._back, text, ((0, len(text), 'normal'),), ())
+            print(f"[GUI-DEBUG] 后台缓冲已预备下一页，长度: {len(text)}")
+
+    def invalidate(self):
+        """主文本框显示其他内容时调用：隐藏页面控件，下一帧重新显示"""
+        for buffer in self.buffers:
+            buffer.widget.place_forget()
+        self._shown = False
+
+    def close(self):
+        """窗口销毁时调用；页面控件随窗口销毁，没有需要停止的后台任务"""
+
+    def _stack(self):
+        """前台控件覆盖主文本框，后台控件藏在前台控件之下"""
+        front, back = self._front.widget, self._back.widget
+        for widget in (back, front):
+            widget.place(in_=self.cover, x=0, y=0, relwidth=1, relheight=1)
+        tk.Misc.lift(front, self.cover)
+        tk.Misc.lower(back, front)
+
+    def show(self, text: str, bands: Tuple[Tuple[int, int, str], ...], pacer_band: Tuple[int, ...] = ()) -> int:
+        """显示页面文本并应用色带和导读光标，返回本帧移动的标签数"""
+        if text != self._front.text and text == self._back.text:
+            # 翻页：后台控件已经排好下一页，交换前后台即可
+            self._front, self._back = self._back, self._front
+            tk.Misc.lift(self._front.widget, self._back.widget)
+            print(f"[GUI-DEBUG] 翻页：交换前后台缓冲")
+        if not self._shown:
+            self._stack()
+            self._shown = True
+        return self._render(self._front, text, bands, pacer_band)
+
+    def _render(self, buffer: PageBuffer, text: str, bands: Tuple[Tuple[int, int, str], ...],
+                pacer_band: Tuple[int, ...]) -> int:
+        """把页面文本和色带写入一块缓冲，返回移动的标签数"""
+        new_text = ()
+        if text != buffer.text:
+            new_text = (text,)
+            buffer.text = text
+            buffer.ranges = {}
+
+        ranges = {state: (start, end) for start, end, state in bands if state in self.palette}
+        tags = list(self.palette)
+        if self.pacer_configured:
+            tags.append(PACER_TAG)
+            if pacer_band:
+                ranges[PACER_TAG] = pacer_band
+        moves: List[Tuple[str, int, int]] = []
+        for name in tags:
+            new_range = ranges.get(name)
+            if new_range != buffer.ranges.get(name):
+                moves.append((name, *(new_range or (0, 0))))
+        buffer.ranges = ranges
+        self._apply(buffer.widget, new_text, moves)
+        return len(moves)
+
+    def _apply(self, widget: tk.Text, new_text: Tuple[str, ...], moves: List[Tuple[str, int, int]]):
+        """执行一帧的修改：替换页面文本（new_text非空时），再移动各标签"""
+        if not new_text and not moves:
+            return
+        if self.batched:
+            widget.tk.call(FRAME_PROC, widget._w, new_text, tuple(value for move in moves for value in move))
+            return
+        if new_text:
+            state = widget.cget('state')
+            widget.config(state='normal')
+            widget.delete('1.0', tk.END)
+            widget.insert('1.0', new_text[0], 'content')
+            widget.config(state=state)
+        for name, start, end in moves:
+            widget.tag_remove(name, '1.0', tk.END)
+            if end > start:
+                widget.tag_add(name, f'1.0 + {start} chars', f'1.0 + {end} chars')
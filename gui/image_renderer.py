@@ -0,0 +1,371 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 图像正文渲染
+"""
+import os
+import queue
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageTk
+from core.fade_model import fade_state_names
+from gui.canvas_renderer import layout_page, row_spans
+
+# 按顺序尝试的中文字体文件（Windows、macOS、常见Linux发行版）
+FONT_FILES = ('msyh.ttc', 'msyh.ttf', 'simhei.ttf', 'PingFang.ttc', 'NotoSansCJK-Regular.ttc',
+              'wqy-microhei.ttc', 'DejaVuSans.ttf')
+GLYPH_CACHE_PAGES = 3  # 缓存字形层的页数：上一页、当前页、预备的下一页
+POLL_INTERVAL = 10  # 等待后台合成结果的轮询间隔（毫秒）
+
+
+@dataclass(frozen=True)
+class RasterStyle:
+    """一次合成所需的全部样式，整体替换后台线程即可使用新样式"""
+    font: ImageFont.FreeTypeFont
+    line_spacing: float
+    text_rgb: Tuple[int, int, int]
+    background_rgb: Tuple[int, int, int]
+    pacer_rgb: Optional[Tuple[int, int, int]]
+    intensities: Tuple[Tuple[str, int], ...]  # (状态, 文字不透明度0-255)
+
+
+@dataclass(frozen=True)
+class RasterJob:
+    """后台线程的一项工作：序号为0时预备下一页（整页为normal状态）"""
+    sequence: int  # 帧序号，预备下一页的工作为0
+    text: str
+    width: int
+    height: int
+    style: RasterStyle
+    bands: Tuple[Tuple[int, int, str], ...] = ()
+    pacer_band: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class RasterResult:
+    """后台线程合成好的一帧"""
+    sequence: int
+    image: Image.Image
+    key: tuple = ()  # 预备的下一页：(页面文本, 宽度, 高度, 样式)，用于翻页时匹配
+
+
+def load_font(pixel_size: int) -> ImageFont.ImageFont:
+    """按FONT_FILES的顺序加载第一个可用的字体，都不可用时退回Pillow内置字体"""
+    for name in FONT_FILES:
+        try:
+            return ImageFont.truetype(name, pixel_size)
+        except OSError:
+            continue
+    windows_fonts = os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')
+    for name in FONT_FILES:
+        try:
+            return ImageFont.truetype(os.path.join(windows_fonts, name), pixel_size)
+        except OSError:
+            continue
+    print(f"[GUI-DEBUG] 未找到中文字体，使用Pillow内置字体")
+    return ImageFont.load_default()
+
+
+class ImagePageRenderer:
+    """在后台线程用Pillow把页面栅格化为图像，主线程只把合成结果写入已有的PhotoImage
+
+    每页的字形先绘制为灰度覆盖层并缓存；每帧按色带在不透明度蒙版上画矩形，
+    与字形层相乘后把文字颜色合成到背景上，导读光标画在背景层。
+    后台线程只合成最新的一帧；显示用的PhotoImage尺寸不变时一直复用，每帧只paste像素，不新建Tcl图像。
+    阅读当前页时在后台合成下一页并写入另一个PhotoImage，翻页时两者交换（双缓冲），精确的一帧合成好后再写入。
+    合成出错时记录错误、停止轮询并调用failure_callback，由阅读窗口换回Text控件渲染器。
+    与Text控件渲染器接口相同，可以互相替换。
+    """
+
+    def __init__(self, canvas: tk.Canvas, cover: tk.Widget, fading_levels: int):
+        self.canvas = canvas
+        self.cover = cover  # 画布显示时覆盖的控件（阅读窗口中的Text控件）
+        self.fading_levels = fading_levels
+        self.font = load_font(16)
+        self.line_spacing = 1.5
+        self.text_rgb = (0, 0, 0)
+        self.background_rgb = (255, 255, 255)
+        self.pacer_rgb: Optional[Tuple[int, int, int]] = None
+        self.style: Optional[RasterStyle] = None
+        self._sequence = 0  # 最近一次提交的帧序号
+        self._valid_from = 1  # 失效后，序号小于它的合成结果不再显示
+        self._posted_key = None  # 最近一次提交给后台线程的帧内容
+        self._result: Optional[RasterResult] = None  # 后台线程合成好的最新一帧（整体替换，无需加锁）
+        self._shown: Optional[RasterResult] = None
+        self._photo: Optional[ImageTk.PhotoImage] = None  # 画布上显示的图像，尺寸不变时每帧复用
+        self._spare: Optional[ImageTk.PhotoImage] = None  # 翻页后换下的图像，留给下一次预备的下一页复用
+        self._prefetched: Optional[RasterResult] = None  # 后台线程合成好的下一页
+        self._back: Optional[Tuple[tuple, ImageTk.PhotoImage]] = None  # 已转换好的下一页 (页面键, 图像)
+        self._prefetch_key: Optional[tuple] = None  # 正在后台合成的下一页
+        self._image_item: Optional[int] = None
+        self._poll_job = None
+        self.error: Optional[Exception] = None  # 后台合成出错时记录的异常，之后不再显示新帧
+        self.failure_callback: Optional[Callable[[], None]] = None  # 合成出错后在主线程调用一次
+        self._glyph_cache: "OrderedDict[tuple, Tuple[List[Tuple[int, int, int]], Image.Image]]" = OrderedDict()
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+    def _rgb(self, color: str) -> Tuple[int, int, int]:
+        """颜色名转换为0-255的RGB"""
+        return tuple(channel >> 8 for channel in self.canvas.winfo_rgb(color))
+
+    def _update_style(self):
+        """整体替换样式；样式变化后重新合成"""
+        names = fade_state_names(self.fading_levels)
+        steps = len(names) - 1
+        self.style = RasterStyle(
+            font=self.font,
+            line_spacing=self.line_spacing,
+            text_rgb=self.text_rgb,
+            background_rgb=self.background_rgb,
+            pacer_rgb=self.pacer_rgb,
+            intensities=tuple((name, round(255 * i / steps)) for i, name in enumerate(names)),
+        )
+        self._posted_key = None
+
+    def configure_font(self, family: str, size: int, line_spacing: float):
+        """设置字号和行间距：Tk字号以磅为单位，换算为像素后加载字体（family由FONT_FILES决定）"""
+        pixel_size = max(1, round(size * self.canvas.winfo_fpixels('1i') / 72))
+        self.font = load_font(pixel_size)
+        self.line_spacing = line_spacing
+        self._update_style()
+        print(f"[GUI-DEBUG] 图像渲染字体: {family} {size}磅 -> {pixel_size}像素")
+
+    def configure_palette(self, text_color: str, background_color: str, fading_levels: Optional[int] = None):
+        """设置文字颜色和背景颜色"""
+        if fading_levels is not None:
+            self.fading_levels = fading_levels
+        self.canvas.configure(bg=background_color)
+        self.text_rgb = self._rgb(text_color)
+        self.background_rgb = self._rgb(background_color)
+        self._update_style()
+
+    def configure_pacer(self, color: str):
+        """设置导读光标的高亮颜色"""
+        self.pacer_rgb = self._rgb(color)
+        self._update_style()
+
+    def invalidate(self):
+        """隐藏画布并丢弃尚未显示的合成结果"""
+        self.canvas.place_forget()
+        self._valid_from = self._sequence + 1
+        self._posted_key = None
+        self._shown = None
+
+    def prefetch(self, text: str):
+        """在后台合成下一页，就绪后在主线程转换为PhotoImage，翻页时直接换上"""
+        width, height = self._size()
+        if not self.style or not text:
+            return
+        key = (text, width, height, self.style)
+        if key != self._prefetch_key and (self._back is None or self._back[0] != key):
+            if self._back is not None:
+                self._spare = self._back[1]
+            self._back = None
+            self._prefetch_key = key
+            self._jobs.put(RasterJob(0, text, width, height, self.style, ((0, len(text), 'normal'),)))
+            self._schedule_poll()
+
+    def _size(self) -> Tuple[int, int]:
+        """画布覆盖区域的像素尺寸"""
+        return max(1, self.cover.winfo_width()), max(1, self.cover.winfo_height())
+
+    def show(self, text: str, bands: Tuple[Tuple[int, int, str], ...], pacer_band: Tuple[int, ...] = ()) -> int:
+        """提交本帧给后台线程合成，并显示已经合成好的最新一帧；返回替换图像的次数"""
+        canvas = self.canvas
+        if not canvas.winfo_ismapped():
+            canvas.place(in_=self.cover, x=0, y=0, relwidth=1, relheight=1)
+            tk.Misc.lift(canvas, self.cover)  # Canvas.lift是图形项的层级操作，这里要调整的是控件层级
+        width, height = self._size()
+        key = (text, bands, pacer_band, width, height, self.style)
+        if key != self._posted_key and self.style:
+            if self._back and self._back[0] == (text, width, height, self.style) and (
+                    self._posted_key is None or self._posted_key[0] != text):
+                # 翻页：先换上预备好的下一页，换下的图像留给下一次预备复用
+                self._spare = self._photo
+                self._set_photo(self._back[1])
+                self._back = None
+                print(f"[GUI-DEBUG] 翻页：换上预备好的下一页图像")
+            self._sequence += 1
+            self._jobs.put(RasterJob(self._sequence, text, width, height, self.style, bands, pacer_band))
+            self._posted_key = key
+            self._schedule_poll()
+        return self._swap()
+
+    def _schedule_poll(self):
+        """合成结果就绪前定时检查（暂停时没有新帧触发show，也能显示最后一帧）"""
+        if self._poll_job is None:
+            self._poll_job = self.canvas.after(POLL_INTERVAL, self._poll)
+
+    def _poll(self):
+        """定时检查后台合成结果"""
+        self._poll_job = None
+        if self.error is not None:
+            self._fail()
+            return
+        self._swap()
+        prefetched = self._prefetched
+        if prefetched is not None and prefetched.key == self._prefetch_key:
+            # 主线程空闲时把下一页写入后台图像，翻页时不再转换
+            self._prefetched = None
+            self._prefetch_key = None
+            photo = self._reuse_photo(self._spare, prefetched.image)
+            self._spare = None
+            self._back = (prefetched.key, photo)
+        shown = self._shown.sequence if self._shown else 0
+        if (self._posted_key is not None and shown < self._sequence) or self._prefetch_key is not None:
+            self._schedule_poll()
+
+    def _swap(self) -> int:
+        """把后台线程合成好的最新一帧换到画布上"""
+        result = self._result
+        if result is None or result is self._shown or result.sequence < self._valid_from:
+            return 0
+        photo = self._reuse_photo(self._photo, result.image)
+        if photo is not self._photo:
+            self._set_photo(photo)  # 尺寸变化时才换新图像，否则paste后画布自动重绘
+        self._shown = result
+        return 1
+
+    def _reuse_photo(self, photo: Optional[ImageTk.PhotoImage], image: Image.Image) -> ImageTk.PhotoImage:
+        """把合成结果写入尺寸相同的已有图像；没有或尺寸不同时才新建"""
+        if photo is None or (photo.width(), photo.height()) != image.size:
+            photo = ImageTk.PhotoImage(image.mode, image.size, master=self.canvas)
+        photo.paste(image)
+        return photo
+
+    def _fail(self):
+        """合成出错：隐藏画布，通知阅读窗口换用其他渲染器"""
+        self.canvas.place_forget()
+        callback, self.failure_callback = self.failure_callback, None
+        if callback:
+            callback()
+
+    def wait_composed(self, timeout: float = 1.0) -> bool:
+        """阻塞等待后台线程合成完最近提交的一帧（供基准测试把合成时间排除在主线程耗时之外）"""
+        deadline = time.perf_counter() + timeout
+        while self.error is None and time.perf_counter() < deadline:
+            result = self._result
+            if result is not None and result.sequence >= self._sequence:
+                return True
+            time.sleep(0.001)
+        return False
+
+    def close(self):
+        """停止后台线程并取消轮询（阅读窗口销毁时调用），线程不再持有渲染器、字形缓存和画布"""
+        if self._poll_job is not None:
+            try:
+                self.canvas.after_cancel(self._poll_job)
+            except tk.TclError:
+                pass
+            self._poll_job = None
+        self._jobs.put(None)
+
+    def _set_photo(self, photo: ImageTk.PhotoImage):
+        """用一次itemconfigure换上新图像"""
+        self._photo = photo
+        if self._image_item is None or not self.canvas.find_withtag(self._image_item):
+            self._image_item = self.canvas.create_image(0, 0, anchor='nw', image=photo)
+        else:
+            self.canvas.itemconfigure(self._image_item, image=photo)
+
+    def _worker_loop(self):
+        """后台线程：积压的帧只合成最新的一帧，预备的下一页也只合成最新的一页；收到None时退出"""
+        while True:
+            jobs = [self._jobs.get()]
+            while True:
+                try:
+                    jobs.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+            if any(job is None for job in jobs):
+                print(f"[GUI-DEBUG] 图像合成线程已退出")
+                return
+            frames = [job for job in jobs if job.sequence]
+            if frames:
+                latest = frames[-1]
+                image = self._compose_safe(latest)
+                if image is not None:
+                    self._result = RasterResult(latest.sequence, image)
+            prefetches = [job for job in jobs if not job.sequence]
+            if prefetches:
+                job = prefetches[-1]
+                image = self._compose_safe(job)
+                if image is not None:
+                    self._prefetched = RasterResult(0, image, (job.text, job.width, job.height, job.style))
+
+    def _compose_safe(self, job: RasterJob) -> Optional[Image.Image]:
+        """合成一帧；Pillow出错（字体、尺寸、内存不足等）时记录错误并返回None，线程继续运行"""
+        try:
+            return self._compose(job)
+        except Exception as e:
+            print(f"[GUI-DEBUG] 图像合成失败（{job.width}x{job.height}）: {type(e).__name__}: {e}")
+            self.error = e
+            return None
+
+    def _glyph_layer(self, text: str, width: int, style: RasterStyle):
+        """一页的排版和字形覆盖层（灰度图，255为字形完全覆盖），按页缓存"""
+        key = (text, width, style.font, style.line_spacing)
+        cached = self._glyph_cache.get(key)
+        if cached is not None:
+            self._glyph_cache.move_to_end(key)
+            return cached
+
+        font = style.font
+        ascent, descent = font.getmetrics()
+        widths: Dict[str, int] = {}
+
+        def char_width(char: str) -> int:
+            if char not in widths:
+                widths[char] = round(font.getlength(char))
+            return widths[char]
+
+        boxes = layout_page(text, width, char_width, ascent + descent, style.line_spacing)
+        height = max((y for _, y, _ in boxes), default=0) + ascent + descent
+        glyphs = Image.new('L', (width, max(1, height)), 0)
+        draw = ImageDraw.Draw(glyphs)
+        for char, (x, y, _) in zip(text + '\n', boxes):
+            if not char.isspace():
+                draw.text((x, y), char, fill=255, font=font)
+
+        self._glyph_cache[key] = (boxes, glyphs)
+        while len(self._glyph_cache) > GLYPH_CACHE_PAGES:
+            self._glyph_cache.popitem(last=False)
+        return boxes, glyphs
+
+    def _compose(self, job: RasterJob) -> Image.Image:
+        """把一帧的色带合成为RGB图像"""
+        style = job.style
+        boxes, glyphs = self._glyph_layer(job.text, job.width, style)
+        size = (job.width, job.height)
+        ascent, descent = style.font.getmetrics()
+        linespace = ascent + descent
+
+        background = Image.new('RGB', size, style.background_rgb)
+        if job.pacer_band and style.pacer_rgb:
+            draw = ImageDraw.Draw(background)
+            for x0, y, x1 in row_spans(boxes, *job.pacer_band):
+                draw.rectangle((x0, y, x1 - 1, y + linespace - 1), fill=style.pacer_rgb)
+
+        # 不透明度蒙版：默认完全不透明，每个色带按所在行画矩形
+        opacity = Image.new('L', size, 255)
+        draw = ImageDraw.Draw(opacity)
+        intensities = dict(style.intensities)
+        for start, end, state in job.bands:
+            fill = intensities.get(state, 255)
+            if fill == 255:
+                continue
+            for x0, y, x1 in row_spans(boxes, start, end):
+                if x1 > x0:
+                    draw.rectangle((x0, y, x1 - 1, y + linespace - 1), fill=fill)
+
+        layer = Image.new('L', size, 0)
+        layer.paste(glyphs.crop((0, 0, min(glyphs.width, job.width), min(glyphs.height, job.height))), (0, 0))
+        mask = ImageChops.multiply(layer, opacity)
+        return Image.composite(Image.new('RGB', size, style.text_rgb), background, mask)
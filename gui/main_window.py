@@ -10,7 +10,10 @@ import os
 from typing import List, Optional
 from core.settings import Settings
 from core.article_parser import ArticleParser, Article
+from core.layout_cache import LayoutCache, LibraryPrepaginator
+from core.reading_controller import MIN_READING_SPEED, MAX_READING_SPEED, MAX_HIGH_SPEED
 from gui.reading_window import ReadingWindow
+from gui.reading_window_pool import ReadingWindowPool
 from gui.settings_window import SettingsWindow
 from gui.about_window import AboutWindow
 
@@ -24,8 +27,16 @@ class MainWindow:
         self.settings_window: Optional[SettingsWindow] = None
         self.about_window: Optional[AboutWindow] = None
         
+        # 分页缓存和后台预分页
+        self.layout_cache = LayoutCache()
+        self.prepaginator = LibraryPrepaginator(self.layout_cache)
+        
+        # 阅读窗口池：预先建好隐藏的阅读窗口，换文章时只载入内容
+        self.reading_pool = ReadingWindowPool(self.root, self.settings, self.layout_cache)
+        
         self.setup_ui()
         self.load_last_folder()
+        self.root.after_idle(self.reading_pool.prepare)
     
     def setup_ui(self):
         """设置UI界面"""
@@ -182,7 +193,7 @@ class MainWindow:
         ttk.Label(mode_frame, text="📖 阅读模式:", font=('Microsoft YaHei', 10, 'bold')).pack(anchor='w')
         self.mode_var = tk.StringVar(value=self.settings.get('reading', 'mode', 'line'))
         mode_combo = ttk.Combobox(mode_frame, textvariable=self.mode_var, 
-                                values=['line', 'page'], state='readonly', height=8)
+                                values=['line', 'pacer', 'page'], state='readonly', height=8)
         mode_combo.pack(fill='x', pady=(8, 0))
         mode_combo.bind('<<ComboboxSelected>>', self.on_mode_change)
         
@@ -192,9 +203,11 @@ class MainWindow:
         
         ttk.Label(speed_frame, text="⚡ 阅读速度 (字/分钟):", font=('Microsoft YaHei', 10, 'bold')).pack(anchor='w')
         self.speed_var = tk.StringVar(value=self.settings.get('reading', 'reading_speed', '300'))
-        speed_spinbox = ttk.Spinbox(speed_frame, from_=60, to=1200, textvariable=self.speed_var, width=10)
-        speed_spinbox.pack(fill='x', pady=(8, 0))
-        speed_spinbox.bind('<KeyRelease>', self.on_speed_change)
+        self.speed_spinbox = ttk.Spinbox(speed_frame, from_=MIN_READING_SPEED, to=MAX_READING_SPEED,
+                                         textvariable=self.speed_var, width=10)
+        self.speed_spinbox.pack(fill='x', pady=(8, 0))
+        self.speed_spinbox.bind('<KeyRelease>', self.on_speed_change)
+        self.update_speed_range()
         
         # 字体大小
         font_frame = ttk.Frame(control_inner)
@@ -236,6 +249,7 @@ class MainWindow:
             print(f"[GUI-DEBUG] 加载到 {len(self.articles)} 篇文章")
             
             self.update_article_list()
+            self.start_prepagination()
             
             if self.articles:
                 print("[GUI-DEBUG] 显示成功消息")
@@ -247,6 +261,15 @@ class MainWindow:
             print(f"[GUI-DEBUG] 加载文章出错: {e}")
             messagebox.showerror("错误", f"加载文章时出错: {e}")
     
+    def start_prepagination(self):
+        """按最近使用的布局配置在后台预分页整个文章库（可选）"""
+        if self.settings.get('app', 'prepaginate_library', 'False').lower() != 'true':
+            return
+        try:
+            self.prepaginator.start(self.articles)
+        except Exception as e:
+            print(f"[GUI-DEBUG] 启动后台预分页出错: {e}")
+    
     def update_article_list(self):
         """更新文章列表显示"""
         # 清空现有内容
@@ -308,12 +331,8 @@ class MainWindow:
         """使用指定文章开始阅读"""
         print(f"[GUI-DEBUG] 准备开始阅读文章: {article.title}")
         
-        if self.reading_window:
-            print("[GUI-DEBUG] 销毁旧的阅读窗口")
-            self.reading_window.destroy()
-        
-        print("[GUI-DEBUG] 创建新的阅读窗口")
-        self.reading_window = ReadingWindow(self.root, article, self.settings)
+        # 复用窗口池中的阅读窗口（正在阅读的文章会先停止），没有时才新建
+        self.reading_window = self.reading_pool.acquire(article)
         print("[GUI-DEBUG] 显示阅读窗口")
         self.reading_window.show()
     
@@ -323,6 +342,7 @@ class MainWindow:
             self.settings_window.destroy()
         
         self.settings_window = SettingsWindow(self.root, self.settings)
+        self.settings_window.set_close_callback(self.update_speed_range)
         self.settings_window.show()
     
     def open_about(self):
@@ -338,6 +358,12 @@ class MainWindow:
         self.settings.set('reading', 'mode', self.mode_var.get())
         self.settings.save_settings()
     
+    def update_speed_range(self):
+        """按是否启用高速模式更新速度输入框的上限，并同步设置中的速度"""
+        high_speed = self.settings.get('reading', 'high_speed_mode', 'False').lower() == 'true'
+        self.speed_spinbox.configure(to=MAX_HIGH_SPEED if high_speed else MAX_READING_SPEED)
+        self.speed_var.set(self.settings.get('reading', 'reading_speed', '300'))
+    
     def on_speed_change(self, event=None):
         """阅读速度改变"""
         try:
@@ -359,11 +385,12 @@ class MainWindow:
     def run(self):
         """运行主窗口"""
         self.root.mainloop()
+        self.prepaginator.shutdown()
     
     def destroy(self):
         """销毁窗口"""
-        if self.reading_window:
-            self.reading_window.destroy()
+        self.prepaginator.shutdown()
+        self.reading_pool.destroy()
         if self.settings_window:
             self.settings_window.destroy()
         if self.about_window:
@@ -4,32 +4,46 @@ Reading Training - Apache License 2.0
 
 锐读 - 速读训练程序 - 阅读窗口
 """
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional
+from typing import Optional, Tuple
 from core.article_parser import Article
 from core.reading_controller import ReadingController
+from core.reading_snapshot import ReadingSnapshot
 from core.settings import Settings
+from core.layout_cache import LayoutCache
+from gui.article_buffer import ArticleBuffer
 from gui.article_overview_window import ArticleOverviewWindow
+from gui.canvas_renderer import CanvasTextRenderer
+from gui.fade_renderer import GradientTextRenderer
+from gui.image_renderer import ImagePageRenderer
+from gui.widget_state import WidgetStateCache
 
 class ReadingWindow:
-    def __init__(self, parent, article: Article, settings: Settings):
+    def __init__(self, parent, article: Optional[Article], settings: Settings,
+                 layout_cache: Optional[LayoutCache] = None):
+        self._open_started_at = time.perf_counter()  # 用于统计首屏耗时
+        self.time_to_first_page: Optional[float] = None  # 首屏耗时（秒）
         self.parent = parent
-        self.article = article
+        self.article = article  # 为None时只预先建好窗口并隐藏，由load_article载入文章
         self.settings = settings
         self.window: tk.Toplevel
+        self.pooled = False  # 由窗口池管理时，关闭只隐藏窗口，下次打开文章时复用
         self.controller = ReadingController()
+        self.controller.layout_cache = layout_cache  # 命中后台预分页结果时无需在UI线程分页
         
-        # 设置控制器
-        self.controller.set_article(article)
-        self.controller.set_reading_speed(settings.get_int('reading', 'reading_speed', 300))
-        self.controller.set_mode(settings.get('reading', 'mode', 'line'))
-        
-        # 设置高性能模式
-        high_performance = settings.get('reading', 'high_performance_mode', 'True').lower() == 'true'
-        self.controller.set_high_performance_mode(high_performance)
-        
+        # 设置控制器（分页推迟到布局参数收集完毕后统一进行一次）
+        self._configure_controller()
+        if article:
+            self.controller.set_article(article, paginate=False)
         self.controller.set_update_callback(self.update_display)
+        self._tick_job = None  # tick引擎的after任务
+        self._tick_driven = False  # 本次阅读是否由tick引擎驱动（开始阅读时确定）
+        self._rendered_version = -1  # 最近一次渲染的快照版本
+        
+        # 按钮、状态标签和进度条的保留模式状态：每帧描述应有状态，只修改变化的选项
+        self.ui_state = WidgetStateCache()
         
         # UI元素 - 在create_window()中初始化，所以不会是None
         self.text_display: tk.Text
@@ -44,11 +58,19 @@ class ReadingWindow:
         self.last_window_width = 1000
         self.last_window_height = 800
         self.resize_timer = None
+        self._question_job = None  # 阅读完成后进入答题模式的after任务
+        self._close_job = None  # 延迟隐藏或关闭窗口的after任务
+        
+        # 窗口可见性：未映射（最小化、隐藏）或被完全遮住时不渲染
+        self._window_mapped = True
+        self._window_obscured = False
+        self._display_hidden = False
         
         # 新增：布局更新防抖动
         self.layout_update_timer = None
         self.layout_update_pending = False
         self.last_font_size = settings.get_int('reading', 'font_size', 60)
+        self._measured_layout: Optional[Tuple[tuple, dict]] = None  # 最近一次测量：(尺寸和字体, 布局参数)
         
         # 重置状态标志
         self.is_reset_state = False
@@ -59,17 +81,91 @@ class ReadingWindow:
         self.question_widgets = {}  # 存储问题界面的组件
         
         self.create_window()
+        if article is None:
+            self.window.withdraw()  # 预先建好的窗口，映射前隐藏，不会闪现
+            print(f"[GUI-DEBUG] 已预先创建隐藏的阅读窗口")
+            return
         
-        # 初始化动态布局
-        self.update_layout_params()
+        # 收集布局参数、分页一次并立即显示首页，然后自动开始阅读
+        self._run_open_pipeline()
+    
+    def _configure_controller(self):
+        """按设置配置控制器（速度、模式、渐隐单位等），新建窗口和载入新文章时调用"""
+        settings = self.settings
+        self.controller.set_page_break_mode(settings.get('reading', 'page_break_mode', 'greedy'))
+        self.controller.set_high_speed_mode(settings.get('reading', 'high_speed_mode', 'False').lower() == 'true')
+        self.controller.set_reading_speed(settings.get_int('reading', 'reading_speed', 300))
+        self.controller.set_mode(settings.get('reading', 'mode', 'line'))
+        self.controller.set_granularity(settings.get('reading', 'granularity', 'char'))
+        self.controller.set_turn_pauses(settings.get_float('reading', 'line_turn_pause', 0.5),
+                                        settings.get_float('reading', 'page_turn_pause', 0.3))
+        self.controller.set_engine_mode(settings.get('reading', 'engine_mode', 'thread'))
         
-        # 自动开始阅读
-        self.start_reading()
+        # 设置高性能模式
+        high_performance = settings.get('reading', 'high_performance_mode', 'True').lower() == 'true'
+        self.controller.set_high_performance_mode(high_performance)
+    
+    def load_article(self, article: Article):
+        """在已有窗口中换一篇文章（窗口池复用）：只替换内容和分页，窗口、控件和渲染器都保留"""
+        self._open_started_at = time.perf_counter()
+        self.time_to_first_page = None
+        print(f"[GUI-DEBUG] 复用阅读窗口载入文章: {article.title}")
+        
+        # 结束上一篇文章的阅读、答题和待执行的定时任务
+        self._cancel_tick()
+        if self.controller.is_reading:
+            self.controller.stop_reading()
+        self.controller.exit_question_mode()
+        for job in (self.resize_timer, self.layout_update_timer, self._question_job, self._close_job):
+            if job:
+                self.window.after_cancel(job)
+        self.resize_timer = None
+        self.layout_update_timer = None
+        self.layout_update_pending = False
+        self._question_job = None
+        self._close_job = None  # 刚关闭的窗口马上又被复用时，不能再被隐藏
+        
+        # 先换文章（丢弃旧分页）再应用设置，速度等设置不会为旧文章重建时间轴
+        self.article = article
+        self.controller.set_article(article, paginate=False)
+        self._configure_controller()
+        self._rendered_version = -1
+        self._prefetched_page = -1
+        self.is_reset_state = False
+        self.current_question_index = 0
+        self.selected_answers = {}
+        self.question_widgets = {}
+        self.last_font_size = self.settings.get_int('reading', 'font_size', 60)
+        
+        # 窗口标题、文章信息、按钮和显示样式恢复到刚打开时的状态
+        self.window.title(f"锐读 - 速读训练 - {article.title}")
+        self.info_label.config(text=self._article_info_text())
+        self._restore_reading_buttons()
+        self._disable_scrolling()
+        self._clear_text_display()
+        self.text_display.config(state='disabled')
+        self._apply_display_settings()
+        
+        self.window.deiconify()
+        self._run_open_pipeline()
+    
+    def _article_info_text(self) -> str:
+        """顶部信息栏的文章信息"""
+        return f"《{self.article.title}》 - {self.article.author} ({self.article.date})"
+    
+    def _restore_reading_buttons(self):
+        """把答题模式改过的按钮恢复为阅读时的功能和顺序"""
+        self.ui_state.apply(self.pause_button, text="⏸ 暂停", command=self.pause_reading, state='normal')
+        self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", command=self.stop_reading, state='normal')
+        self.ui_state.apply(self.reset_button, text="⏮ 重置", command=self.reset_reading, state='disabled')
+        self.overview_button.pack_forget()
+        self.reset_button.pack(side='left', padx=(0, 10))
+        self.overview_button.pack(side='left', padx=(0, 10))
     
     def create_window(self):
         """创建阅读窗口"""
         self.window = tk.Toplevel(self.parent)
-        self.window.title(f"锐读 - 速读训练 - {self.article.title}")
+        self.window.title(f"锐读 - 速读训练 - {self.article.title if self.article else ''}")
         self.window.configure(bg=self.settings.get('reading', 'background_color', 'white'))
         
         # 设置窗口图标
@@ -88,13 +184,19 @@ class ReadingWindow:
         # 绑定窗口大小变化事件
         self.window.bind('<Configure>', self.on_window_configure)
         
+        # 窗口最小化、隐藏或被完全遮住时停止渲染，只推进时间模型
+        self.window.bind('<Map>', self._on_window_map)
+        self.window.bind('<Unmap>', self._on_window_unmap)
+        self.window.bind('<Visibility>', self._on_window_visibility)
+        
         # 顶部信息栏 - 固定高度
         info_frame = ttk.Frame(self.window)
         info_frame.pack(fill='x', padx=20, pady=10)
         
         # 文章信息
-        info_text = f"《{self.article.title}》 - {self.article.author} ({self.article.date})"
-        ttk.Label(info_frame, text=info_text, font=('Microsoft YaHei', 12)).pack(anchor='w')
+        info_text = self._article_info_text() if self.article else ""
+        self.info_label = ttk.Label(info_frame, text=info_text, font=('Microsoft YaHei', 12))
+        self.info_label.pack(anchor='w')
         
         # 主容器 - 使用grid布局确保控制面板总是可见
         main_container = ttk.Frame(self.window)
@@ -127,6 +229,30 @@ class ReadingWindow:
         self.text_display.tag_configure('content', spacing1=10, spacing3=10, 
                                        spacing2=int(line_spacing * 10))
         
+        # 正文渲染器：'text' Text控件上每个渐隐级别一个标签；'canvas' 覆盖在Text控件上的画布，每个字符一个文本项；
+        # 'image' 后台线程用Pillow栅格化整页。画布类渲染器在首次选用时创建
+        self.text_frame = text_frame
+        self.fade_renderer = GradientTextRenderer(self.text_display, self.controller.fading_levels)
+        self.page_renderers = {'text': self.fade_renderer}
+        self.page_renderer = self.fade_renderer  # 当前使用的渲染器，由_configure_page_renderers选择
+        self._prefetched_page = -1  # 已请求渲染器预备的页号
+        self._configure_page_renderers()
+        
+        # 全文视图：共享全文缓冲的对等控件，显示全文时覆盖在文本框上，通览窗口共用同一缓冲
+        self.article_buffer = ArticleBuffer(self.window)
+        self.article_buffer.configure_spacing(line_spacing)
+        self.article_view = self.article_buffer.create_peer(
+            text_frame,
+            font=('Microsoft YaHei', self.settings.get_int('reading', 'font_size', 60)),
+            bg=self.settings.get('reading', 'background_color', 'white'),
+            fg=self.settings.get('reading', 'text_color', 'black'),
+            highlightthickness=0,
+            takefocus=0
+        )
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.article_view.bind(sequence, lambda e: "break")  # 与阅读时一样不允许滚动
+        self._article_view_shown = False
+        
         # 创建滚动条但初始时禁用
         scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=self.text_display.yview)
         self.text_display.configure(yscrollcommand=scrollbar.set)
@@ -150,6 +276,7 @@ class ReadingWindow:
         ttk.Label(progress_frame, text="阅读进度:").pack(side='left')
         self.progress_bar = ttk.Progressbar(progress_frame, length=400, mode='determinate')
         self.progress_bar.pack(side='left', padx=(10, 0), fill='x', expand=True)
+        self.progress_bar.bind('<Button-1>', self._on_progress_click)  # 点击进度条跳转
         
         # 控制按钮区域
         button_frame = ttk.Frame(control_frame)
@@ -199,10 +326,28 @@ class ReadingWindow:
         self.time_label = ttk.Label(status_right, text="剩余时间: --", font=('Microsoft YaHei', 10))
         self.time_label.pack(anchor='e')
         
+        self._bind_seek_keys()
+        
         print(f"[GUI-DEBUG] 阅读窗口创建完成，所有控件已添加")
+    
+    def _run_open_pipeline(self):
+        """打开窗口的流水线：测量布局 -> 分页一次 -> 显示首页 -> 开始阅读"""
+        self.window.update_idletasks()
+        layout = self._measure_layout()
+        if layout is None:
+            # 窗口还没有完全初始化，稍后重试
+            print(f"[GUI-DEBUG] 窗口尺寸无效，延迟50ms后重试打开流程")
+            self.window.after(50, self._run_open_pipeline)
+            return
         
-        # 初始显示完整文章
-        self.show_full_article()
+        # 记录当前窗口尺寸，避免首次<Configure>事件再次触发重新分页
+        self.last_window_width = self.window.winfo_width()
+        self.last_window_height = self.window.winfo_height()
+        
+        self.controller.configure_layout(self.text_display, **layout)
+        print(f"[GUI-DEBUG] 打开流程分页完成: {len(self.controller.pages)} 页, 累计分页 {self.controller.pagination_count} 次")
+        
+        self.start_reading()
     
     def on_window_configure(self, event):
         """窗口大小变化事件处理"""
@@ -274,170 +419,147 @@ class ReadingWindow:
             # 等待窗口完全初始化
             self.window.update_idletasks()
             
-            # 获取文本显示区域的实际大小
-            text_width = self.text_display.winfo_width()
-            text_height = self.text_display.winfo_height()
-            
-            print(f"[GUI-DEBUG] 窗口尺寸: {text_width}x{text_height}")
-            
-            if text_width <= 1 or text_height <= 1:
+            layout = self._measure_layout()
+            if layout is None:
                 # 窗口还没有完全初始化，延迟执行
                 print(f"[GUI-DEBUG] 窗口尺寸无效，延迟100ms后重试")
                 self.layout_update_timer = self.window.after(100, self._perform_layout_update)
                 return
             
-            # 获取字体大小和行间距
-            font_size = self.settings.get_int('reading', 'font_size', 60)
-            line_spacing = self.settings.get_float('reading', 'line_spacing', 1.5)
-            
-            print(f"[GUI-DEBUG] 字体大小: {font_size}, 行间距: {line_spacing}")
-            
-            # 更准确地计算字符宽度（中文字符）
-            char_width = font_size * 0.6  # 中文字符大约是字体大小的0.6倍宽
-            
-            # 通过实际测量来计算行高
-            # 创建临时测试文本来测量实际行高
-            self.text_display.config(state='normal')
-            
-            # 保存当前内容
-            current_content = self.text_display.get(1.0, tk.END)
-            print(f"[GUI-DEBUG] 保存当前内容，长度: {len(current_content)}")
-            
-            # 插入测试文本（多行）来测量行高
-            test_text = "测试行一\n测试行二\n测试行三"
-            self.text_display.delete(1.0, tk.END)
-            self.text_display.insert(1.0, test_text, 'content')
-            
-            # 强制更新显示
-            self.text_display.update_idletasks()
-            print(f"[GUI-DEBUG] 已插入测试文本并更新显示")
-            
-            # 测量文本高度
-            bbox_first = self.text_display.bbox("1.0")
-            bbox_third = self.text_display.bbox("3.0")
-            
-            print(f"[GUI-DEBUG] bbox_first: {bbox_first}, bbox_third: {bbox_third}")
-            
-            actual_line_height = None
-            if bbox_first and bbox_third:
-                # 计算实际行高（包括行间距）
-                actual_line_height = bbox_third[1] - bbox_first[1]
-                print(f"[GUI-DEBUG] 实际测量行高: {actual_line_height}px")
-            else:
-                # 如果测量失败，使用估算值但包含行间距
-                actual_line_height = font_size * line_spacing
-                print(f"[GUI-DEBUG] 测量失败，使用估算行高（含行间距）: {actual_line_height}px")
-            
-            # 确保行高不为0或负数
-            if actual_line_height <= 0:
-                actual_line_height = font_size * 1.5
-                print(f"[GUI-DEBUG] 行高无效，使用默认值: {actual_line_height}px")
-            
-            # 恢复原内容
-            self.text_display.delete(1.0, tk.END)
-            self.text_display.insert(1.0, current_content)
-            self.text_display.config(state='disabled')
-            print(f"[GUI-DEBUG] 已恢复原内容")
-            
-            # 计算每行可容纳的字符数（留一些边距）
-            chars_per_line = max(20, int((text_width - 40) / char_width))
-            
-            # 计算每页可容纳的行数（确保最后一行有足够空间）
-            # 预留更多边距，并使用向下取整后再减1确保空间充足
-            available_height = text_height - 100  # 增加更多边距，确保底部有足够空间
-            max_lines = available_height / actual_line_height
-            
-            # 使用floor确保不会超出边界，并额外减去1行的安全边距
-            import math
-            lines_per_page = max(3, int(math.floor(max_lines - 1.0)))
-            
-            print(f"[GUI-DEBUG] 布局参数更新: 文本区域{text_width}x{text_height}, "
-                  f"实际行高: {actual_line_height:.1f}px, 可用高度: {available_height}px, "
-                  f"理论最大行数: {max_lines:.2f}, 安全行数: {lines_per_page}")
-            print(f"[GUI-DEBUG] 字符/行: {chars_per_line}, 行/页: {lines_per_page}")
-            
-            # 验证计算结果
-            required_height = lines_per_page * actual_line_height + 100
-            print(f"[GUI-DEBUG] 验证: {lines_per_page}行需要{required_height:.1f}px，实际有{text_height}px")
-            
-            # 保存当前阅读状态（如果正在阅读）
-            was_reading = self.controller.is_reading
-            current_progress = self.controller.get_progress() if self.controller.is_reading else 0
-            was_paused = self.controller.is_paused
+            # 提交布局命令：阅读中由阅读线程在字符之间原子地应用，
+            # 不再停止并重启阅读线程，计时和渐隐状态都不受影响
+            print(f"[GUI-DEBUG] 提交布局命令，正在阅读={self.controller.is_reading}, 暂停={self.controller.pause_requested}")
+            self.controller.request_layout(self.text_display, **layout)
             
-            # 如果正在阅读，先完全停止以避免状态冲突
-            if was_reading:
-                print(f"[GUI-DEBUG] 正在阅读中，完全停止以更新布局: 进度={current_progress:.1%}, 暂停={was_paused}")
-                # 完全停止阅读线程，避免与重分页冲突
-                self.controller.stop_reading()
-                
-                # 等待线程完全结束
-                if self.controller.reading_thread and self.controller.reading_thread.is_alive():
-                    self.controller.reading_thread.join(timeout=2.0)
-                    print(f"[GUI-DEBUG] 阅读线程已完全停止")
-            
-            # 在完全停止状态下安全地更新控制器参数
-            print(f"[GUI-DEBUG] 更新控制器参数...")
-            
-            # 设置智能分页参数
-            self.controller.set_text_widget_reference(
-                self.text_display, 
-                available_height, 
-                font_size, 
-                line_spacing
-            )
-            
-            self.controller.set_max_line_length(chars_per_line)
-            self.controller.set_lines_per_page(lines_per_page)
-            print(f"[GUI-DEBUG] 控制器参数更新完成，包括智能分页参数")
-            
-            # 如果之前正在阅读，重新启动阅读
-            if was_reading:
-                print(f"[GUI-DEBUG] 重新启动阅读...")
-                
-                # 特别针对page模式的安全重启逻辑
-                if self.controller.mode == 'page':
-                    # Page模式：验证current_page是否仍然有效
-                    if self.controller.current_page >= len(self.controller.pages):
-                        print(f"[GUI-DEBUG] Page模式：当前页{self.controller.current_page}超出新页数{len(self.controller.pages)}，调整到最后一页")
-                        self.controller.current_page = max(0, len(self.controller.pages) - 1)
-                    print(f"[GUI-DEBUG] Page模式安全重启：当前页{self.controller.current_page}/{len(self.controller.pages)}")
-                
-                # 重新启动阅读
-                self.controller.is_reading = True
-                self.controller.is_paused = was_paused  # 恢复原始暂停状态
-                
-                # 启动新的阅读线程
-                import threading
-                if self.controller.mode == 'line':
-                    self.controller.reading_thread = threading.Thread(target=self.controller._line_reading_loop_with_fade)
-                else:
-                    self.controller.reading_thread = threading.Thread(target=self.controller._page_reading_loop)
-                
-                self.controller.reading_thread.daemon = True
-                self.controller.reading_thread.start()
-                print(f"[GUI-DEBUG] 新阅读线程已启动，暂停状态: {was_paused}")
-                
-                # 立即更新显示
-                print(f"[GUI-DEBUG] 立即更新显示以应用新布局")
-                self.update_display()
-            else:
-                # 未在阅读，只需更新显示
-                print(f"[GUI-DEBUG] 未在阅读，只更新显示")
-                self.update_display()
+            # 立即更新显示以应用新布局
+            self.update_display()
                 
         except Exception as e:
             print(f"[GUI-DEBUG] 更新布局参数时出错: {e}")
             import traceback
             traceback.print_exc()
     
-    def show_full_article(self):
-        """显示完整文章"""
+    def _measure_layout(self) -> Optional[dict]:
+        """测量文本区域并计算布局参数，窗口尚未初始化时返回None"""
+        # 获取文本显示区域的实际大小
+        text_width = self.text_display.winfo_width()
+        text_height = self.text_display.winfo_height()
+        
+        print(f"[GUI-DEBUG] 窗口尺寸: {text_width}x{text_height}")
+        
+        if text_width <= 1 or text_height <= 1:
+            return None
+        
+        # 获取字体大小和行间距
+        font_size = self.settings.get_int('reading', 'font_size', 60)
+        line_spacing = self.settings.get_float('reading', 'line_spacing', 1.5)
+        
+        print(f"[GUI-DEBUG] 字体大小: {font_size}, 行间距: {line_spacing}")
+        
+        # 尺寸和字体都没变时沿用上次的测量结果（复用窗口打开新文章时无需再插入测试文本）
+        key = (text_width, text_height, font_size, line_spacing)
+        if self._measured_layout and self._measured_layout[0] == key:
+            print(f"[GUI-DEBUG] 沿用上次测量的布局参数")
+            return dict(self._measured_layout[1])
+        
+        # 更准确地计算字符宽度（中文字符）
+        char_width = font_size * 0.6  # 中文字符大约是字体大小的0.6倍宽
+        
+        # 通过实际测量来计算行高
+        # 创建临时测试文本来测量实际行高
         self.text_display.config(state='normal')
+        
+        # 保存当前内容
+        current_content = self.text_display.get(1.0, tk.END)
+        print(f"[GUI-DEBUG] 保存当前内容，长度: {len(current_content)}")
+        
+        # 插入测试文本（多行）来测量行高
+        test_text = "测试行一\n测试行二\n测试行三"
+        self.text_display.delete(1.0, tk.END)  # 覆盖在上面的页面和全文视图保持不变
+        self.text_display.insert(1.0, test_text, 'content')
+        
+        # 强制更新显示
+        self.text_display.update_idletasks()
+        print(f"[GUI-DEBUG] 已插入测试文本并更新显示")
+        
+        # 测量文本高度
+        bbox_first = self.text_display.bbox("1.0")
+        bbox_third = self.text_display.bbox("3.0")
+        
+        print(f"[GUI-DEBUG] bbox_first: {bbox_first}, bbox_third: {bbox_third}")
+        
+        actual_line_height = None
+        row_height = None  # 单行行高，交给控制器分页使用，避免控制器再次插入测试文本
+        if bbox_first and bbox_third:
+            # 计算实际行高（包括行间距）
+            actual_line_height = bbox_third[1] - bbox_first[1]
+            row_height = actual_line_height / 2 if actual_line_height > 0 else None
+            print(f"[GUI-DEBUG] 实际测量行高: {actual_line_height}px")
+        else:
+            # 如果测量失败，使用估算值但包含行间距
+            actual_line_height = font_size * line_spacing
+            print(f"[GUI-DEBUG] 测量失败，使用估算行高（含行间距）: {actual_line_height}px")
+        
+        # 确保行高不为0或负数
+        if actual_line_height <= 0:
+            actual_line_height = font_size * 1.5
+            print(f"[GUI-DEBUG] 行高无效，使用默认值: {actual_line_height}px")
+        
+        # 恢复原内容
         self.text_display.delete(1.0, tk.END)
-        # 使用原始内容，保持自然段落结构
-        self.text_display.insert(1.0, self.article.original_content, 'content')
+        self.text_display.insert(1.0, current_content)
+        self.text_display.config(state='disabled')
+        print(f"[GUI-DEBUG] 已恢复原内容")
+        
+        # 计算每行可容纳的字符数（留一些边距）
+        chars_per_line = max(20, int((text_width - 40) / char_width))
+        
+        # 计算每页可容纳的行数（确保最后一行有足够空间）
+        # 预留更多边距，并使用向下取整后再减1确保空间充足
+        available_height = text_height - 100  # 增加更多边距，确保底部有足够空间
+        max_lines = available_height / actual_line_height
+        
+        # 使用floor确保不会超出边界，并额外减去1行的安全边距
+        import math
+        lines_per_page = max(3, int(math.floor(max_lines - 1.0)))
+        
+        print(f"[GUI-DEBUG] 布局参数更新: 文本区域{text_width}x{text_height}, "
+              f"实际行高: {actual_line_height:.1f}px, 可用高度: {available_height}px, "
+              f"理论最大行数: {max_lines:.2f}, 安全行数: {lines_per_page}")
+        print(f"[GUI-DEBUG] 字符/行: {chars_per_line}, 行/页: {lines_per_page}")
+        
+        # 验证计算结果
+        required_height = lines_per_page * actual_line_height + 100
+        print(f"[GUI-DEBUG] 验证: {lines_per_page}行需要{required_height:.1f}px，实际有{text_height}px")
+        
+        layout = {
+            'available_height': available_height,
+            'font_size': font_size,
+            'line_spacing': line_spacing,
+            'max_line_length': chars_per_line,
+            'lines_per_page': lines_per_page,
+            'line_height': row_height,
+        }
+        self._measured_layout = (key, layout)
+        return dict(layout)
+    
+    def show_full_article(self):
+        """显示完整文章：全文只在共享缓冲中插入一次，这里只把全文视图覆盖到文本框上"""
+        if self._article_view_shown and self.article_buffer.article is self.article:
+            return
+        self._clear_text_display()
         self.text_display.config(state='disabled')
+        self.article_buffer.load(self.article)
+        self.article_view.place(in_=self.text_display, x=0, y=0, relwidth=1, relheight=1)
+        tk.Misc.lift(self.article_view, self.text_display)
+        self.article_view.see(1.0)
+        self._article_view_shown = True
+    
+    def _hide_full_article(self):
+        """隐藏全文视图，露出文本框或正文渲染器"""
+        if self._article_view_shown:
+            self.article_view.place_forget()
+            self._article_view_shown = False
     
     def start_reading(self):
         """开始阅读"""
@@ -446,30 +568,29 @@ class ReadingWindow:
         # 清除重置状态标志
         self.is_reset_state = False
         
-        # 确保布局参数是最新的
-        print(f"[GUI-DEBUG] 强制更新布局参数...")
-        self.update_layout_params()
-        print(f"[GUI-DEBUG] 布局参数更新完成")
-        
-        # 清空显示，准备分页模式
-        self.text_display.config(state='normal')
-        self.text_display.delete(1.0, tk.END)
-        self.text_display.config(state='disabled')
-        print(f"[GUI-DEBUG] 文本框已清空")
+        # 布局参数由打开流程和窗口大小变化维护，这里不再重复测量和分页
         
         # 恢复正常的按钮状态，包括固定的通览全文按钮
         self.overview_button.pack(side='left', padx=(0, 10))
         
         self.controller.start_reading()
-        self.pause_button.config(text="⏸ 暂停", state='normal')
-        self.stop_button.config(text="⏹ 结束阅读", state='normal')
-        self.reset_button.config(state='disabled')  # 阅读中禁用重置
-        self.status_label.config(text="正在阅读...")
+        self._tick_driven = self.controller.uses_tick_engine()
+        if self._tick_driven:
+            self._schedule_tick()
+        self.ui_state.apply(self.pause_button, text="⏸ 暂停", state='normal')
+        self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='normal')
+        self.ui_state.apply(self.reset_button, state='disabled')  # 阅读中禁用重置
+        self.ui_state.apply(self.status_label, text="正在阅读...")
         print(f"[GUI-DEBUG] UI状态已更新，控制器已启动")
         
-        # 立即更新显示到分页模式
-        self.update_display()
-        print(f"[GUI-DEBUG] 首次显示更新已调用")
+        # 立即同步显示首页，不经过after(0)调度
+        self._update_display_safe()
+        if self.time_to_first_page is None:
+            self.text_display.update_idletasks()
+            self.time_to_first_page = time.perf_counter() - self._open_started_at
+            print(f"[GUI-DEBUG] 首屏耗时: {self.time_to_first_page * 1000:.1f} ms "
+                  f"(分页 {self.controller.pagination_count} 次)")
+        print(f"[GUI-DEBUG] 首次显示更新已完成")
     
     def pause_reading(self):
         """暂停/继续阅读"""
@@ -483,17 +604,19 @@ class ReadingWindow:
             self.start_reading()
             return
         
-        # 正常的暂停/继续逻辑
-        self.controller.pause_reading()
-        if self.controller.is_paused:
-            self.pause_button.config(text="▶ 继续")
-            self.reset_button.config(state='normal')  # 暂停时启用重置
-            self.status_label.config(text="已暂停")
+        # 正常的暂停/继续逻辑：命令由阅读线程在下一帧之前执行，按钮按请求的状态立即更新
+        if self.controller.pause_reading():
+            self._cancel_tick()  # 暂停期间不再安排tick，主线程空闲
+            self.ui_state.apply(self.pause_button, text="▶ 继续")
+            self.ui_state.apply(self.reset_button, state='normal')  # 暂停时启用重置
+            self.ui_state.apply(self.status_label, text="已暂停")
             print(f"[GUI-DEBUG] 阅读已暂停")
         else:
-            self.pause_button.config(text="⏸ 暂停")
-            self.reset_button.config(state='disabled')  # 继续时禁用重置
-            self.status_label.config(text="正在阅读...")
+            if self._tick_driven and self.controller.is_reading:
+                self._schedule_tick()
+            self.ui_state.apply(self.pause_button, text="⏸ 暂停")
+            self.ui_state.apply(self.reset_button, state='disabled')  # 继续时禁用重置
+            self.ui_state.apply(self.status_label, text="正在阅读...")
             print(f"[GUI-DEBUG] 阅读已继续")
     
     def stop_reading(self):
@@ -503,13 +626,14 @@ class ReadingWindow:
         # 清除重置状态
         self.is_reset_state = False
         
+        self._cancel_tick()
         self.controller.stop_reading()
-        self.pause_button.config(state='disabled', text="⏸ 暂停")
-        self.stop_button.config(text="⏹ 结束阅读", state='disabled')
-        self.reset_button.config(state='disabled')  # 停止时禁用重置
-        self.status_label.config(text="已停止")
+        self.ui_state.apply(self.pause_button, state='disabled', text="⏸ 暂停")
+        self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='disabled')
+        self.ui_state.apply(self.reset_button, state='disabled')  # 停止时禁用重置
+        self.ui_state.apply(self.status_label, text="已停止")
         self.show_full_article()
-        self.progress_bar['value'] = 0
+        self.ui_state.apply(self.progress_bar, value=0)
         print(f"[GUI-DEBUG] 阅读已停止，UI状态已重置")
         
         # 先显示和恢复主窗口，确保它准备好接收焦点
@@ -528,19 +652,8 @@ class ReadingWindow:
             except Exception as e:
                 print(f"[GUI-DEBUG] 恢复主窗口时出错: {e}")
         
-        # 延迟销毁阅读窗口，确保主窗口已经完全显示
-        def delayed_destroy():
-            try:
-                if self.window:
-                    self.window.withdraw()  # 先隐藏窗口
-                    self.window.after(100, lambda: self.window.destroy() if self.window else None)  # 延迟销毁
-                    print(f"[GUI-DEBUG] 阅读窗口已安排销毁")
-            except Exception as e:
-                print(f"[GUI-DEBUG] 销毁窗口时出错: {e}")
-        
-        # 延迟执行销毁，给主窗口时间完全显示
-        if self.window:
-            self.window.after(100, delayed_destroy)
+        # 延迟关闭阅读窗口，确保主窗口已经完全显示
+        self._close_window_later()
     
     def reset_reading(self):
         """重置阅读"""
@@ -548,6 +661,7 @@ class ReadingWindow:
         
         # 停止当前阅读
         if self.controller.is_reading:
+            self._cancel_tick()
             self.controller.stop_reading()
         
         # 确保滚动功能被禁用（回到阅读模式）
@@ -555,58 +669,173 @@ class ReadingWindow:
         
         # 重置位置和状态
         self.controller.reset_position()
+        # 停止暂停中的阅读线程时它已发布一份旧进度的快照并排队渲染；发布重置后的快照并记为已渲染，
+        # 排队的那一帧因版本未变化被跳过，不会把刚清除的页面和进度画回来
+        self._rendered_version = self.controller.latest_snapshot().version
         self.show_full_article()
-        self.progress_bar['value'] = 0
-        self.time_label.config(text="剩余时间: --")
+        self.ui_state.apply(self.progress_bar, value=0)
+        self.ui_state.apply(self.time_label, text="剩余时间: --")
         
         # 恢复正常的按钮状态，包括固定的通览全文按钮
         self.overview_button.pack(side='left', padx=(0, 10))
         
-        # 设置为重置状态（类似暂停，但可以重新开始）
+        # 设置为重置状态（类似暂停，但可以重新开始）；控制器已停止，状态由它自己维护
         self.is_reset_state = True
-        self.controller.is_reading = False
-        self.controller.is_paused = True  # 设置为暂停状态，允许继续
         
         # 更新按钮状态
-        self.pause_button.config(text="▶ 开始", state='normal')  # 显示为开始
-        self.stop_button.config(text="⏹ 结束阅读", state='normal')
-        self.reset_button.config(state='disabled')  # 重置后禁用重置按钮
-        self.status_label.config(text="已重置，点击开始重新阅读")
+        self.ui_state.apply(self.pause_button, text="▶ 开始", state='normal')  # 显示为开始
+        self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='normal')
+        self.ui_state.apply(self.reset_button, state='disabled')  # 重置后禁用重置按钮
+        self.ui_state.apply(self.status_label, text="已重置，点击开始重新阅读")
         print(f"[GUI-DEBUG] 阅读已重置，等待重新开始")
     
+    def _bind_seek_keys(self):
+        """绑定定位快捷键：←/→ 上一句/下一句，Ctrl+←/→ 上一段/下一段，PageUp/PageDown 上一页/下一页"""
+        bindings = {
+            '<Left>': ('sentence', -1),
+            '<Right>': ('sentence', 1),
+            '<Control-Left>': ('paragraph', -1),
+            '<Control-Right>': ('paragraph', 1),
+            '<Prior>': ('page', -1),
+            '<Next>': ('page', 1),
+        }
+        for sequence, (target, delta) in bindings.items():
+            handler = lambda event, t=target, d=delta: self._on_seek_key(t, d)
+            self.window.bind(sequence, handler)
+            # 阅读时文本框的<Key>绑定会拦截按键，需要在文本框上单独绑定
+            self.text_display.bind(sequence, handler)
+    
+    def _on_seek_key(self, target: str, delta: int):
+        """定位快捷键：只在阅读中生效，其余时候保留按键的默认行为"""
+        if not self.controller.is_reading or self.controller.is_in_question_mode():
+            return None
+        if target == 'page':
+            self._seek('page', self.controller.snapshot.page_index + delta)
+        else:
+            self._seek(target, delta)
+        return "break"
+    
+    def _on_progress_click(self, event):
+        """点击进度条：跳到点击位置对应的阅读进度"""
+        width = self.progress_bar.winfo_width()
+        if not self.controller.is_reading or width <= 1:
+            return
+        self._seek('progress', max(0.0, min(1.0, event.x / width)))
+    
+    def _seek(self, target: str, value):
+        """发送定位命令并显示结果"""
+        print(f"[GUI-DEBUG] 定位: {target}={value}")
+        self.controller.seek(target, value)
+        # 没有阅读线程时（tick引擎）命令已同步执行，立即发布并渲染；有阅读线程时由它回调
+        self.controller.latest_snapshot()
+        self._render_latest_snapshot()
+    
+    def _schedule_tick(self):
+        """安排tick引擎的下一帧（按控制器的帧节拍对齐截止时间）"""
+        if self._tick_job is None and self.window:
+            interval_ms = max(1, int(self.controller.next_frame_delay() * 1000))
+            self._tick_job = self.window.after(interval_ms, self._on_tick)
+    
+    def _cancel_tick(self):
+        """取消尚未执行的tick"""
+        if self._tick_job is not None:
+            try:
+                self.window.after_cancel(self._tick_job)
+            except tk.TclError:
+                pass
+            self._tick_job = None
+    
+    def _on_tick(self):
+        """tick引擎的一帧：在主线程推进时钟并在同一帧内渲染，没有跨线程回调"""
+        self._tick_job = None
+        try:
+            if self.controller.tick():
+                self._update_display_safe(self.controller.snapshot)
+            if self.controller.is_reading and not self.controller.is_paused:
+                self._schedule_tick()
+        except tk.TclError:
+            # 窗口已关闭
+            pass
+    
+    def _on_window_map(self, event):
+        """窗口重新映射（从最小化或隐藏恢复）"""
+        if event.widget is self.window:
+            self._window_mapped = True
+            self._update_visibility()
+    
+    def _on_window_unmap(self, event):
+        """窗口被最小化或隐藏"""
+        if event.widget is self.window:
+            self._window_mapped = False
+            self._update_visibility()
+    
+    def _on_window_visibility(self, event):
+        """窗口被其他窗口遮住或露出（部分遮住时仍然渲染）"""
+        if event.widget is self.window:
+            self._window_obscured = event.state == 'VisibilityFullyObscured'
+            self._update_visibility()
+    
+    def _update_visibility(self):
+        """窗口变为不可见时暂停渲染，重新可见时渲染一帧补上隐藏期间的变化"""
+        hidden = not self._window_mapped or self._window_obscured
+        if hidden == self._display_hidden:
+            return
+        self._display_hidden = hidden
+        self.controller.set_display_suspended(hidden)
+        if hidden:
+            print(f"[GUI-DEBUG] 阅读窗口不可见，暂停渲染")
+            return
+        print(f"[GUI-DEBUG] 阅读窗口重新可见，渲染补偿帧（隐藏期间省略 {self.controller.stats.hidden_frames} 帧）")
+        # 没有阅读线程时在这里发布最新快照；有阅读线程时它执行恢复命令后会回调
+        self.controller.latest_snapshot()
+        self._render_latest_snapshot()
+    
     def update_display(self):
         """更新显示内容"""
         print(f"[GUI-DEBUG] update_display 被调用")
+        if self._display_hidden:
+            return  # 窗口不可见，恢复时统一渲染最新快照
         # 在主线程中更新UI，不管是否正在阅读都要更新
         if self.window:
             # 使用 after 而不是 after_idle，确保立即执行
-            self.window.after(0, self._update_display_safe)
-            print(f"[GUI-DEBUG] 已调度 _update_display_safe")
+            self.window.after(0, self._render_latest_snapshot)
+            print(f"[GUI-DEBUG] 已调度 _render_latest_snapshot")
         else:
             print(f"[GUI-DEBUG] 警告：窗口不存在")
     
-    def _update_display_safe(self):
-        """安全的UI更新方法"""
+    def _render_latest_snapshot(self):
+        """渲染阅读线程发布的最新快照，版本号未变化时跳过整帧"""
+        if self._display_hidden:
+            return
+        snapshot = self.controller.snapshot  # 快照不可变，无需加锁
+        if snapshot.version == self._rendered_version:
+            print(f"[GUI-DEBUG] 快照版本{snapshot.version}未变化，跳过本帧")
+            return
+        self._update_display_safe(snapshot)
+    
+    def _update_display_safe(self, snapshot: Optional[ReadingSnapshot] = None):
+        """安全的UI更新方法
+        
+        Args:
+            snapshot: 要渲染的快照；为None时（按钮等直接调用）先发布一份最新快照
+        """
         print(f"[GUI-DEBUG] _update_display_safe 开始执行")
         try:
+            if snapshot is None:
+                snapshot = self.controller.latest_snapshot()
+            self._rendered_version = snapshot.version
+            
             # 获取当前状态
-            progress = self.controller.get_progress()
-            is_reading = self.controller.is_reading
+            progress = snapshot.progress
+            is_reading = snapshot.is_reading
             
-            print(f"[GUI-DEBUG] 当前状态: 进度={progress:.1%}, 正在阅读={is_reading}")
+            print(f"[GUI-DEBUG] 当前状态: 进度={progress:.1%}, 正在阅读={is_reading}, 快照版本={snapshot.version}")
             
             # 始终获取并显示当前页内容
-            if hasattr(self.controller, 'get_current_display_text_with_states'):
-                current_text, char_states = self.controller.get_current_display_text_with_states()
-                print(f"[GUI-DEBUG] 获取到显示文本，长度: {len(current_text) if current_text else 0}, 状态数: {len(char_states)}")
-            else:
-                current_text = self.controller.get_current_display_text()
-                char_states = {}
-                print(f"[GUI-DEBUG] 获取到显示文本，长度: {len(current_text) if current_text else 0}")
-            
-            self.text_display.config(state='normal')
-            self.text_display.delete(1.0, tk.END)
+            current_text, fade_bands = snapshot.text, snapshot.fade_bands
+            print(f"[GUI-DEBUG] 获取到显示文本，长度: {len(current_text) if current_text else 0}, 色带数: {len(fade_bands)}")
             
+            # 阅读中的帧只由正文渲染器修改文本框（一次Tcl调用），其余分支清空文本框后直接写入
             # 检查是否处于问题模式
             if self.controller.is_in_question_mode():
                 # 显示问题界面
@@ -614,10 +843,12 @@ class ReadingWindow:
                 print(f"[GUI-DEBUG] 显示问题界面")
             elif is_reading or progress > 0:
                 # 阅读中或已开始阅读，显示分页内容
+                self._hide_full_article()
                 if progress >= 1.0 and not is_reading and not self.controller.is_in_question_mode():
                     # 阅读完成，检查是否有问题（且未在答题模式）
                     # 使用reading_finished标志确保阅读真正完成
-                    if hasattr(self.controller, 'reading_finished') and self.controller.reading_finished:
+                    if snapshot.reading_finished:
+                        self._clear_text_display()
                         if self.controller.has_questions():
                             # 有问题，自动进入问题模式
                             print(f"[GUI-DEBUG] 阅读完成（reading_finished=True），检测到有问题，准备进入答题模式")
@@ -625,63 +856,46 @@ class ReadingWindow:
                             # 先显示过渡信息
                             completion_text = "📚 阅读完成！\n\n文章内容已阅读完毕，正在加载答题环节..."
                             self.text_display.insert(1.0, completion_text, 'content')
+                            self.text_display.config(state='disabled')
                             
                             # 短暂延迟后自动进入答题模式
-                            self.window.after(1500, self._auto_enter_question_mode)
+                            self._question_job = self.window.after(1500, self._auto_enter_question_mode)
                             print(f"[GUI-DEBUG] 已安排1.5秒后进入答题模式")
                         else:
                             # 没有问题，直接显示完成信息
                             completion_text = "🎉 速读训练完成！\n\n恭喜您完成了这篇文章的速读训练。"
                             self.text_display.insert(1.0, completion_text, 'content')
+                            self.text_display.config(state='disabled')
                             print(f"[GUI-DEBUG] 阅读完成，没有问题，显示完成信息")
                     else:
                         # 进度100%但reading_finished=False，可能是其他原因导致的进度计算
                         # 继续显示当前页面内容
-                        if current_text is not None:
-                            display_text = current_text
-                        else:
-                            display_text = ""
-                        
-                        self.text_display.insert(1.0, display_text, 'content')
-                        
-                        if char_states:
-                            self._apply_fade_effects(display_text, char_states)
-                            print(f"[GUI-DEBUG] 应用了渐隐效果到 {len(char_states)} 个字符")
-                        
-                        print(f"[GUI-DEBUG] 进度100%但reading_finished=False，继续显示分页内容")
+                        moved = self.page_renderer.show(current_text or "", fade_bands, snapshot.pacer_band)
+                        print(f"[GUI-DEBUG] 进度100%但reading_finished=False，继续显示分页内容，移动了{moved}个色带")
                 else:
-                    # 正在阅读或暂停中，显示当前页内容
-                    if current_text is not None:
-                        # 直接显示内容，不再强制补齐到固定行数
-                        display_text = current_text
-                    else:
-                        display_text = ""
-                    
-                    # 插入文本
-                    self.text_display.insert(1.0, display_text, 'content')
+                    # 正在阅读或暂停中，显示当前页内容并应用渐隐色带或导读光标
+                    # 页面文本不变时不重新插入，每帧只移动位置变化的标签
+                    moved = self.page_renderer.show(current_text or "", fade_bands, snapshot.pacer_band)
+                    print(f"[GUI-DEBUG] 显示分页内容，移动了{moved}个色带")
                     
-                    # 应用渐隐效果
-                    if char_states:
-                        self._apply_fade_effects(display_text, char_states)
-                        print(f"[GUI-DEBUG] 应用了渐隐效果到 {len(char_states)} 个字符")
-                    
-                    print(f"[GUI-DEBUG] 显示分页内容")
+                    # 阅读当前页时让渲染器预备下一页
+                    next_page = snapshot.page_index + 1
+                    if next_page < snapshot.page_count and next_page != self._prefetched_page:
+                        self.page_renderer.prefetch(self.controller.get_page_text(next_page))
+                        self._prefetched_page = next_page
 
             else:
                 # 未开始阅读，显示完整文章
-                # 使用原始内容，保持自然段落结构
-                self.text_display.insert(1.0, self.article.original_content, 'content')
+                self.show_full_article()
                 print(f"[GUI-DEBUG] 显示完整文章")
             
-            self.text_display.config(state='disabled')
-            
-            # 更新进度条
-            self.progress_bar['value'] = progress * 100
+            # 更新进度条（精确到0.1%，更细的变化在400像素宽的进度条上看不出来）
+            self.ui_state.apply(self.progress_bar, value=round(progress * 100, 1))
             print(f"[GUI-DEBUG] 进度条更新到: {progress * 100:.1f}%")
             
             # 更新剩余时间
-            if is_reading and not self.controller.is_paused:
-                remaining_seconds = self.controller.get_remaining_time()
+            if is_reading and not snapshot.is_paused:
+                remaining_seconds = snapshot.remaining_seconds
                 if remaining_seconds > 0:
                     hours = remaining_seconds // 3600
                     minutes = (remaining_seconds % 3600) // 60
@@ -692,47 +906,47 @@ class ReadingWindow:
                     else:
                         time_str = f"{minutes:02d}:{seconds:02d}"
                     
-                    self.time_label.config(text=f"剩余时间: {time_str}")
+                    self.ui_state.apply(self.time_label, text=f"剩余时间: {time_str}")
                 else:
-                    self.time_label.config(text="剩余时间: 00:00")
+                    self.ui_state.apply(self.time_label, text="剩余时间: 00:00")
             else:
-                self.time_label.config(text="剩余时间: --")
+                self.ui_state.apply(self.time_label, text="剩余时间: --")
             
             # 检查阅读状态
             if self.is_reset_state:
                 # 重置状态：显示可以重新开始
-                self.pause_button.config(text="▶ 开始", state='normal')
-                self.stop_button.config(text="⏹ 结束阅读", state='normal')
-                self.reset_button.config(state='disabled')
-                self.status_label.config(text="已重置，点击开始重新阅读")
+                self.ui_state.apply(self.pause_button, text="▶ 开始", state='normal')
+                self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='normal')
+                self.ui_state.apply(self.reset_button, state='disabled')
+                self.ui_state.apply(self.status_label, text="已重置，点击开始重新阅读")
                 print(f"[GUI-DEBUG] 状态：已重置")
             elif self.controller.is_in_question_mode():
                 # 答题模式：不要覆盖答题模式下的按钮设置
                 print(f"[GUI-DEBUG] 状态：答题模式，保持当前按钮配置")
             elif not is_reading:
                 if progress >= 1.0:
-                    self.status_label.config(text="阅读完成")
+                    self.ui_state.apply(self.status_label, text="阅读完成")
                     # 阅读完成时，保持"结束阅读"按钮可用，让用户能够关闭窗口
-                    self.stop_button.config(text="⏹ 结束阅读", state='normal')  # 阅读完成时保持可用
-                    self.reset_button.config(state='normal')  # 阅读完成时启用重置，允许用户重新阅读
+                    self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='normal')  # 阅读完成时保持可用
+                    self.ui_state.apply(self.reset_button, state='normal')  # 阅读完成时启用重置，允许用户重新阅读
                     print(f"[GUI-DEBUG] 状态：阅读完成")
                 else:
-                    self.status_label.config(text="已停止")
-                    self.stop_button.config(text="⏹ 结束阅读", state='disabled')  # 已停止时禁用
-                    self.reset_button.config(state='disabled')  # 已停止时禁用重置
+                    self.ui_state.apply(self.status_label, text="已停止")
+                    self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='disabled')  # 已停止时禁用
+                    self.ui_state.apply(self.reset_button, state='disabled')  # 已停止时禁用重置
                     print(f"[GUI-DEBUG] 状态：已停止")
-                self.pause_button.config(state='disabled', text="⏸ 暂停")
-            elif self.controller.is_paused:
-                self.status_label.config(text="已暂停")
-                self.pause_button.config(text="▶ 继续", state='normal')
-                self.stop_button.config(text="⏹ 结束阅读", state='normal')  # 暂停时保持可用
-                self.reset_button.config(state='normal')  # 暂停时启用重置
+                self.ui_state.apply(self.pause_button, state='disabled', text="⏸ 暂停")
+            elif snapshot.is_paused:
+                self.ui_state.apply(self.status_label, text="已暂停")
+                self.ui_state.apply(self.pause_button, text="▶ 继续", state='normal')
+                self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='normal')  # 暂停时保持可用
+                self.ui_state.apply(self.reset_button, state='normal')  # 暂停时启用重置
                 print(f"[GUI-DEBUG] 状态：已暂停")
             else:
-                self.status_label.config(text=f"正在阅读... ({progress:.1%})")
-                self.pause_button.config(text="⏸ 暂停", state='normal')
-                self.stop_button.config(text="⏹ 结束阅读", state='normal')  # 阅读中保持可用
-                self.reset_button.config(state='disabled')  # 阅读中禁用重置
+                self.ui_state.apply(self.status_label, text=f"正在阅读... ({progress:.1%})")
+                self.ui_state.apply(self.pause_button, text="⏸ 暂停", state='normal')
+                self.ui_state.apply(self.stop_button, text="⏹ 结束阅读", state='normal')  # 阅读中保持可用
+                self.ui_state.apply(self.reset_button, state='disabled')  # 阅读中禁用重置
                 print(f"[GUI-DEBUG] 状态：正在阅读 {progress:.1%}")
                 
         except tk.TclError:
@@ -748,12 +962,13 @@ class ReadingWindow:
     
     def _auto_enter_question_mode(self):
         """自动进入答题模式"""
+        self._question_job = None
         print(f"[GUI-DEBUG] _auto_enter_question_mode 开始执行")
         try:
             # 确保控制器有问题可以显示
             if self.controller.has_questions():
                 # 自动进入问题模式
-                self.controller.is_question_mode = True
+                self.controller.enter_question_mode()
                 print(f"[GUI-DEBUG] 设置问题模式标志为True")
                 
                 # 更新按钮为答题模式
@@ -773,105 +988,73 @@ class ReadingWindow:
             import traceback
             traceback.print_exc()
     
-    def _apply_fade_effects(self, text: str, char_states: dict):
-        """应用渐隐效果到文本"""
-        print(f"[GUI-DEBUG] 开始应用渐隐效果")
+    def _clear_text_display(self):
+        """清空文本框并置为可编辑（显示问题、完成信息或全文前调用），正文渲染器下一帧重新显示页面"""
+        self.text_display.config(state='normal')
+        self.text_display.delete(1.0, tk.END)
+        self._hide_full_article()
+        for renderer in self.page_renderers.values():
+            renderer.invalidate()  # 画布类渲染器同时隐藏画布，露出文本框
+    
+    def _configure_page_renderers(self):
+        """按设置选择正文渲染器，生成渐变调色板并设置导读光标颜色和字体"""
+        name = self.settings.get('reading', 'renderer', 'text')
+        if name not in self.page_renderers and name in ('canvas', 'image'):
+            canvas = tk.Canvas(self.text_frame, highlightthickness=0, borderwidth=0, cursor='arrow')
+            renderer_class = CanvasTextRenderer if name == 'canvas' else ImagePageRenderer
+            self.page_renderers[name] = renderer_class(canvas, self.text_display, self.controller.fading_levels)
+            if name == 'image':
+                self.page_renderers[name].failure_callback = self._on_page_renderer_failed
         
-        # 配置渐隐级别的tag样式
-        bg_color = self.settings.get('reading', 'background_color', 'white')
         text_color = self.settings.get('reading', 'text_color', 'black')
-        
-        # 定义渐隐颜色序列 (优化版：减少级别数)
-        # 动态根据控制器的fading_levels生成颜色
-        fading_levels = getattr(self.controller, 'fading_levels', 2)
-        
-        if fading_levels <= 2:
-            # 简化版：只有3个状态 - normal, fading_1, faded
-            fade_colors = [
-                text_color,     # normal - 正常黑色
-                '#808080',      # fading_1 - 中灰
-                bg_color        # faded - 背景色(白色)
-            ]
-        else:
-            # 传统版：支持更多级别（向后兼容）
-            fade_colors = [
-                text_color,     # normal - 正常黑色
-                '#404040',      # fading_1 - 深灰
-                '#808080',      # fading_2 - 中灰
-                '#B0B0B0',      # fading_3 - 浅灰
-                '#D0D0D0',      # fading_4 - 很浅灰
-                bg_color        # faded - 背景色(白色)
-            ]
-        
-        # 配置所有渐隐级别的tag
-        for i, color in enumerate(fade_colors):
-            if i == 0:
-                tag_name = 'normal'
-            elif i < len(fade_colors) - 1:
-                tag_name = f'fading_{i}'
-            else:
-                tag_name = 'faded'
-                
-            self.text_display.tag_configure(tag_name, foreground=color)
-            print(f"[GUI-DEBUG] 配置tag {tag_name}: {color}")
-        
-        # 清除之前的所有渐隐标签，避免冲突
-        all_fade_tags = ['normal'] + [f'fading_{i}' for i in range(1, len(fade_colors)-1)] + ['faded']
-        for tag in all_fade_tags:
-            self.text_display.tag_delete(tag)
-            self.text_display.tag_configure(tag, foreground=fade_colors[all_fade_tags.index(tag)])
-        
-        # 将全局字符位置转换为行列位置
-        lines = text.split('\n')
-        applied_count = 0
-        invalid_positions = 0
-        
-        for pos, state in char_states.items():
-            # 计算该位置对应的行和列
-            row, col = self._global_pos_to_row_col(pos, lines)
-            
-            if row < len(lines) and col < len(lines[row]):
-                try:
-                    # tkinter使用1基索引
-                    start_index = f"{row + 1}.{col}"
-                    end_index = f"{row + 1}.{col + 1}"
-                    
-                    self.text_display.tag_add(state, start_index, end_index)
-                    applied_count += 1
-                    
-                    if applied_count <= 5:  # 只显示前几个用于调试
-                        print(f"[GUI-DEBUG] 字符位置{pos} -> 行{row+1}列{col}, 状态:{state}")
-                        
-                except tk.TclError as e:
-                    print(f"[GUI-DEBUG] 索引错误: {e}")
-                    invalid_positions += 1
-            else:
-                invalid_positions += 1
-                if invalid_positions <= 5:  # 只显示前几个无效位置用于调试
-                    print(f"[GUI-DEBUG] 无效位置: {pos} -> 行{row+1}列{col}, 文本行数:{len(lines)}")
-        
-        print(f"[GUI-DEBUG] 成功应用了 {applied_count} 个字符的渐隐效果，{invalid_positions} 个无效位置")
+        background_color = self.settings.get('reading', 'background_color', 'white')
+        pacer_color = self.settings.get('reading', 'pacer_color', '#FFE08A')
+        for renderer in self.page_renderers.values():
+            renderer.configure_palette(text_color, background_color, self.controller.fading_levels)
+            renderer.configure_pacer(pacer_color)
+            renderer.configure_font('Microsoft YaHei', self.settings.get_int('reading', 'font_size', 60),
+                                    self.settings.get_float('reading', 'line_spacing', 1.5))
+        
+        renderer = self.page_renderers.get(name, self.fade_renderer)
+        if renderer is not self.page_renderer:
+            # 切换渲染器：全部失效，下一帧由新渲染器完整显示当前页
+            for other in self.page_renderers.values():
+                other.invalidate()
+            self.page_renderer = renderer
+            self._rendered_version = -1
+        self._prefetched_page = -1  # 字体或颜色变化后重新预备下一页
+        print(f"[GUI-DEBUG] 正文渲染器: {type(self.page_renderer).__name__}")
     
-    def _global_pos_to_row_col(self, global_pos: int, lines: list) -> tuple:
-        """将全局字符位置转换为行列位置"""
-        current_pos = 0
+    def _on_page_renderer_failed(self):
+        """图像渲染器合成出错：关闭它并换回Text控件渲染器，重新显示当前页（下次修改设置时再重建）"""
+        failed = self.page_renderer
+        for name, renderer in list(self.page_renderers.items()):
+            if renderer is failed and renderer is not self.fade_renderer:
+                renderer.close()
+                del self.page_renderers[name]
+        print(f"[GUI-DEBUG] {type(failed).__name__} 出错，换用 {type(self.fade_renderer).__name__}")
+        self.fade_renderer.invalidate()
+        self.page_renderer = self.fade_renderer
+        self._rendered_version = -1
+        self._prefetched_page = -1
+        self.controller.latest_snapshot()
+        self._render_latest_snapshot()
+    
+    def _apply_display_settings(self):
+        """按设置更新文本框、全文视图和正文渲染器的字体、颜色和行间距"""
+        font = ('Microsoft YaHei', self.settings.get_int('reading', 'font_size', 60))
+        background_color = self.settings.get('reading', 'background_color', 'white')
+        text_color = self.settings.get('reading', 'text_color', 'black')
+        self.window.configure(bg=background_color)
+        self.text_display.config(font=font, bg=background_color, fg=text_color)
+        self.article_view.config(font=font, bg=background_color, fg=text_color)
         
-        for row, line in enumerate(lines):
-            line_length = len(line)
-            
-            # 检查是否在当前行内
-            if current_pos <= global_pos < current_pos + line_length:
-                col = global_pos - current_pos
-                return row, col
-            
-            # 移到下一行（+1是为了换行符）
-            current_pos += line_length + 1
+        line_spacing = self.settings.get_float('reading', 'line_spacing', 1.5)
+        self.text_display.tag_configure('content', spacing1=10, spacing3=10, 
+                                       spacing2=int(line_spacing * 10))
+        self.article_buffer.configure_spacing(line_spacing)
         
-        # 如果位置超出范围，返回最后位置
-        if lines:
-            return len(lines) - 1, len(lines[-1])
-        else:
-            return 0, 0
+        self._configure_page_renderers()
     
     def open_settings(self):
         """打开设置"""
@@ -881,23 +1064,8 @@ class ReadingWindow:
         
         # 设置关闭回调，更新阅读器设置
         def on_settings_close():
-            self.controller.set_reading_speed(self.settings.get_int('reading', 'reading_speed', 300))
-            self.controller.set_mode(self.settings.get('reading', 'mode', 'line'))
-            
-            # 设置高性能模式
-            high_performance = self.settings.get('reading', 'high_performance_mode', 'True').lower() == 'true'
-            self.controller.set_high_performance_mode(high_performance)
-            
-            # 更新显示样式
-            self.text_display.config(
-                font=('Microsoft YaHei', self.settings.get_int('reading', 'font_size', 60)),
-                bg=self.settings.get('reading', 'background_color', 'white'),
-                fg=self.settings.get('reading', 'text_color', 'black')
-            )
-            
-            line_spacing = self.settings.get_float('reading', 'line_spacing', 1.5)
-            self.text_display.tag_configure('content', spacing1=10, spacing3=10, 
-                                           spacing2=int(line_spacing * 10))
+            self._configure_controller()  # 驱动方式下次开始阅读时生效
+            self._apply_display_settings()
             
             # 重新计算布局参数
             self.update_layout_params()
@@ -908,12 +1076,12 @@ class ReadingWindow:
         """打开通览全文窗口"""
         try:
             # 如果正在阅读且未暂停，自动暂停
-            was_reading_and_not_paused = self.controller.is_reading and not self.controller.is_paused
+            was_reading_and_not_paused = self.controller.is_reading and not self.controller.pause_requested
             if was_reading_and_not_paused:
                 self.pause_reading()
                 print(f"[GUI-DEBUG] 自动暂停阅读以打开通览窗口")
             
-            overview_window = ArticleOverviewWindow(self.window, self.article, self.settings)
+            overview_window = ArticleOverviewWindow(self.window, self.article, self.settings, self.article_buffer)
             overview_window.show()
         except Exception as e:
             print(f"[GUI-DEBUG] 打开通览全文窗口时出错: {e}")
@@ -938,6 +1106,7 @@ class ReadingWindow:
         # 清理阅读状态
         try:
             if self.controller.is_reading:
+                self._cancel_tick()
                 self.controller.stop_reading()
             
             # 退出答题模式
@@ -962,19 +1131,33 @@ class ReadingWindow:
             except Exception as e:
                 print(f"[GUI-DEBUG] 恢复主窗口时出错: {e}")
         
-        # 延迟销毁阅读窗口，确保主窗口已经完全显示
-        def delayed_destroy():
+        # 延迟关闭阅读窗口，确保主窗口已经完全显示
+        self._close_window_later()
+    
+    def _close_window_later(self):
+        """延迟隐藏并关闭窗口，给主窗口时间完全显示；窗口池中的窗口只隐藏，留待下一篇文章复用"""
+        def delayed_close():
+            self._close_job = None
             try:
                 if self.window:
                     self.window.withdraw()  # 先隐藏窗口
-                    self.window.after(100, lambda: self.window.destroy() if self.window else None)  # 延迟销毁
+                    if self.pooled:
+                        print(f"[GUI-DEBUG] 阅读窗口已隐藏，留在窗口池中复用")
+                        return
+                    self.window.after(100, lambda: self.destroy() if self.window else None)  # 延迟销毁
                     print(f"[GUI-DEBUG] 阅读窗口已安排销毁")
             except Exception as e:
                 print(f"[GUI-DEBUG] 销毁窗口时出错: {e}")
         
-        # 延迟执行销毁，给主窗口时间完全显示
         if self.window:
-            self.window.after(100, delayed_destroy)
+            self._close_job = self.window.after(100, delayed_close)
+    
+    def is_alive(self) -> bool:
+        """窗口是否仍然存在（未被销毁）"""
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
     
     def show(self):
         """显示窗口"""
@@ -986,7 +1169,10 @@ class ReadingWindow:
     def destroy(self):
         """销毁窗口"""
         if self.controller.is_reading:
+            self._cancel_tick()
             self.controller.stop_reading()
+        for renderer in self.page_renderers.values():
+            renderer.close()  # 停止图像渲染器的后台线程和轮询
         if self.window:
             self.window.destroy()
     
@@ -1047,7 +1233,7 @@ class ReadingWindow:
         
         # 清空文本显示区域
         self.text_display.config(state='normal')
-        self.text_display.delete(1.0, tk.END)
+        self._clear_text_display()
         
         # 显示答题标题
         self.text_display.insert(tk.END, f"📝 答题环节\n\n本文共有 {len(questions)} 道题目，请逐题作答：\n\n", 'content')
@@ -1188,15 +1374,15 @@ class ReadingWindow:
     def _update_buttons_for_individual_quiz(self):
         """更新底部按钮为独立答题模式"""
         # 答题模式只显示两个按钮
-        self.pause_button.config(text="📖 通览全文", command=self.open_overview, state='normal')
-        self.stop_button.config(text="❌ 关闭训练", command=self._finish_training, state='normal')
-        self.reset_button.config(text="", command=lambda: None, state='disabled')  # 隐藏第三个按钮
+        self.ui_state.apply(self.pause_button, text="📖 通览全文", command=self.open_overview, state='normal')
+        self.ui_state.apply(self.stop_button, text="❌ 关闭训练", command=self._finish_training, state='normal')
+        self.ui_state.apply(self.reset_button, text="", command=lambda: None, state='disabled')  # 隐藏第三个按钮
         self.reset_button.pack_forget()  # 完全隐藏第三个按钮
         
         # 隐藏固定的通览全文按钮以避免重复
         self.overview_button.pack_forget()
         
-        self.status_label.config(text="请逐题作答，完成后可关闭训练")
+        self.ui_state.apply(self.status_label, text="请逐题作答，完成后可关闭训练")
     
     def _show_quiz_summary(self):
         """显示答题总结"""
@@ -1245,21 +1431,22 @@ class ReadingWindow:
         self._disable_scrolling()
         
         # 答题完成后也只显示两个按钮
-        self.pause_button.config(text="📖 通览全文", command=self.open_overview, state='normal')
-        self.stop_button.config(text="❌ 关闭训练", command=self._finish_training, state='normal')
-        self.reset_button.config(text="", command=lambda: None, state='disabled')  # 隐藏第三个按钮
+        self.ui_state.apply(self.pause_button, text="📖 通览全文", command=self.open_overview, state='normal')
+        self.ui_state.apply(self.stop_button, text="❌ 关闭训练", command=self._finish_training, state='normal')
+        self.ui_state.apply(self.reset_button, text="", command=lambda: None, state='disabled')  # 隐藏第三个按钮
         self.reset_button.pack_forget()  # 完全隐藏第三个按钮
         
         # 隐藏固定的通览全文按钮以避免重复
         self.overview_button.pack_forget()
         
-        self.status_label.config(text="训练完成 - 可以通览全文或关闭训练")
+        self.ui_state.apply(self.status_label, text="训练完成 - 可以通览全文或关闭训练")
     
     def _finish_training(self):
         """完成训练，关闭窗口返回主页"""
         # 清理阅读状态（不需要确认，因为用户主动选择完成）
         try:
             if self.controller.is_reading:
+                self._cancel_tick()
                 self.controller.stop_reading()
             
             # 退出答题模式
@@ -1284,16 +1471,5 @@ class ReadingWindow:
             except Exception as e:
                 print(f"[GUI-DEBUG] 恢复主窗口时出错: {e}")
         
-        # 延迟销毁阅读窗口，确保主窗口已经完全显示
-        def delayed_destroy():
-            try:
-                if self.window:
-                    self.window.withdraw()  # 先隐藏窗口
-                    self.window.after(100, lambda: self.window.destroy() if self.window else None)  # 延迟销毁
-                    print(f"[GUI-DEBUG] 训练窗口已安排销毁")
-            except Exception as e:
-                print(f"[GUI-DEBUG] 销毁窗口时出错: {e}")
-        
-        # 延迟执行销毁，给主窗口时间完全显示
-        if self.window:
-            self.window.after(100, delayed_destroy) 
\ No newline at end of file
+        # 延迟关闭训练窗口，确保主窗口已经完全显示
+        self._close_window_later() 
\ No newline at end of file
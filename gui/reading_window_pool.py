@@ -0,0 +1,59 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 阅读窗口池
+"""
+import time
+from typing import Optional
+from core.article_parser import Article
+from core.layout_cache import LayoutCache
+from core.settings import Settings
+from gui.reading_window import ReadingWindow
+
+
+class ReadingWindowPool:
+    """阅读窗口池：保留一个建好的阅读窗口（连同控制器、渲染器和测量好的布局）
+
+    关闭阅读窗口时只隐藏不销毁；打开下一篇文章时载入新内容和分页缓存，
+    不再重建Toplevel和全部控件。主窗口空闲时可以预先建好一个隐藏的窗口。
+    """
+
+    def __init__(self, parent, settings: Settings, layout_cache: Optional[LayoutCache] = None):
+        self.parent = parent
+        self.settings = settings
+        self.layout_cache = layout_cache
+        self.window: Optional[ReadingWindow] = None
+        self.last_switch_time: Optional[float] = None  # 最近一次打开文章的耗时（秒），不含首帧之后的阅读
+
+    def _available(self) -> bool:
+        """池中是否有仍然存在、可以复用的窗口"""
+        return self.window is not None and self.window.is_alive()
+
+    def _create(self, article: Optional[Article]) -> ReadingWindow:
+        """新建一个由窗口池管理的阅读窗口"""
+        window = ReadingWindow(self.parent, article, self.settings, self.layout_cache)
+        window.pooled = True
+        return window
+
+    def prepare(self):
+        """预先建好一个隐藏的阅读窗口（在主窗口空闲时调用）"""
+        if not self._available():
+            self.window = self._create(None)
+
+    def acquire(self, article: Article) -> ReadingWindow:
+        """取得阅读窗口并载入文章：有可复用的窗口时只替换内容，否则新建"""
+        start = time.perf_counter()
+        if self._available():
+            self.window.load_article(article)
+        else:
+            self.window = self._create(article)
+        self.last_switch_time = time.perf_counter() - start
+        print(f"[GUI-DEBUG] 打开文章耗时: {self.last_switch_time * 1000:.1f} ms")
+        return self.window
+
+    def destroy(self):
+        """销毁池中的窗口"""
+        if self.window:
+            self.window.destroy()
+            self.window = None
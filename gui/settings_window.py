@@ -8,6 +8,7 @@ import tkinter as tk
 from tkinter import ttk, colorchooser
 from typing import Optional, Callable
 from core.settings import Settings
+from core.reading_controller import MIN_READING_SPEED, MAX_READING_SPEED, MAX_HIGH_SPEED
 
 class SettingsWindow:
     def __init__(self, parent, settings: Settings):
@@ -20,10 +21,18 @@ class SettingsWindow:
         self.font_size_var = tk.StringVar()
         self.line_spacing_var = tk.StringVar() 
         self.reading_speed_var = tk.StringVar()
+        self.high_speed_var = tk.BooleanVar()  # 高速模式
         self.background_color_var = tk.StringVar()
         self.text_color_var = tk.StringVar()
         self.mode_var = tk.StringVar()
+        self.page_break_mode_var = tk.StringVar()  # 分页方式
+        self.granularity_var = tk.StringVar()  # 渐隐单位
         self.high_performance_var = tk.BooleanVar()  # 高性能模式
+        self.prepaginate_var = tk.BooleanVar()  # 后台预分页
+        self.engine_mode_var = tk.StringVar()  # 逐行模式驱动方式
+        self.renderer_var = tk.StringVar()  # 正文渲染方式
+        self.line_turn_pause_var = tk.StringVar()  # 逐行模式换页停顿（秒）
+        self.page_turn_pause_var = tk.StringVar()  # 按页模式页间停顿（秒）
         
         self.create_window()
         self.load_current_settings()
@@ -183,32 +192,56 @@ class SettingsWindow:
         speed_control_frame = ttk.Frame(speed_frame)
         speed_control_frame.pack(fill='x', pady=(5, 0))
         
-        speed_scale = ttk.Scale(
+        self.speed_scale = ttk.Scale(
             speed_control_frame,
-            from_=60, to=1200,
+            from_=MIN_READING_SPEED, to=MAX_READING_SPEED,
             orient='horizontal',
             variable=self.reading_speed_var,
             command=self.on_reading_speed_change
         )
-        speed_scale.pack(side='left', fill='x', expand=True)
+        self.speed_scale.pack(side='left', fill='x', expand=True)
         
         self.speed_label = ttk.Label(speed_control_frame, text="300")
         self.speed_label.pack(side='right', padx=(10, 0))
         
+        ttk.Checkbutton(
+            speed_frame,
+            text=f"高速模式 (速度上限提高到 {MAX_HIGH_SPEED} 字符/分钟)",
+            variable=self.high_speed_var,
+            command=self.on_high_speed_change
+        ).pack(anchor='w', pady=(5, 0))
+        
         # 阅读模式
         mode_frame = ttk.LabelFrame(parent, text="阅读模式", padding=15)
         mode_frame.pack(fill='x', pady=(0, 15))
         
         ttk.Radiobutton(mode_frame, text="逐行阅读", variable=self.mode_var, value='line').pack(anchor='w', pady=2)
+        ttk.Radiobutton(mode_frame, text="导读光标 (高亮按目标速度扫过文字)", variable=self.mode_var, value='pacer').pack(anchor='w', pady=2)
         ttk.Radiobutton(mode_frame, text="按页阅读", variable=self.mode_var, value='page').pack(anchor='w', pady=2)
         
+        # 渐隐单位（逐行模式）
+        granularity_frame = ttk.LabelFrame(parent, text="渐隐单位 (逐行阅读)", padding=15)
+        granularity_frame.pack(fill='x', pady=(0, 15))
+        
+        ttk.Radiobutton(granularity_frame, text="逐字", variable=self.granularity_var, value='char').pack(anchor='w', pady=2)
+        ttk.Radiobutton(granularity_frame, text="逐词 (按词语整体渐隐)", variable=self.granularity_var, value='word').pack(anchor='w', pady=2)
+        ttk.Radiobutton(granularity_frame, text="短语 (按意群整体渐隐，适合扩大视幅训练)", variable=self.granularity_var, value='phrase').pack(anchor='w', pady=2)
+        ttk.Radiobutton(granularity_frame, text="整行", variable=self.granularity_var, value='line').pack(anchor='w', pady=2)
+        
+        # 分页方式
+        page_break_frame = ttk.LabelFrame(parent, text="分页方式", padding=15)
+        page_break_frame.pack(fill='x', pady=(0, 15))
+        
+        ttk.Radiobutton(page_break_frame, text="快速分页 (逐行填充)", variable=self.page_break_mode_var, value='greedy').pack(anchor='w', pady=2)
+        ttk.Radiobutton(page_break_frame, text="最优分页 (页数最少，页面更均匀)", variable=self.page_break_mode_var, value='optimal').pack(anchor='w', pady=2)
+        
         # 高性能模式
         performance_frame = ttk.LabelFrame(parent, text="性能设置", padding=15)
         performance_frame.pack(fill='x')
         
         high_perf_checkbox = ttk.Checkbutton(
             performance_frame, 
-            text="启用高性能模式 (减少渐隐效果，提高流畅度)", 
+            text="启用高性能模式 (降低刷新频率，提高流畅度)", 
             variable=self.high_performance_var
         )
         high_perf_checkbox.pack(anchor='w', pady=2)
@@ -216,10 +249,40 @@ class SettingsWindow:
         # 高性能模式说明
         ttk.Label(
             performance_frame, 
-            text="启用后将减少文字渐隐的中间状态，提高阅读流畅度，\n特别适合配置较低的设备或阅读较长的文章。",
+            text="启用后将降低画面刷新频率，渐隐仍保持平滑渐变，\n特别适合配置较低的设备或阅读较长的文章。",
             font=('Microsoft YaHei', 9),
             foreground='#666'
         ).pack(anchor='w', pady=(2, 0))
+        
+        prepaginate_checkbox = ttk.Checkbutton(
+            performance_frame,
+            text="加载文章库后在后台预分页 (打开文章更快)",
+            variable=self.prepaginate_var
+        )
+        prepaginate_checkbox.pack(anchor='w', pady=(8, 2))
+        
+        engine_checkbox = ttk.Checkbutton(
+            performance_frame,
+            text="逐行阅读在主线程定时刷新 (不使用后台阅读线程)",
+            variable=self.engine_mode_var,
+            onvalue='tick',
+            offvalue='thread'
+        )
+        engine_checkbox.pack(anchor='w', pady=2)
+        
+        ttk.Label(performance_frame, text="正文渲染方式:").pack(anchor='w', pady=(8, 2))
+        ttk.Radiobutton(performance_frame, text="文本控件 (默认)", variable=self.renderer_var, value='text').pack(anchor='w', pady=2)
+        ttk.Radiobutton(performance_frame, text="画布 (大字号时渐隐不触发重新排版)", variable=self.renderer_var, value='canvas').pack(anchor='w', pady=2)
+        ttk.Radiobutton(performance_frame, text="图像 (后台线程绘制整页，主线程负担最小)", variable=self.renderer_var, value='image').pack(anchor='w', pady=2)
+        
+        # 换页停顿：下一页已在后台预备好，翻页只是交换，停顿可以缩短或设为0
+        ttk.Label(performance_frame, text="换页停顿 (秒，下一页已预先排好，可设为0):").pack(anchor='w', pady=(8, 2))
+        for text, variable in (("逐行/导读光标:", self.line_turn_pause_var), ("按页阅读:", self.page_turn_pause_var)):
+            pause_frame = ttk.Frame(performance_frame)
+            pause_frame.pack(fill='x', pady=2)
+            ttk.Label(pause_frame, text=text, width=14).pack(side='left')
+            ttk.Spinbox(pause_frame, from_=0.0, to=3.0, increment=0.1, width=6,
+                        textvariable=variable).pack(side='left')
     
     def create_appearance_settings(self, parent):
         """创建外观设置"""
@@ -291,11 +354,20 @@ class SettingsWindow:
         """加载当前设置"""
         self.font_size_var.set(self.settings.get('reading', 'font_size', '60'))
         self.line_spacing_var.set(self.settings.get('reading', 'line_spacing', '1.5'))
+        self.high_speed_var.set(self.settings.get('reading', 'high_speed_mode', 'False').lower() == 'true')
+        self.on_high_speed_change()
         self.reading_speed_var.set(self.settings.get('reading', 'reading_speed', '300'))
         self.background_color_var.set(self.settings.get('reading', 'background_color', 'white'))
         self.text_color_var.set(self.settings.get('reading', 'text_color', 'black'))
         self.mode_var.set(self.settings.get('reading', 'mode', 'line'))
+        self.page_break_mode_var.set(self.settings.get('reading', 'page_break_mode', 'greedy'))
+        self.granularity_var.set(self.settings.get('reading', 'granularity', 'char'))
         self.high_performance_var.set(self.settings.get('reading', 'high_performance_mode', 'True').lower() == 'true')
+        self.prepaginate_var.set(self.settings.get('app', 'prepaginate_library', 'False').lower() == 'true')
+        self.engine_mode_var.set(self.settings.get('reading', 'engine_mode', 'thread'))
+        self.renderer_var.set(self.settings.get('reading', 'renderer', 'text'))
+        self.line_turn_pause_var.set(self.settings.get('reading', 'line_turn_pause', '0.5'))
+        self.page_turn_pause_var.set(self.settings.get('reading', 'page_turn_pause', '0.3'))
         
         # 更新显示
         self.update_labels()
@@ -327,6 +399,15 @@ class SettingsWindow:
         """阅读速度改变"""
         self.speed_label.config(text=str(int(float(value))))
     
+    def on_high_speed_change(self):
+        """高速模式切换：调整速度滑块的上限"""
+        max_speed = MAX_HIGH_SPEED if self.high_speed_var.get() else MAX_READING_SPEED
+        self.speed_scale.configure(to=max_speed)
+        speed = self.reading_speed_var.get()
+        if speed and float(speed) > max_speed:
+            self.reading_speed_var.set(str(max_speed))
+            self.speed_label.config(text=str(max_speed))
+    
     def set_background_color(self, color):
         """设置背景颜色"""
         self.background_color_var.set(color)
@@ -355,10 +436,18 @@ class SettingsWindow:
             self.settings.set('reading', 'font_size', str(int(float(self.font_size_var.get()))))
             self.settings.set('reading', 'line_spacing', str(float(self.line_spacing_var.get())))
             self.settings.set('reading', 'reading_speed', str(int(float(self.reading_speed_var.get()))))
+            self.settings.set('reading', 'high_speed_mode', str(self.high_speed_var.get()))
             self.settings.set('reading', 'background_color', self.background_color_var.get())
             self.settings.set('reading', 'text_color', self.text_color_var.get())
             self.settings.set('reading', 'mode', self.mode_var.get())
+            self.settings.set('reading', 'page_break_mode', self.page_break_mode_var.get())
+            self.settings.set('reading', 'granularity', self.granularity_var.get())
             self.settings.set('reading', 'high_performance_mode', str(self.high_performance_var.get()))
+            self.settings.set('app', 'prepaginate_library', str(self.prepaginate_var.get()))
+            self.settings.set('reading', 'engine_mode', self.engine_mode_var.get())
+            self.settings.set('reading', 'renderer', self.renderer_var.get())
+            self.settings.set('reading', 'line_turn_pause', str(max(0.0, float(self.line_turn_pause_var.get()))))
+            self.settings.set('reading', 'page_turn_pause', str(max(0.0, float(self.page_turn_pause_var.get()))))
             
             self.settings.save_settings()
             
@@ -382,11 +471,20 @@ class SettingsWindow:
         """重置到默认值"""
         self.font_size_var.set('60')
         self.line_spacing_var.set('1.5')
+        self.high_speed_var.set(False)
+        self.on_high_speed_change()
         self.reading_speed_var.set('300')
         self.background_color_var.set('white')
         self.text_color_var.set('black')
         self.mode_var.set('line')
+        self.page_break_mode_var.set('greedy')
+        self.granularity_var.set('char')
         self.high_performance_var.set(True)  # 默认启用高性能模式
+        self.prepaginate_var.set(False)
+        self.engine_mode_var.set('thread')
+        self.renderer_var.set('text')
+        self.line_turn_pause_var.set('0.5')
+        self.page_turn_pause_var.set('0.3')
         
         self.update_labels()
         self.update_color_previews()
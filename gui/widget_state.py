@@ -0,0 +1,62 @@
+"""
+(c)2025 ZhangWeb GZYZhy
+Reading Training - Apache License 2.0
+
+锐读 - 速读训练程序 - 控件状态协调
+"""
+import time
+from typing import Any, Dict
+import tkinter as tk
+
+STATS_INTERVAL = 5.0  # 输出控件更新统计的间隔（秒）
+
+
+class WidgetStateCache:
+    """保留模式的控件状态：记住每个控件最近一次应用的选项，只对值变化的选项调用configure
+
+    每帧照常描述按钮、标签和进度条应有的文字、状态和数值，与上次应用的状态相同时不产生Tcl调用，
+    也不会触发重新计算几何布局。被管理控件的选项都应经过apply修改，否则记录会与控件实际状态不一致。
+    """
+
+    def __init__(self):
+        self._applied: Dict[str, Dict[str, Any]] = {}  # 控件路径 -> {选项: 最近一次应用的值}
+        self.updates = 0  # 实际调用configure的次数
+        self.skipped = 0  # 状态未变化、省略的次数
+        self.updates_per_second = 0.0  # 最近一个统计周期的速率
+        self.skipped_per_second = 0.0
+        self._period_start = time.perf_counter()
+        self._period_updates = 0
+        self._period_skipped = 0
+
+    def apply(self, widget: tk.Misc, **options) -> bool:
+        """把控件协调到给定的选项，只修改与上次不同的选项；返回是否修改了控件"""
+        applied = self._applied.setdefault(str(widget), {})
+        changed = {name: value for name, value in options.items()
+                   if name not in applied or applied[name] != value}
+        if changed:
+            widget.configure(**changed)
+            applied.update(changed)
+            self.updates += 1
+            self._period_updates += 1
+        else:
+            self.skipped += 1
+            self._period_skipped += 1
+        self._update_rates()
+        return bool(changed)
+
+    def forget(self, widget: tk.Misc):
+        """清除控件的记录（控件被绕过本对象修改或重建后调用），下次apply完整应用"""
+        self._applied.pop(str(widget), None)
+
+    def _update_rates(self):
+        """每个统计周期计算一次更新和省略的速率"""
+        elapsed = time.perf_counter() - self._period_start
+        if elapsed < STATS_INTERVAL:
+            return
+        self.updates_per_second = self._period_updates / elapsed
+        self.skipped_per_second = self._period_skipped / elapsed
+        print(f"[GUI-DEBUG] 控件更新: {self.updates_per_second:.1f} 次/秒, "
+              f"省略 {self.skipped_per_second:.1f} 次/秒 (累计更新 {self.updates}, 省略 {self.skipped})")
+        self._period_start += elapsed
+        self._period_updates = 0
+        self._period_skipped = 0